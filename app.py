@@ -1,14 +1,23 @@
 import asyncio
 import os
-import threading
+import signal
+from concurrent.futures import ThreadPoolExecutor
 
 from aiohttp import web
-from slack_bolt.adapter.socket_mode import SocketModeHandler
+from slack_bolt.adapter.socket_mode.aiohttp import AsyncSocketModeHandler
 
 from config import Config
 from controllers.slack_controller import app as slack_app
-from controllers.slack_controller import db_service, google_service, handle_asana_webhook, logger
+from controllers.slack_controller import (
+    assumption_status_buffer,
+    db_service,
+    google_api_executor,
+    google_service,
+    handle_asana_webhook,
+    logger,
+)
 from controllers.web_controller import create_web_app
+from services.http_session import close_session, get_session
 from services.schema_fixer import check_and_update_schema
 
 
@@ -26,16 +35,52 @@ async def run_schema_check() -> None:
     await asyncio.to_thread(check_and_update_schema)
 
 
-if __name__ == "__main__":
-    Config.validate()
+async def main() -> None:
+    # Python 3.12+: run new tasks eagerly until their first await, skipping the
+    # scheduling round trip for the many short-lived tasks Slack events spawn.
+    loop = asyncio.get_running_loop()
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+    # Listeners run on this loop; their blocking DB/AI/Asana/ingestion calls
+    # go through asyncio.to_thread, so give that a fixed, named pool.
+    # asyncio.run shuts it down on exit.
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=Config.WORKER_THREADS, thread_name_prefix="bolt"))
 
     print("🔧 Checking database schema...")
-    asyncio.run(run_schema_check())
+    await run_schema_check()
+
+    # Bolt copies this session into every per-request client it builds.
+    slack_app.client.session = get_session()
+
+    # Container platforms stop us with SIGTERM; treat it like Ctrl-C so the
+    # finally block below closes Socket Mode and flushes pending writes.
+    stop = asyncio.Event()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stop.set)
 
-    if os.environ.get("USE_SOCKET_MODE", "false").lower() == "true":
-        # Start Socket Mode in a background thread so the web server
-        # (health checks, webhooks, OAuth callbacks) remains available.
-        handler = SocketModeHandler(slack_app, Config.SLACK_APP_TOKEN)
-        threading.Thread(target=handler.start, daemon=True).start()
+    # Serve health checks, webhooks and OAuth callbacks on this loop rather
+    # than a second thread + loop.
+    runner = web.AppRunner(create_app())
+    handler = None
+    try:
+        await runner.setup()
+        site = web.TCPSite(runner, Config.HOST, Config.PORT)
+        await site.start()
 
-    web.run_app(create_app(), host=Config.HOST, port=Config.PORT)
+        if os.environ.get("USE_SOCKET_MODE", "false").lower() == "true":
+            handler = AsyncSocketModeHandler(slack_app, Config.SLACK_APP_TOKEN)
+            await handler.connect_async()
+        await stop.wait()
+    finally:
+        if handler is not None:
+            await handler.close_async()
+        await runner.cleanup()
+        await assumption_status_buffer.close()
+        # Drop queued Google calls; nothing is left to receive their results.
+        google_api_executor.shutdown(wait=False, cancel_futures=True)
+        await close_session()
+
+
+if __name__ == "__main__":
+    Config.validate()
+    asyncio.run(main())
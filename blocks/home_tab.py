@@ -28,6 +28,12 @@ def _truncate(text: str) -> str:
     return text[: _MAX_TEXT_LENGTH - 3] + "..."
 
 
+def _truncate_project_name(name: str) -> str:
+    if len(name) <= _MAX_PROJECT_NAME_LENGTH_SLACK_UI:
+        return name
+    return name[: _MAX_PROJECT_NAME_LENGTH_SLACK_UI - 3] + "..."
+
+
 def _safe_button(
     text: str,
     action_id: str,
@@ -46,6 +52,103 @@ def _safe_button(
     return button
 
 
+# Blocks that never vary between renders are built once and shared by every view.
+# Views are only serialised for Slack, so nothing mutates these.
+_DIVIDER = {"type": "divider"}
+_NO_DIAGNOSTIC_PROMPTS_BLOCK = {
+    "type": "context",
+    "elements": [{"type": "mrkdwn", "text": "_No diagnostic prompts available._"}],
+}
+_NO_ROADMAP_ASSUMPTIONS_BLOCK = {
+    "type": "context",
+    "elements": [{"type": "mrkdwn", "text": "_No roadmap assumptions yet._"}],
+}
+_NEW_PROJECT_BUTTON = _safe_button("➕ New Project", "open_new_project_modal", style="primary")
+_NO_PROJECT_ACTIONS_BLOCK = {"type": "actions", "elements": [_NEW_PROJECT_BUTTON]}
+_PROJECT_ACTIONS_BLOCK = {
+    "type": "actions",
+    "elements": [
+        _NEW_PROJECT_BUTTON,
+        _safe_button("🔗 Link Channel", "open_link_channel"),
+        _safe_button("📅 Generate Meeting Agenda", "generate_meeting_agenda"),
+        _safe_button("📄 Export Strategy Doc", "export_strategy_doc"),
+    ],
+}
+_NO_ACTIVE_PROJECT_BLOCK = {"type": "section", "text": {"type": "mrkdwn", "text": "*Active Project:* _None selected_"}}
+_SELECT_PROJECT_PROMPT_BLOCK = {
+    "type": "section",
+    "text": {"type": "mrkdwn", "text": "Select a project to begin the Audit → Plan → Action journey."},
+}
+_AUDIT_ACTIONS_BLOCK = {
+    "type": "actions",
+    "elements": [
+        _safe_button("📝 Run Diagnostic", "action_open_diagnostic", style="primary"),
+        _safe_button("✨ Auto-Fill with AI", "auto_fill_from_evidence"),
+        _safe_button("➕ Add Assumption", "open_add_assumption"),
+        _safe_button("🔄 Refresh", "refresh_home"),
+    ],
+}
+_PLAN_INTRO_BLOCKS = (
+    {
+        "type": "context",
+        "elements": [
+            {
+                "type": "mrkdwn",
+                "text": "*Iterative Scaling Roadmap* · Move assumptions across horizons.",
+            }
+        ],
+    },
+    {
+        "type": "actions",
+        "elements": [
+            _safe_button("➕ Add Assumption", "open_add_assumption"),
+            _safe_button("🔄 Refresh", "refresh_home"),
+        ],
+    },
+    _DIVIDER,
+)
+_ACTION_INTRO_BLOCKS = (
+    {
+        "type": "context",
+        "elements": [
+            {
+                "type": "mrkdwn",
+                "text": "*Test & Learn Playbook* · Execute experiments aligned to your roadmap.",
+            }
+        ],
+    },
+    {
+        "type": "actions",
+        "elements": [
+            _safe_button("🧪 Log Experiment", "open_create_experiment_modal", style="primary"),
+            _safe_button("📖 View Playbook Methods", "view_playbook_methods"),
+            _safe_button("🔄 Refresh", "refresh_home"),
+        ],
+    },
+    _DIVIDER,
+)
+_ACTION_METHODOLOGY_BLOCKS = (
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": "_Methodology map: Define → Shape Systems → Develop → Test & Learn → Scale._",
+        },
+    },
+    _DIVIDER,
+    {"type": "section", "text": {"type": "mrkdwn", "text": "*Assumptions ready for action*"}},
+)
+_EVIDENCE_HEADER_BLOCK = {"type": "section", "text": {"type": "mrkdwn", "text": "*📂 Project Context & Evidence*"}}
+_EVIDENCE_AUTO_FILL_BLOCK = {
+    "type": "actions",
+    "elements": [_safe_button("✨ Auto-Fill from Evidence", "auto_fill_from_evidence", style="primary")],
+}
+_NO_CONNECTED_FILES_BLOCK = {
+    "type": "context",
+    "elements": [{"type": "mrkdwn", "text": "_No connected files yet._"}],
+}
+
+
 def _parse_datetime(value: str | None) -> datetime | None:
     if not value:
         return None
@@ -73,12 +176,16 @@ def _confidence_label(confidence: int | None) -> tuple[str, bool]:
     return stars, is_low
 
 
-def _assumption_section(assumption: dict[str, Any], highlight_low_confidence: bool = False) -> dict[str, Any]:
+def _assumption_section(
+    assumption: dict[str, Any],
+    stale_cutoff: datetime,
+    highlight_low_confidence: bool = False,
+) -> dict[str, Any]:
     status = assumption.get("status") or assumption.get("validation_status") or "Testing"
-    last_tested = _parse_datetime(assumption.get("last_tested_at")) or _parse_datetime(assumption.get("updated_at"))
     is_stale = False
-    if status == "Testing" and last_tested:
-        is_stale = last_tested < datetime.now(timezone.utc) - timedelta(days=_STALE_ASSUMPTION_THRESHOLD_DAYS)
+    if status == "Testing":
+        last_tested = _parse_datetime(assumption.get("last_tested_at")) or _parse_datetime(assumption.get("updated_at"))
+        is_stale = last_tested is not None and last_tested < stale_cutoff
     emoji = _status_emoji(status, is_stale)
     confidence = assumption.get("confidence_score")
     confidence_text, low_confidence = _confidence_label(confidence)
@@ -132,8 +239,18 @@ def _plan_assumption_section(assumption: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def _action_assumption_blocks(assumption: dict[str, Any]) -> list[dict[str, Any]]:
-    section = _assumption_section(assumption)
+def _connected_file_section(file_item: dict[str, Any]) -> dict[str, Any]:
+    name = _truncate(file_item.get("name", "Untitled file"))
+    emoji = "📊" if "spreadsheet" in file_item.get("mime_type", "") else "📄"
+    return {
+        "type": "section",
+        "text": {"type": "mrkdwn", "text": f"{emoji} {name}"},
+        "accessory": _safe_button("Remove", "remove_drive_file", value=file_item.get("id")),
+    }
+
+
+def _action_assumption_blocks(assumption: dict[str, Any], stale_cutoff: datetime) -> list[dict[str, Any]]:
+    section = _assumption_section(assumption, stale_cutoff)
     section.pop("accessory", None)
     return [
         section,
@@ -148,6 +265,7 @@ def _action_assumption_blocks(assumption: dict[str, Any]) -> list[dict[str, Any]
                 )
             ],
         },
+        _DIVIDER,
     ]
 
 
@@ -176,12 +294,6 @@ def _normalize_label(value: str | None) -> str:
     return (value or "").strip().lower()
 
 
-def _assumption_matches(assumption: dict[str, Any], pillar: str, sub_category: str) -> bool:
-    return _normalize_label(assumption.get("category")) == _normalize_label(pillar) and _normalize_label(
-        assumption.get("sub_category")
-    ) == _normalize_label(sub_category)
-
-
 def _diagnostic_key(pillar: str, sub_category: str, question: str) -> tuple[str, str, str]:
     return (_normalize_label(pillar), _normalize_label(sub_category), normalize_question_text(question))
 
@@ -225,12 +337,7 @@ def _get_audit_view(
             )
             questions = sub_data if isinstance(sub_data, list) else sub_data.get("questions", [])
             if not questions:
-                blocks.append(
-                    {
-                        "type": "context",
-                        "elements": [{"type": "mrkdwn", "text": "_No diagnostic prompts available._"}],
-                    }
-                )
+                blocks.append(_NO_DIAGNOSTIC_PROMPTS_BLOCK)
                 continue
             for question in questions:
                 lookup_key = _diagnostic_key(pillar_key, sub_category, question)
@@ -256,7 +363,7 @@ def _get_audit_view(
                         ),
                     }
                 )
-            blocks.append({"type": "divider"})
+            blocks.append(_DIVIDER)
 
 
 def _render_framework_sections(
@@ -269,6 +376,11 @@ def _render_framework_sections(
 ) -> None:
     horizon_order = [item["key"] for item in roadmap_horizons]
     horizon_labels = {item["key"]: item["label"] for item in roadmap_horizons}
+    # One pass over the assumptions instead of rescanning them for every sub-category.
+    assumptions_by_section: dict[tuple[str, str], list[dict[str, Any]]] = {}
+    for assumption in assumptions:
+        section_key = (_normalize_label(assumption.get("category")), _normalize_label(assumption.get("sub_category")))
+        assumptions_by_section.setdefault(section_key, []).append(assumption)
     for pillar_key, pillar_data in framework.items():
         blocks.append(
             {
@@ -301,9 +413,9 @@ def _render_framework_sections(
                         "elements": [{"type": "mrkdwn", "text": plan_snippet}],
                     }
                 )
-            matching_assumptions = [
-                assumption for assumption in assumptions if _assumption_matches(assumption, pillar_key, sub_category)
-            ]
+            matching_assumptions = assumptions_by_section.get(
+                (_normalize_label(pillar_key), _normalize_label(sub_category)), []
+            )
             grouped: dict[str, list[dict[str, Any]]] = {key: [] for key in horizon_order}
             for assumption in matching_assumptions:
                 horizon = _normalize_label(assumption.get("horizon") or assumption.get("lane") or "now")
@@ -322,15 +434,9 @@ def _render_framework_sections(
                             "elements": [{"type": "mrkdwn", "text": f"*{label}*"}],
                         }
                     )
-                    for assumption in items:
-                        blocks.append(_plan_assumption_section(assumption))
+                    blocks.extend([_plan_assumption_section(assumption) for assumption in items])
             else:
-                blocks.append(
-                    {
-                        "type": "context",
-                        "elements": [{"type": "mrkdwn", "text": "_No roadmap assumptions yet._"}],
-                    }
-                )
+                blocks.append(_NO_ROADMAP_ASSUMPTIONS_BLOCK)
             if not matching_assumptions:
                 questions = sub_data if isinstance(sub_data, list) else sub_data.get("questions", [])
                 prompt_text = "\n".join(questions) if questions else "No diagnostic prompts available."
@@ -340,7 +446,7 @@ def _render_framework_sections(
                         "elements": [{"type": "mrkdwn", "text": f"_Diagnostic prompts:_\n{prompt_text}"}],
                     }
                 )
-            blocks.append({"type": "divider"})
+            blocks.append(_DIVIDER)
 
 
 def _get_current_phase(assumptions: list[dict[str, Any]]) -> str:
@@ -386,6 +492,9 @@ def _build_phase_stepper(flow_stage: str) -> dict[str, Any]:
     }
 
 
+_PHASE_STEPPERS = {flow_stage: _build_phase_stepper(flow_stage) for flow_stage in _FLOW_STAGE_LABELS}
+
+
 def get_home_view(
     user_id: str,
     project: dict[str, Any] | None,
@@ -408,51 +517,42 @@ def get_home_view(
     flow_label = _FLOW_STAGE_LABELS.get(flow_stage, "Audit")
 
     all_projects = all_projects or []
-    if project and not any(item.get("id") == project.get("id") for item in all_projects):
-        all_projects = [*all_projects, {"name": project["name"], "id": project["id"]}]
-    if all_projects:
+    if project or all_projects:
         project_options = [
             {
-                "text": {
-                    "type": "plain_text",
-                    "text": (
-                        item["name"][: _MAX_PROJECT_NAME_LENGTH_SLACK_UI - 3] + "..."
-                        if len(item["name"]) > _MAX_PROJECT_NAME_LENGTH_SLACK_UI
-                        else item["name"]
-                    ),
-                },
+                "text": {"type": "plain_text", "text": _truncate_project_name(item["name"])},
                 "value": str(item["id"]),
             }
             for item in all_projects
         ]
-        initial_option = next(
-            (option for option in project_options if option["value"] == str(project["id"])),
-            None,
-        )
+        project_select: dict[str, Any] = {
+            "type": "static_select",
+            "placeholder": {"type": "plain_text", "text": "Select Project"},
+            "options": project_options,
+            "action_id": "select_active_project",
+        }
+        if project:
+            # One scan finds the active option; add it if the project list doesn't include it.
+            active_value = str(project["id"])
+            initial_option = next((option for option in project_options if option["value"] == active_value), None)
+            if initial_option is None:
+                initial_option = {
+                    "text": {"type": "plain_text", "text": _truncate_project_name(project["name"])},
+                    "value": active_value,
+                }
+                project_options.append(initial_option)
+            project_select["initial_option"] = initial_option
         blocks.append(
             {
                 "type": "section",
                 "text": {"type": "mrkdwn", "text": "*Active Project:*"},
-                "accessory": {
-                    "type": "static_select",
-                    "placeholder": {"type": "plain_text", "text": "Select Project"},
-                    "options": project_options,
-                    "initial_option": initial_option,
-                    "action_id": "select_active_project",
-                },
+                "accessory": project_select,
             }
         )
     else:
-        blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": "*Active Project:* _None selected_"}})
+        blocks.append(_NO_ACTIVE_PROJECT_BLOCK)
 
-    action_elements = [
-        _safe_button("➕ New Project", "open_new_project_modal", style="primary"),
-    ]
-    if project:
-        action_elements.append(_safe_button("🔗 Link Channel", "open_link_channel"))
-        action_elements.append(_safe_button("📅 Generate Meeting Agenda", "generate_meeting_agenda"))
-        action_elements.append(_safe_button("📄 Export Strategy Doc", "export_strategy_doc"))
-    blocks.append({"type": "actions", "elements": action_elements})
+    blocks.append(_PROJECT_ACTIONS_BLOCK if project else _NO_PROJECT_ACTIONS_BLOCK)
 
     if project:
         blocks.append(
@@ -477,19 +577,14 @@ def get_home_view(
         )
 
     if not project:
-        blocks.append({"type": "divider"})
-        blocks.append(
-            {
-                "type": "section",
-                "text": {"type": "mrkdwn", "text": "Select a project to begin the Audit → Plan → Action journey."},
-            }
-        )
+        blocks.append(_DIVIDER)
+        blocks.append(_SELECT_PROJECT_PROMPT_BLOCK)
         return {"type": "home", "blocks": blocks}
 
     blocks.extend(
         [
-            {"type": "divider"},
-            _build_phase_stepper(flow_stage),
+            _DIVIDER,
+            _PHASE_STEPPERS.get(flow_stage) or _build_phase_stepper(flow_stage),
             {
                 "type": "header",
                 "text": {"type": "plain_text", "text": f"{project.get('name', 'Project')} · {flow_label}"},
@@ -509,16 +604,8 @@ def get_home_view(
                         }
                     ],
                 },
-                {
-                    "type": "actions",
-                    "elements": [
-                        _safe_button("📝 Run Diagnostic", "action_open_diagnostic", style="primary"),
-                        _safe_button("✨ Auto-Fill with AI", "auto_fill_from_evidence"),
-                        _safe_button("➕ Add Assumption", "open_add_assumption"),
-                        _safe_button("🔄 Refresh", "refresh_home"),
-                    ],
-                },
-                {"type": "divider"},
+                _AUDIT_ACTIONS_BLOCK,
+                _DIVIDER,
             ]
         )
 
@@ -530,27 +617,7 @@ def get_home_view(
         )
 
     elif flow_stage == "plan":
-        blocks.extend(
-            [
-                {
-                    "type": "context",
-                    "elements": [
-                        {
-                            "type": "mrkdwn",
-                            "text": "*Iterative Scaling Roadmap* · Move assumptions across horizons.",
-                        }
-                    ],
-                },
-                {
-                    "type": "actions",
-                    "elements": [
-                        _safe_button("➕ Add Assumption", "open_add_assumption"),
-                        _safe_button("🔄 Refresh", "refresh_home"),
-                    ],
-                },
-                {"type": "divider"},
-            ]
-        )
+        blocks.extend(_PLAN_INTRO_BLOCKS)
         if plan_suggestion:
             blocks.append(
                 {
@@ -558,7 +625,7 @@ def get_home_view(
                     "elements": [{"type": "mrkdwn", "text": plan_suggestion}],
                 }
             )
-            blocks.append({"type": "divider"})
+            blocks.append(_DIVIDER)
 
         framework = playbook_service.get_5_pillar_framework()
         roadmap_horizons = playbook_service.get_roadmap_horizons()
@@ -589,26 +656,9 @@ def get_home_view(
             1,
         )
 
+        blocks.extend(_ACTION_INTRO_BLOCKS)
         blocks.extend(
             [
-                {
-                    "type": "context",
-                    "elements": [
-                        {
-                            "type": "mrkdwn",
-                            "text": "*Test & Learn Playbook* · Execute experiments aligned to your roadmap.",
-                        }
-                    ],
-                },
-                {
-                    "type": "actions",
-                    "elements": [
-                        _safe_button("🧪 Log Experiment", "open_create_experiment_modal", style="primary"),
-                        _safe_button("📖 View Playbook Methods", "view_playbook_methods"),
-                        _safe_button("🔄 Refresh", "refresh_home"),
-                    ],
-                },
-                {"type": "divider"},
                 {
                     "type": "section",
                     "text": {
@@ -623,50 +673,22 @@ def get_home_view(
                         "text": f"*{phase['label']}* — {phase['title']}\n*Key Team Activities*\n{activities_text}",
                     },
                 },
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": "_Methodology map: Define → Shape Systems → Develop → Test & Learn → Scale._",
-                    },
-                },
-                {"type": "divider"},
-                {"type": "section", "text": {"type": "mrkdwn", "text": "*Assumptions ready for action*"}},
             ]
         )
+        blocks.extend(_ACTION_METHODOLOGY_BLOCKS)
+        stale_cutoff = datetime.now(timezone.utc) - timedelta(days=_STALE_ASSUMPTION_THRESHOLD_DAYS)
         for assumption in assumptions:
-            blocks.extend(_action_assumption_blocks(assumption))
-            blocks.append({"type": "divider"})
+            blocks.extend(_action_assumption_blocks(assumption, stale_cutoff))
 
     integrations = project.get("integrations") or {}
     drive_info = integrations.get("drive") or {}
     connected_files = drive_info.get("files") or []
 
-    blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": "*📂 Project Context & Evidence*"}})
+    blocks.append(_EVIDENCE_HEADER_BLOCK)
     if connected_files:
-        for file_item in connected_files:
-            name = _truncate(file_item.get("name", "Untitled file"))
-            mime_type = file_item.get("mime_type", "")
-            emoji = "📊" if "spreadsheet" in mime_type else "📄"
-            blocks.append(
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": f"{emoji} {name}"},
-                    "accessory": _safe_button("Remove", "remove_drive_file", value=file_item.get("id")),
-                }
-            )
-        blocks.append(
-            {
-                "type": "actions",
-                "elements": [_safe_button("✨ Auto-Fill from Evidence", "auto_fill_from_evidence", style="primary")],
-            }
-        )
+        blocks.extend([_connected_file_section(file_item) for file_item in connected_files])
+        blocks.append(_EVIDENCE_AUTO_FILL_BLOCK)
     else:
-        blocks.append(
-            {
-                "type": "context",
-                "elements": [{"type": "mrkdwn", "text": "_No connected files yet._"}],
-            }
-        )
+        blocks.append(_NO_CONNECTED_FILES_BLOCK)
 
     return {"type": "home", "blocks": blocks}
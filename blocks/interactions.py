@@ -1,8 +1,14 @@
+from functools import lru_cache
+
 from services import knowledge_base
 
 
+@lru_cache(maxsize=16)
 def get_loading_block(status_text: str) -> list:
-    """Creates a lightweight loading indicator to give a pseudo-animation effect."""
+    """Creates a lightweight loading indicator to give a pseudo-animation effect.
+
+    Cached per status; callers must not mutate the result.
+    """
     return [
         {
             "type": "context",
@@ -100,23 +106,27 @@ def get_ai_summary_block(analysis: dict) -> list:
     return blocks
 
 
+_DECISION_ROOM_HEADER = {
+    "type": "header",
+    "text": {"type": "plain_text", "text": "🗳️ Decision Room"},
+}
+_DECISION_ROOM_WAITING_SECTION = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "Invite the team to score impact and uncertainty. Votes stay hidden until everyone responds.",
+    },
+}
+
+
 def get_decision_room_blocks(session_id: str, status: str, results: dict | None = None) -> list:
     """Builds dynamic blocks for the Decision Room session."""
-    header = {
-        "type": "header",
-        "text": {"type": "plain_text", "text": "🗳️ Decision Room"},
-    }
+    header = _DECISION_ROOM_HEADER
 
     if status == "waiting":
         return [
             header,
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "Invite the team to score impact and uncertainty. Votes stay hidden until everyone responds.",
-                },
-            },
+            _DECISION_ROOM_WAITING_SECTION,
             {
                 "type": "actions",
                 "elements": [
@@ -250,8 +260,9 @@ def decision_heatmap_label(avg_impact: float, avg_uncertainty: float) -> str:
     return "Lower Impact / Lower Uncertainty → Schedule later"
 
 
+@lru_cache(maxsize=16)
 def error_block(message: str) -> list:
-    """User-friendly error banner."""
+    """User-friendly error banner. Cached per message; callers must not mutate the result."""
     return [
         {
             "type": "section",
@@ -274,7 +285,9 @@ def method_card(method: str) -> dict:
     }
 
 
+@lru_cache(maxsize=64)
 def case_study_modal(method: str) -> dict:
+    """Case study modal for a method. Cached; callers must not mutate the result."""
     description = knowledge_base.get_case_study(method) or "Case study coming soon."
     return {
         "type": "modal",
@@ -1,11 +1,14 @@
 """Block Kit layouts for methods and case studies."""
 
+from functools import lru_cache
 from typing import List
 
 from services import knowledge_base
 
 
+@lru_cache(maxsize=32)
 def method_cards(stage: str) -> List[dict]:
+    """Cards for a stage's toolkit. Cached; callers must not mutate the result."""
     methods = knowledge_base.get_stage_methods(stage)
     description = knowledge_base.get_stage_description(stage)
     blocks: List[dict] = [
@@ -1,4 +1,6 @@
 import json
+from functools import lru_cache
+
 from utils.diagnostic_utils import normalize_question_text, slugify
 
 
@@ -614,8 +616,9 @@ def extract_insights_modal() -> dict:
     }
 
 
+@lru_cache(maxsize=1)
 def get_loading_modal() -> dict:
-    """Returns a temporary modal to show while AI is processing."""
+    """Returns a temporary modal to show while AI is processing. Shared; callers must not mutate it."""
     return {
         "type": "modal",
         "callback_id": "loading_modal",
@@ -9,6 +9,17 @@ class UIManager:
         (2, "Moderate 🟢"),
         (0, "Low 🟠"),
     )
+    _ASSUMPTION_CATEGORY_OPTIONS = tuple(
+        {"text": {"type": "plain_text", "text": label}, "value": label}
+        for label in ("Opportunity", "Capability", "Progress")
+    )
+    _ASSUMPTION_LANE_OPTIONS = tuple(
+        {"text": {"type": "plain_text", "text": label}, "value": label} for label in ("Now", "Next", "Later")
+    )
+    _ASSUMPTION_STATUS_OPTIONS = tuple(
+        {"text": {"type": "plain_text", "text": label}, "value": label}
+        for label in ("Testing", "Validated", "Rejected")
+    )
 
     @staticmethod
     def _safe_button(
@@ -954,25 +965,13 @@ class UIManager:
         initial_values: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         initial_values = initial_values or {}
-        category_options = [
-            {"text": {"type": "plain_text", "text": "Opportunity"}, "value": "Opportunity"},
-            {"text": {"type": "plain_text", "text": "Capability"}, "value": "Capability"},
-            {"text": {"type": "plain_text", "text": "Progress"}, "value": "Progress"},
-        ]
+        category_options = list(UIManager._ASSUMPTION_CATEGORY_OPTIONS)
         initial_category = next(
             (option for option in category_options if option["value"] == selected_category),
             category_options[0],
         )
-        lane_options = [
-            {"text": {"type": "plain_text", "text": "Now"}, "value": "Now"},
-            {"text": {"type": "plain_text", "text": "Next"}, "value": "Next"},
-            {"text": {"type": "plain_text", "text": "Later"}, "value": "Later"},
-        ]
-        status_options = [
-            {"text": {"type": "plain_text", "text": "Testing"}, "value": "Testing"},
-            {"text": {"type": "plain_text", "text": "Validated"}, "value": "Validated"},
-            {"text": {"type": "plain_text", "text": "Rejected"}, "value": "Rejected"},
-        ]
+        lane_options = list(UIManager._ASSUMPTION_LANE_OPTIONS)
+        status_options = list(UIManager._ASSUMPTION_STATUS_OPTIONS)
         initial_lane = next(
             (option for option in lane_options if option["value"] == initial_values.get("lane")),
             None,
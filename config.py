@@ -64,6 +64,8 @@ class Config:
     PORT = int(os.environ.get("PORT", 3000))
     OAUTH_PORT = int(os.environ.get("OAUTH_PORT", 10001))
     HOST = os.environ.get("HOST", "0.0.0.0")
+    # Size of the event loop's default executor, which runs blocking DB/AI calls.
+    WORKER_THREADS = int(os.environ.get("WORKER_THREADS", 32))
     LEADERSHIP_CHANNEL = os.environ.get("LEADERSHIP_CHANNEL", "#leadership-updates")
     STANDUP_ENABLED = os.environ.get("STANDUP_ENABLED", "false").lower() == "true"
     STANDUP_HOUR = int(os.environ.get("STANDUP_HOUR", 9))
@@ -1,11 +1,13 @@
+import asyncio
+import copy
+import csv
 import io
 import json
 import logging
 import os
 import re
-import threading
-import time
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial, wraps
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -13,13 +15,11 @@ from urllib import error as url_error
 from urllib import request as url_request
 from aiohttp import web
 from apscheduler.schedulers.background import BackgroundScheduler
-import pandas as pd
 import requests
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from slack_bolt import App
-from slack_bolt.adapter.socket_mode import SocketModeHandler
-from slack_bolt.workflows.step import WorkflowStep
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.workflows.step.async_step import AsyncWorkflowStep
+from slack_sdk import WebClient
+from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 
 from blocks.home_tab import get_home_view
@@ -68,7 +68,8 @@ from blocks.methods_ui import method_cards
 from config import Config
 from config_manager import ConfigManager
 from services import knowledge_base
-from services.ai_service import AiService, EvidenceAI
+from services.ttl_cache import InFlightCalls, TTLCache, content_key
+from services.ai_service import RECOMMEND_METHODS_FALLBACK, AiService, EvidenceAI
 from services.db_service import DbService, engine
 from services.decision_service import DecisionRoomService
 from services.backup_service import BackupService
@@ -84,6 +85,7 @@ from services.report_service import ReportService
 from services.sync_service import TwoWaySyncService
 from services.scheduler_service import start_scheduler
 from services.toolkit_service import ToolkitService
+from services.write_buffer import AssumptionStatusBuffer
 from utils.diagnostic_utils import normalize_question_text
 
 
@@ -95,10 +97,20 @@ CHANNEL_PREFIX = "evidently-"
 ADMIN_USER_ID = os.environ.get("ADMIN_USER")
 UNCERTAINTY_HORIZON_NOW_THRESHOLD = 4
 UNCERTAINTY_HORIZON_LATER_THRESHOLD = 2
+# Anchored, non-capturing: Bolt only needs a yes/no on the action_id prefix.
+NAV_ACTION_PATTERN = re.compile(r"^(?:nav|tab)_")
+# Vote modal private_metadata: "<session_id>:<assumption_id>" and "<assumption_id>:<channel_id>".
+SILENT_SCORE_METADATA_PATTERN = re.compile(r"(\d+):(\d+)")
+DECISION_VOTE_METADATA_PATTERN = re.compile(r"(\d+):(\S+)")
+MESSAGE_LINK_PATTERN = re.compile(r"/archives/(?P<channel>[A-Z0-9]+)/p(?P<seconds>\d+)(?P<micros>\d{6})")
+CHANNEL_NAME_INVALID_CHARS = re.compile(r"[^a-z0-9-_]")
 
 ConfigManager().validate()
 
-app = App(token=Config.SLACK_BOT_TOKEN, signing_secret=Config.SLACK_SIGNING_SECRET)
+app = AsyncApp(token=Config.SLACK_BOT_TOKEN, signing_secret=Config.SLACK_SIGNING_SECRET)
+# Scheduled jobs run on APScheduler worker threads, outside the event loop,
+# so they post through a synchronous client.
+scheduler_client = WebClient(token=Config.SLACK_BOT_TOKEN)
 ai_service = EvidenceAI()
 ai_extractor = AiService()
 db_service = DbService()
@@ -109,6 +121,33 @@ toolkit_service = ToolkitService()
 ingestion_service = IngestionService(db_service=db_service)
 sync_service = TwoWaySyncService()
 messenger_service = MessengerService(app.client)
+thread_analysis_cache = TTLCache(maxsize=1024, ttl=3600)
+# Collapses concurrent identical requests (e.g. double clicks); asking again later gets a fresh set.
+experiment_suggestion_calls = InFlightCalls()
+# Views carry time-based stale badges their inputs don't capture, so both Home caches expire
+# quickly enough for those badges to refresh.
+HOME_VIEW_TTL_SECONDS = 30
+# Keyed by the view's inputs, so any data change misses; the TTL only bounds time-based badges.
+home_view_cache = TTLCache(maxsize=512, ttl=HOME_VIEW_TTL_SECONDS)
+# user_id -> content key of the dashboard last published to that user's Home tab.
+published_home_views = TTLCache(maxsize=4096, ttl=HOME_VIEW_TTL_SECONDS)
+
+
+async def _report_lost_status_updates(failed_by_user: dict[str, list[int]]) -> None:
+    """DM users whose confirmed status changes could not be saved after retries."""
+    for user_id, assumption_ids in failed_by_user.items():
+        ids_text = ", ".join(str(assumption_id) for assumption_id in sorted(assumption_ids))
+        try:
+            await app.client.chat_postMessage(
+                channel=user_id,
+                text=f"⚠️ I couldn't save the status change for assumption {ids_text}. Please try again.",
+            )
+        except Exception:  # noqa: BLE001
+            logger.error("Failed to report lost status updates to %s", user_id, exc_info=True)
+
+
+# Nudge/DM status clicks don't re-read the assumption, so their writes can be batched.
+assumption_status_buffer = AssumptionStatusBuffer(db_service, on_give_up=_report_lost_status_updates)
 backup_service = BackupService()
 google_service = GoogleService()
 report_service = ReportService(ai_service, db_service)
@@ -122,9 +161,9 @@ except Exception:  # noqa: BLE001
 # --- WORKFLOW STEP: LOG EVIDENCE ---
 
 # --- 1. Define the Workflow Functions First ---
-def edit_log_evidence(ack, step, configure):  # noqa: ANN001
-    ack()
-    configure(
+async def edit_log_evidence(ack, step, configure):  # noqa: ANN001
+    await ack()
+    await configure(
         blocks=[
             {
                 "type": "input",
@@ -153,13 +192,13 @@ def edit_log_evidence(ack, step, configure):  # noqa: ANN001
     )
 
 
-def save_log_evidence(ack, view, update):  # noqa: ANN001
-    ack()
+async def save_log_evidence(ack, view, update):  # noqa: ANN001
+    await ack()
     values = view["state"]["values"]
     project_name = values["project_block"]["project_name"]["value"]
     evidence_text = values["evidence_block"]["evidence_text"]["value"]
 
-    update(
+    await update(
         inputs={
             "project_name": {"value": project_name},
             "evidence_text": {"value": evidence_text},
@@ -167,26 +206,26 @@ def save_log_evidence(ack, view, update):  # noqa: ANN001
     )
 
 
-def execute_log_evidence(step, complete, fail):  # noqa: ANN001
+async def execute_log_evidence(step, complete, fail):  # noqa: ANN001
     inputs = step["inputs"]
     project_name = inputs.get("project_name", {}).get("value")
     evidence_text = inputs.get("evidence_text", {}).get("value")
 
     try:
-        project_id = db_service.find_project_by_fuzzy_name(project_name)
+        project_id = await run_db(db_service.find_project_by_fuzzy_name, project_name)
         if not project_id:
-            fail(error={"message": f"Project not found for name: {project_name}"})
+            await fail(error={"message": f"Project not found for name: {project_name}"})
             return
-        db_service.add_canvas_item(project_id, section="Progress", text=evidence_text or "")
-        complete(outputs={"status": "success"})
+        await run_db(db_service.add_canvas_item, project_id, section="Progress", text=evidence_text or "")
+        await complete(outputs={"status": "success"})
 
     except Exception as exc:  # noqa: BLE001
-        fail(error={"message": str(exc)})
+        await fail(error={"message": str(exc)})
 
 
 # --- 2. Register the Step with All Listeners ---
 # This prevents the "listener is required" error
-ws = WorkflowStep(
+ws = AsyncWorkflowStep(
     callback_id="log_evidence",
     edit=edit_log_evidence,
     save=save_log_evidence,
@@ -195,10 +234,11 @@ ws = WorkflowStep(
 
 app.step(ws)
 
+# Bookmark (title, emoji) per channel tab template.
 CHANNEL_TAB_TEMPLATES = {
-    "experiments": {"title": "Experiments", "emoji": "🧪"},
-    "manual": {"title": "Manual", "emoji": "📘"},
-    "decisions": {"title": "Decisions", "emoji": "🗳️"},
+    "experiments": ("Experiments", "🧪"),
+    "manual": ("Manual", "📘"),
+    "decisions": ("Decisions", "🗳️"),
 }
 
 
@@ -283,9 +323,46 @@ def get_ask_blocks(method_name, formatted_questions):
     ]
 
 
+_background_tasks: set[asyncio.Task] = set()
+# Google client libraries are blocking; a dedicated, bounded pool keeps them off the
+# event loop without letting a burst of exports exhaust the default executor or API quota.
+google_api_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="gapi")
+
+
 def run_in_background(target, *args, **kwargs) -> None:
-    thread = threading.Thread(target=target, args=args, kwargs=kwargs, daemon=True)
-    thread.start()
+    task = asyncio.create_task(target(*args, **kwargs))
+    # Hold a reference so the task is not garbage collected mid-flight.
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def run_google_call(func, *args, **kwargs) -> Any:
+    """Run a blocking Google API call on the Google executor."""
+    return await asyncio.get_running_loop().run_in_executor(google_api_executor, partial(func, *args, **kwargs))
+
+
+async def run_db(func, *args, **kwargs) -> Any:
+    """Run a blocking DbService call in a worker thread so the query's round trip doesn't stall the loop."""
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+
+async def analyze_thread_cached(conversation_text: str, attachments: list[dict] | None = None) -> dict:
+    """Run analyze_thread_structured, reusing the result for an unchanged thread."""
+    analysis = await thread_analysis_cache.get_or_compute(
+        content_key(conversation_text, attachments),
+        lambda: ai_service.analyze_thread_structured(conversation_text, attachments),
+        should_cache=lambda result: not result.get("error"),
+    )
+    # Callers add and edit nested keys (e.g. assumption lists); keep the cached copy untouched.
+    return copy.deepcopy(analysis)
+
+
+async def generate_experiment_suggestions_shared(assumption_text: str) -> str:
+    """Run generate_experiment_suggestions, sharing one call between concurrent identical requests."""
+    return await experiment_suggestion_calls.call(
+        content_key(assumption_text),
+        lambda: ai_service.generate_experiment_suggestions(assumption_text),
+    )
 
 
 def download_private_file(url: str) -> bytes | None:
@@ -324,20 +401,20 @@ async def handle_asana_webhook(request: web.Request) -> web.Response:
         if completed_value is not True:
             continue
 
-        experiment = db_service.get_experiment_by_asana_task_id(task_id)
+        experiment = await run_db(db_service.get_experiment_by_asana_task_id, task_id)
         if not experiment:
             continue
         decision = sync_service.resolve_status_conflict(experiment.get("status", ""), True)
-        project = db_service.get_project(experiment["project_id"])
+        project = await run_db(db_service.get_project, experiment["project_id"])
         if decision["action"] == "update_experiment":
-            db_service.update_experiment(experiment["id"], status="Completed")
+            await run_db(db_service.update_experiment, experiment["id"], status="Completed")
             if project and project.get("channel_id"):
-                messenger_service.post_message(
+                await messenger_service.post_message(
                     channel=project["channel_id"],
                     text="✅ Task completed in Asana -> Experiment marked as Done in Slack.",
                 )
         elif decision["action"] == "conflict" and project and project.get("channel_id"):
-            messenger_service.post_message(
+            await messenger_service.post_message(
                 channel=project["channel_id"],
                 text=f"⚠️ Sync conflict: {decision['message']}",
             )
@@ -345,27 +422,63 @@ async def handle_asana_webhook(request: web.Request) -> web.Response:
     return web.json_response({"ok": True})
 
 
-def run_thread_analysis(client, channel_id: str, thread_ts: str, logger):  # noqa: ANN001
-    loading_msg = client.chat_postMessage(
-        channel=channel_id,
-        blocks=get_loading_block("Analysing thread context..."),
-        thread_ts=thread_ts,
-        text="Analysing thread context...",
-    )
-    stop_animation = threading.Event()
+# Join/leave notices carry no discussion content; keep them out of the AI prompt.
+_SYSTEM_MESSAGE_SUBTYPES = frozenset({"channel_join", "channel_leave"})
 
-    def animate_loading() -> None:
+
+async def collect_thread(client, channel_id: str, thread_ts: str) -> tuple[list[dict], str, list[dict]]:  # noqa: ANN001
+    """Page through a thread's replies, returning (messages, transcript, attachments) in one pass."""
+    messages: list[dict] = []
+    lines: list[str] = []
+    attachments: list[dict] = []
+    cursor = None
+    while True:
+        page = await client.conversations_replies(channel=channel_id, ts=thread_ts, cursor=cursor)
+        for message in page.get("messages", []):
+            if message.get("subtype") in _SYSTEM_MESSAGE_SUBTYPES:
+                continue
+            messages.append(message)
+            lines.append(f"{message.get('user', 'User')}: {message.get('text')}")
+            for file in message.get("files") or ():
+                attachments.append({"name": file.get("name"), "mimetype": file.get("mimetype")})
+        cursor = (page.get("response_metadata") or {}).get("next_cursor")
+        if not cursor:
+            break
+    return messages, "\n".join(lines), attachments
+
+
+async def run_thread_analysis(client, channel_id: str, thread_ts: str, logger):  # noqa: ANN001
+    # Fetch the thread while the loading message is being posted; errors surface in run_analysis.
+    history_task = asyncio.create_task(collect_thread(client, channel_id, thread_ts))
+    try:
+        loading_msg = await client.chat_postMessage(
+            channel=channel_id,
+            blocks=get_loading_block("Analysing thread context..."),
+            thread_ts=thread_ts,
+            text="Analysing thread context...",
+        )
+    except Exception:
+        history_task.cancel()
+        raise
+    stop_animation = asyncio.Event()
+
+    async def animate_loading() -> None:
         statuses = [
             "Reading thread history... 📖",
             "Extracting hypotheses... 🧠",
             "Drafting summary... 📝",
         ]
         index = 0
-        while not stop_animation.is_set():
-            time.sleep(1.5)
+        while True:
+            # Wake early when the analysis finishes so a late tick can't overwrite the result.
+            try:
+                await asyncio.wait_for(stop_animation.wait(), timeout=1.5)
+                return
+            except asyncio.TimeoutError:
+                pass
             index = (index + 1) % len(statuses)
             try:
-                client.chat_update(
+                await client.chat_update(
                     channel=channel_id,
                     ts=loading_msg["ts"],
                     blocks=get_loading_block(statuses[index]),
@@ -373,22 +486,14 @@ def run_thread_analysis(client, channel_id: str, thread_ts: str, logger):  # noq
             except Exception:  # noqa: BLE001
                 logger.debug("Unable to update loading animation", exc_info=True)
 
-    def run_analysis() -> None:
+    async def run_analysis() -> None:
         try:
-            history = client.conversations_replies(channel=channel_id, ts=thread_ts)
-            messages = history["messages"]
-            full_text = "\n".join([f"{m.get('user')}: {m.get('text')}" for m in messages])
-
-            attachments = [
-                {"name": file.get("name"), "mimetype": file.get("mimetype")}
-                for message in messages
-                for file in message.get("files", []) or []
-            ]
+            messages, full_text, attachments = await history_task
 
-            analysis = ai_service.analyze_thread_structured(full_text, attachments)
+            analysis = await analyze_thread_cached(full_text, attachments)
 
             if analysis.get("error"):
-                client.chat_update(
+                await client.chat_update(
                     channel=channel_id,
                     ts=loading_msg["ts"],
                     blocks=error_block("The AI brain is briefly offline. Please try again."),
@@ -396,16 +501,18 @@ def run_thread_analysis(client, channel_id: str, thread_ts: str, logger):  # noq
                 )
                 return
 
-            project = db_service.get_project_by_channel(channel_id)
+            project = await run_db(db_service.get_project_by_channel, channel_id)
             if project:
-                context_summary = ai_service.summarize_thread([m.get("text", "") for m in messages if m.get("text")])
-                db_service.update_project_context(project["id"], context_summary)
+                context_summary = await asyncio.to_thread(
+                    ai_service.summarize_thread, [m.get("text", "") for m in messages if m.get("text")]
+                )
+                await run_db(db_service.update_project_context, project["id"], context_summary)
                 if project.get("flow_stage") == "audit":
-                    ocp_answers = ai_service.analyze_for_ocp(full_text)
+                    ocp_answers = await asyncio.to_thread(ai_service.analyze_for_ocp, full_text)
                     if not ocp_answers.get("error"):
                         analysis["ocp_answers"] = ocp_answers
 
-            client.chat_update(
+            await client.chat_update(
                 channel=channel_id,
                 ts=loading_msg["ts"],
                 blocks=get_ai_summary_block(analysis),
@@ -413,7 +520,7 @@ def run_thread_analysis(client, channel_id: str, thread_ts: str, logger):  # noq
             )
         except Exception as exc:  # noqa: BLE001
             logger.error("Error handling mention: %s", exc, exc_info=True)
-            client.chat_update(
+            await client.chat_update(
                 channel=channel_id,
                 ts=loading_msg["ts"],
                 text=f":warning: I crashed while thinking: {str(exc)}",
@@ -421,32 +528,29 @@ def run_thread_analysis(client, channel_id: str, thread_ts: str, logger):  # noq
         finally:
             stop_animation.set()
 
-    animation_thread = threading.Thread(target=animate_loading, daemon=True)
-    analysis_thread = threading.Thread(target=run_analysis, daemon=True)
-    animation_thread.start()
-    analysis_thread.start()
+    run_in_background(animate_loading)
+    run_in_background(run_analysis)
 
 
 def parse_message_link(message_link: str) -> tuple[str | None, str | None]:
-    match = re.search(r"/archives/(?P<channel>[A-Z0-9]+)/p(?P<ts>\d+)", message_link)
+    match = MESSAGE_LINK_PATTERN.search(message_link)
     if not match:
         return None, None
-    channel_id = match.group("channel")
-    ts_raw = match.group("ts")
-    if len(ts_raw) <= 6:
-        return None, None
-    ts = f"{ts_raw[:-6]}.{ts_raw[-6:]}"
-    return channel_id, ts
+    # The pattern splits the digits into seconds and the six-digit microsecond suffix.
+    return match.group("channel"), f"{match.group('seconds')}.{match.group('micros')}"
 
 
+DRIVE_FILE_ID_PATTERNS = (
+    re.compile(r"/d/([a-zA-Z0-9_-]+)"),
+    re.compile(r"open\?id=([a-zA-Z0-9_-]+)"),
+    re.compile(r"id=([a-zA-Z0-9_-]+)"),
+)
+
+
+@lru_cache(maxsize=1024)
 def extract_drive_file_id(link: str) -> str | None:
-    patterns = [
-        r"/d/([a-zA-Z0-9_-]+)",
-        r"open\?id=([a-zA-Z0-9_-]+)",
-        r"id=([a-zA-Z0-9_-]+)",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, link)
+    for pattern in DRIVE_FILE_ID_PATTERNS:
+        match = pattern.search(link)
         if match:
             return match.group(1)
     return link.strip() or None
@@ -469,7 +573,7 @@ def save_assumptions_from_text(project_id: int, assumptions: list[str]) -> int:
     return saved
 
 
-def apply_channel_template(client, channel_id: str, tabs: list[str]) -> None:
+async def apply_channel_template(client, channel_id: str, tabs: list[str]) -> None:
     if not tabs:
         return
     base_link = (
@@ -477,46 +581,69 @@ def apply_channel_template(client, channel_id: str, tabs: list[str]) -> None:
         if Config.SLACK_APP_ID
         else "https://slack.com/apps"
     )
-    for tab in tabs:
-        template = CHANNEL_TAB_TEMPLATES.get(tab)
-        if not template:
-            continue
-        try:
-            client.bookmarks_add(
-                channel_id=channel_id,
-                title=template["title"],
-                emoji=template["emoji"],
-                link=base_link,
-            )
-        except Exception:  # noqa: BLE001
-            logger.warning("Unable to add channel tab template for %s.", tab, exc_info=True)
+    selected = [(tab, CHANNEL_TAB_TEMPLATES[tab]) for tab in tabs if tab in CHANNEL_TAB_TEMPLATES]
+    # Bookmarks are independent, so add them concurrently rather than one round trip at a time.
+    results = await asyncio.gather(
+        *(
+            client.bookmarks_add(channel_id=channel_id, title=title, emoji=emoji, link=base_link)
+            for _tab, (title, emoji) in selected
+        ),
+        return_exceptions=True,
+    )
+    for (tab, _bookmark), result in zip(selected, results):
+        if isinstance(result, Exception):
+            logger.warning("Unable to add channel tab template for %s.", tab, exc_info=result)
 
 
 # --- 1. HOME TAB (OCP Dashboard) ---
-def _set_active_project_from_channel(user_id: str, event: dict) -> None:
+async def _set_active_project_from_channel(user_id: str, event: dict) -> None:
     channel_id = event.get("channel") or event.get("channel_id") or event.get("view", {}).get("channel_id")
     if not channel_id:
         return
-    project = db_service.get_project_by_channel(channel_id)
+    project = await run_db(db_service.get_project_by_channel, channel_id)
     if project:
-        db_service.set_active_project(user_id, project["id"])
+        await run_db(db_service.set_active_project, user_id, project["id"])
+
+
+HOME_OPENED_DEBOUNCE_SECONDS = 0.25
+_pending_home_publishes: dict[str, asyncio.TimerHandle] = {}
+
+
+def _debounce_home_publish(client, user_id: str) -> None:  # noqa: ANN001
+    """Publish the Home tab once per user after a burst of app_home_opened events settles."""
+    pending = _pending_home_publishes.pop(user_id, None)
+    if pending is not None:
+        pending.cancel()
+
+    async def publish() -> None:
+        try:
+            await publish_home_tab(client, user_id)
+        except Exception as exc:  # noqa: BLE001
+            logger.error("Error publishing home tab: %s", exc, exc_info=True)
+
+    def fire() -> None:
+        _pending_home_publishes.pop(user_id, None)
+        run_in_background(publish)
+
+    _pending_home_publishes[user_id] = asyncio.get_running_loop().call_later(HOME_OPENED_DEBOUNCE_SECONDS, fire)
 
 
 @app.event("app_home_opened")
-def update_home_tab(client, event, logger):  # noqa: ANN001
+async def update_home_tab(client, event, logger):  # noqa: ANN001
     try:
         user_id = event["user"]
-        _set_active_project_from_channel(user_id, event)
-        publish_home_tab_async(client, user_id)
+        await _set_active_project_from_channel(user_id, event)
+        # Slack fires this on every Home tab click; rapid re-opens share one render.
+        _debounce_home_publish(client, user_id)
     except Exception as exc:  # noqa: BLE001
         logger.error("Error publishing home tab: %s", exc, exc_info=True)
 
 
-def app_home_opened(client, event, logger):  # noqa: ANN001
+async def app_home_opened(client, event, logger):  # noqa: ANN001
     try:
         user_id = event["user"]
-        _set_active_project_from_channel(user_id, event)
-        publish_home_tab_async(client, user_id)
+        await _set_active_project_from_channel(user_id, event)
+        await publish_home_tab(client, user_id)
     except Exception as exc:  # noqa: BLE001
         if logger:
             logger.error("Error publishing home tab: %s", exc, exc_info=True)
@@ -524,152 +651,139 @@ def app_home_opened(client, event, logger):  # noqa: ANN001
 
 @app.action("experiments_page_next")
 @app.action("experiments_page_prev")
-def handle_experiment_page_action(ack, body, client):  # noqa: ANN001
-    ack()
-    user_id = body["user"]["id"]
-    try:
-        page = int(body["actions"][0]["value"])
-    except (TypeError, ValueError):
-        page = 0
-    publish_home_tab_async(client, user_id, "overview", experiment_page=max(page, 0))
+async def handle_experiment_page_action(ack, body, client):  # noqa: ANN001
+    await ack()
+    await publish_home_tab(client, body["user"]["id"])
 
 
-def publish_home_tab(
+def render_home_view(
+    key: str,
+    user_id: str,
+    project_data: dict | None,
+    all_projects: list[dict],
+    plan_suggestion: str | None,
+) -> dict:
+    """Build the Home view, reusing the last render for identical inputs. Returns a copy callers may change."""
+    view = home_view_cache.get(key)
+    if view is None:
+        view = get_home_view(
+            user_id,
+            project_data,
+            all_projects,
+            plan_suggestion=plan_suggestion,
+            playbook_service=playbook,
+        )
+        home_view_cache.set(key, view)
+    return copy.deepcopy(view)
+
+
+async def _publish_home_view(
     client,
     user_id: str,
-    active_tab: str = "overview",
-    experiment_page: int = 0,
+    project_data: dict | None,
+    all_projects: list[dict],
     plan_suggestion: str | None = None,
 ) -> None:
-    project_data = db_service.get_active_project(user_id)
-    all_projects = db_service.get_user_projects(user_id)
-    view = get_home_view(
-        user_id,
-        project_data,
-        all_projects,
-        plan_suggestion=plan_suggestion,
-        playbook_service=playbook,
-    )
-    client.views_publish(user_id=user_id, view=view)
+    """Publish the Home view, skipping the call when Slack already shows this exact render."""
+    key = content_key(user_id, project_data, all_projects, plan_suggestion)
+    if published_home_views.get(user_id) == key:
+        return
+    view = render_home_view(key, user_id, project_data, all_projects, plan_suggestion)
+    await client.views_publish(user_id=user_id, view=view)
+    published_home_views.set(user_id, key)
 
 
-def publish_home_tab_hub(client, user_id: str) -> None:
-    projects = db_service.get_user_projects(user_id)
+async def _publish_other_home_view(client, user_id: str, view: dict) -> None:  # noqa: ANN001
+    """Publish a non-dashboard Home view (hub, admin) and forget the last dashboard render."""
+    published_home_views.pop(user_id)
+    await client.views_publish(user_id=user_id, view=view)
+
+
+async def publish_home_tab(client, user_id: str, plan_suggestion: str | None = None) -> None:  # noqa: ANN001
+    project_data, all_projects = await run_db(db_service.get_active_project_and_projects, user_id)
+    await _publish_home_view(client, user_id, project_data, all_projects, plan_suggestion)
+
+
+async def publish_home_tab_hub(client, user_id: str) -> None:
+    projects = await run_db(db_service.get_user_projects, user_id)
     view = UIManager.render_project_hub(projects, user_id, ADMIN_USER_ID)
-    client.views_publish(user_id=user_id, view=view)
+    await _publish_other_home_view(client, user_id, view)
 
 
-def _send_new_project_tour(client, user_id: str, project: dict) -> None:  # noqa: ANN001
-    client.chat_postEphemeral(
+async def _send_new_project_tour(client, user_id: str, flow_stage: str | None) -> None:  # noqa: ANN001
+    await client.chat_postEphemeral(
         channel=user_id,
         user=user_id,
-        text=f"👋 Welcome! I've set your project to Stage 1: {project.get('flow_stage', 'audit').title()}.",
-    )
-    client.chat_postEphemeral(
-        channel=user_id,
-        user=user_id,
-        text="🎯 Goal: Answer the OCP questions to find your gaps.",
-    )
-    client.chat_postEphemeral(
-        channel=user_id,
-        user=user_id,
-        text="👉 Click 'Run Diagnostic' to start.",
+        text=(
+            f"👋 Welcome! I've set your project to Stage 1: {(flow_stage or 'audit').title()}.\n"
+            "🎯 Goal: Answer the OCP questions to find your gaps.\n"
+            "👉 Click 'Run Diagnostic' to start."
+        ),
     )
 
 
 def admin_required(func):  # noqa: ANN001
     @wraps(func)
-    def decorated_function(ack, body, client, *args, **kwargs):  # noqa: ANN001
+    async def decorated_function(ack, body, client, *args, **kwargs):  # noqa: ANN001
         user_id = body["user"]["id"]
         if not ADMIN_USER_ID or user_id != ADMIN_USER_ID:
-            ack()
-            client.chat_postEphemeral(channel=user_id, user=user_id, text="You are not authorized to perform this action.")
+            await ack()
+            await client.chat_postEphemeral(
+                channel=user_id, user=user_id, text="You are not authorized to perform this action."
+            )
             return None
-        return func(ack, body, client, *args, **kwargs)
+        return await func(ack, body, client, *args, **kwargs)
 
     return decorated_function
 
 
-def publish_home_tab_async(
-    client,
-    user_id: str,
-    active_tab: str = "overview",
-    experiment_page: int = 0,
-    plan_suggestion: str | None = None,
-) -> None:
-    project_data = db_service.get_active_project(user_id)
-    all_projects = db_service.get_user_projects(user_id)
-    view = get_home_view(
-        user_id,
-        project_data,
-        all_projects,
-        plan_suggestion=plan_suggestion,
-        playbook_service=playbook,
-    )
-    client.views_publish(user_id=user_id, view=view)
-
-    if not project_data:
-        return
-
-    def update_actions() -> None:
-        try:
-            refreshed_view = get_home_view(
-                user_id,
-                project_data,
-                all_projects,
-                plan_suggestion=plan_suggestion,
-                playbook_service=playbook,
-            )
-            client.views_publish(user_id=user_id, view=refreshed_view)
-        except Exception:
-            logger.exception("Failed to generate and publish next best actions for user %s", user_id)
-
-
 @app.action("refresh_home")
-def refresh_home(ack, body, client):  # noqa: ANN001
-    ack()
+async def refresh_home(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    publish_home_tab_async(client, user_id)
+    await publish_home_tab(client, user_id)
 
 
 @app.action("open_new_project_modal")
-def open_new_project_modal(ack, body, client):  # noqa: ANN001
-    ack()
-    client.views_open(trigger_id=body["trigger_id"], view=get_new_project_modal())
+async def open_new_project_modal(ack, body, client):  # noqa: ANN001
+    await ack()
+    await client.views_open(trigger_id=body["trigger_id"], view=get_new_project_modal())
 
 
 @app.view("new_project_submit")
-def handle_new_project_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_new_project_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     values = body["view"]["state"]["values"]
     try:
         name = values["project_name"]["value"]["value"]
         description = values["project_description"]["value"]["value"]
         flow_stage = values["project_flow_stage"]["value"]["selected_option"]["value"]
-        project = db_service.create_project(user_id=user_id, name=name, description=description, flow_stage=flow_stage)
+        project = await run_db(
+            db_service.create_project, user_id=user_id, name=name, description=description, flow_stage=flow_stage
+        )
         if project:
-            publish_home_tab_async(client, user_id)
-            _send_new_project_tour(client, user_id, project)
+            await publish_home_tab(client, user_id)
+            await _send_new_project_tour(client, user_id, project.flow_stage)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to create project via new modal", exc_info=True)
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Unable to create that project right now.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Unable to create that project right now.")
 
 
 @app.action("action_set_flow_stage")
-def action_set_flow_stage(ack, body, client):  # noqa: ANN001
-    ack()
+async def action_set_flow_stage(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     flow_stage = body["actions"][0].get("value")
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project or not flow_stage:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please select an active project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please select an active project first.")
         return
-    db_service.update_project_flow_stage(project["id"], flow_stage)
+    await run_db(db_service.update_project_flow_stage, project["id"], flow_stage)
     plan_suggestion = None
     if flow_stage == "plan":
-        plan_suggestion = _get_plan_suggestion(project)
-    publish_home_tab_async(client, user_id, "overview", plan_suggestion=plan_suggestion)
+        plan_suggestion = await asyncio.to_thread(_get_plan_suggestion, project)
+    await publish_home_tab(client, user_id, plan_suggestion=plan_suggestion)
 
 
 def _get_plan_suggestion(project: dict) -> str | None:
@@ -794,23 +908,23 @@ def _map_ai_response_to_diagnostic(
 
 
 @app.action("action_open_diagnostic")
-def action_open_diagnostic(ack, body, client):  # noqa: ANN001
-    ack()
+async def action_open_diagnostic(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
     framework = playbook.get_5_pillar_framework()
-    client.views_open(
+    await client.views_open(
         trigger_id=body["trigger_id"],
         view=get_diagnostic_modal(framework, project_id=project["id"]),
     )
 
 
 @app.action("autofill_diagnostic")
-def autofill_diagnostic(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def autofill_diagnostic(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     view = body.get("view", {})
     view_id = view.get("id")
     project_id = view.get("private_metadata") or body["actions"][0].get("value")
@@ -824,10 +938,10 @@ def autofill_diagnostic(ack, body, client, logger):  # noqa: ANN001
     if not view_id or not project_id:
         return
     try:
-        context_text = ingestion_service.ingest_project_files(int(project_id))
+        context_text = await asyncio.to_thread(ingestion_service.ingest_project_files, int(project_id))
         framework = playbook.get_5_pillar_framework()
         if not context_text:
-            client.views_update(
+            await client.views_update(
                 view_id=view_id,
                 view=get_diagnostic_modal(
                     framework,
@@ -836,9 +950,9 @@ def autofill_diagnostic(ack, body, client, logger):  # noqa: ANN001
                 ),
             )
             return
-        ai_response = ai_service.extract_5_pillar_diagnostic(context_text)
+        ai_response = await asyncio.to_thread(ai_service.extract_5_pillar_diagnostic, context_text)
         if not isinstance(ai_response, dict) or ai_response.get("error"):
-            client.views_update(
+            await client.views_update(
                 view_id=view_id,
                 view=get_diagnostic_modal(
                     framework,
@@ -848,7 +962,7 @@ def autofill_diagnostic(ack, body, client, logger):  # noqa: ANN001
             )
             return
         ai_data, roadmap_data = _map_ai_response_to_diagnostic(framework, ai_response)
-        client.views_update(
+        await client.views_update(
             view_id=view_id,
             view=get_diagnostic_modal(
                 framework,
@@ -863,12 +977,12 @@ def autofill_diagnostic(ack, body, client, logger):  # noqa: ANN001
 
 
 @app.view("action_save_diagnostic")
-def action_save_diagnostic(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def action_save_diagnostic(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
     values = body["view"]["state"]["values"]
     try:
@@ -891,7 +1005,8 @@ def action_save_diagnostic(ack, body, client, logger):  # noqa: ANN001
                 continue
             answer = answers.get(lookup_key)
             # 5-Pillar diagnostic answers are stored as generic assumptions to avoid overloading legacy categories.
-            db_service.upsert_diagnostic_assumption(
+            await run_db(
+                db_service.upsert_diagnostic_assumption,
                 project["id"],
                 pillar,
                 sub_category,
@@ -914,7 +1029,8 @@ def action_save_diagnostic(ack, body, client, logger):  # noqa: ANN001
                 for sub_category, plans in subcategories.items():
                     if not isinstance(plans, dict):
                         continue
-                    db_service.upsert_roadmap_plan(
+                    await run_db(
+                        db_service.upsert_roadmap_plan,
                         project["id"],
                         pillar,
                         sub_category,
@@ -922,18 +1038,18 @@ def action_save_diagnostic(ack, body, client, logger):  # noqa: ANN001
                         plans.get("next"),
                         plans.get("later"),
                     )
-        publish_home_tab_async(client, user_id, "overview")
+        await publish_home_tab(client, user_id)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to save audit scores: %s", exc, exc_info=True)
 
 
 @app.action("open_edit_diagnostic_answer")
-def open_edit_diagnostic_answer(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def open_edit_diagnostic_answer(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
     raw_value = body["actions"][0].get("value", "")
     try:
@@ -944,12 +1060,12 @@ def open_edit_diagnostic_answer(ack, body, client, logger):  # noqa: ANN001
     sub_category = payload.get("sub_category")
     question = payload.get("question") or raw_value
     if not pillar or not sub_category or not question:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Unable to open that diagnostic question.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Unable to open that diagnostic question.")
         return
     existing = _find_diagnostic_assumption(project.get("assumptions", []), pillar, sub_category, question)
     answer = existing.get("source_snippet") if existing else None
     confidence_score = existing.get("confidence_score") if existing else None
-    client.views_open(
+    await client.views_open(
         trigger_id=body["trigger_id"],
         view=get_edit_diagnostic_answer_modal(
             pillar=pillar,
@@ -963,12 +1079,12 @@ def open_edit_diagnostic_answer(ack, body, client, logger):  # noqa: ANN001
 
 
 @app.view("save_diagnostic_answer")
-def save_diagnostic_answer(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def save_diagnostic_answer(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
     metadata = body["view"].get("private_metadata") or "{}"
     try:
@@ -979,7 +1095,7 @@ def save_diagnostic_answer(ack, body, client, logger):  # noqa: ANN001
     sub_category = payload.get("sub_category")
     question = payload.get("question")
     if not pillar or not sub_category or not question:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Missing diagnostic details.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Missing diagnostic details.")
         return
     values = body["view"]["state"]["values"]
     answer = values.get("diagnostic_answer", {}).get("answer_input", {}).get("value", "").strip()
@@ -989,7 +1105,8 @@ def save_diagnostic_answer(ack, body, client, logger):  # noqa: ANN001
     except (TypeError, ValueError):
         confidence_score = 0
     try:
-        db_service.upsert_diagnostic_assumption(
+        await run_db(
+            db_service.upsert_diagnostic_assumption,
             project["id"],
             pillar,
             sub_category,
@@ -997,26 +1114,25 @@ def save_diagnostic_answer(ack, body, client, logger):  # noqa: ANN001
             confidence_score,
             answer=answer or None,
         )
-        publish_home_tab_async(client, user_id, "overview")
+        await publish_home_tab(client, user_id)
     except SQLAlchemyError as exc:
         logger.error("Failed to save diagnostic answer: %s", exc, exc_info=True)
 
 
 @app.action("open_roadmap_modal")
-def open_roadmap_modal(ack, body, client):  # noqa: ANN001
-    ack()
+async def open_roadmap_modal(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
-    raw_value = body["actions"][0].get("value", "")
-    if "||" not in raw_value:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Select a roadmap section to edit.")
+    pillar, separator, sub_category = body["actions"][0].get("value", "").partition("||")
+    if not separator:
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Select a roadmap section to edit.")
         return
-    pillar, sub_category = raw_value.split("||", 1)
-    existing_plan = db_service.get_roadmap_plan(project["id"], pillar, sub_category)
-    client.views_open(
+    existing_plan = await run_db(db_service.get_roadmap_plan, project["id"], pillar, sub_category)
+    await client.views_open(
         trigger_id=body["trigger_id"],
         view=get_roadmap_modal(
             pillar=pillar,
@@ -1028,17 +1144,17 @@ def open_roadmap_modal(ack, body, client):  # noqa: ANN001
 
 
 @app.action("open_decision_vote")
-def open_decision_vote(ack, body, client):  # noqa: ANN001
-    ack()
+async def open_decision_vote(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     assumption_id = int(body["actions"][0]["value"])
-    assumption = db_service.get_assumption(assumption_id)
+    assumption = await run_db(db_service.get_assumption, assumption_id)
     if not assumption:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Assumption not found.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Assumption not found.")
         return
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     channel_id = project.get("channel_id") if project else user_id
-    client.views_open(
+    await client.views_open(
         trigger_id=body["trigger_id"],
         view=decision_vote_modal(
             assumption_title=assumption.get("title", "Untitled"),
@@ -1049,8 +1165,8 @@ def open_decision_vote(ack, body, client):  # noqa: ANN001
 
 
 @app.view("save_roadmap_plan")
-def save_roadmap_plan(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def save_roadmap_plan(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     values = body["view"]["state"]["values"]
     try:
@@ -1059,12 +1175,13 @@ def save_roadmap_plan(ack, body, client, logger):  # noqa: ANN001
         sub_category = metadata.get("sub_category")
         project_id = metadata.get("project_id")
         if not (pillar and sub_category and project_id):
-            client.chat_postEphemeral(channel=user_id, user=user_id, text="Missing roadmap context.")
+            await client.chat_postEphemeral(channel=user_id, user=user_id, text="Missing roadmap context.")
             return
         plan_now = values["roadmap_plan_now"]["plan_now"].get("value", "").strip()
         plan_next = values["roadmap_plan_next"]["plan_next"].get("value", "").strip()
         plan_later = values["roadmap_plan_later"]["plan_later"].get("value", "").strip()
-        db_service.upsert_roadmap_plan(
+        await run_db(
+            db_service.upsert_roadmap_plan,
             int(project_id),
             pillar,
             sub_category,
@@ -1072,18 +1189,18 @@ def save_roadmap_plan(ack, body, client, logger):  # noqa: ANN001
             plan_next,
             plan_later,
         )
-        publish_home_tab_async(client, user_id, "overview")
+        await publish_home_tab(client, user_id)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to update roadmap plan: %s", exc, exc_info=True)
 
 
 @app.action("view_playbook_methods")
-def view_playbook_methods(ack, body, client):  # noqa: ANN001
-    ack()
+async def view_playbook_methods(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     stage = project.get("stage", "Define") if project else "Define"
-    client.views_open(
+    await client.views_open(
         trigger_id=body["trigger_id"],
         view={
             "type": "modal",
@@ -1095,16 +1212,16 @@ def view_playbook_methods(ack, body, client):  # noqa: ANN001
 
 
 @app.action("generate_meeting_agenda")
-def generate_meeting_agenda(ack, body, client):  # noqa: ANN001
-    ack()
+async def generate_meeting_agenda(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please select a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please select a project first.")
         return
-    agenda = report_service.generate_meeting_agenda(project["id"])
+    agenda = await asyncio.to_thread(report_service.generate_meeting_agenda, project["id"])
     channel_id = project.get("channel_id") or user_id
-    client.chat_postMessage(
+    await client.chat_postMessage(
         channel=channel_id,
         text="Meeting agenda",
         blocks=[
@@ -1115,18 +1232,18 @@ def generate_meeting_agenda(ack, body, client):  # noqa: ANN001
 
 
 @app.action("export_strategy_doc")
-def export_strategy_doc(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def export_strategy_doc(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please select a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please select a project first.")
         return
     report_path = None
     try:
-        report_path = report_service.generate_strategy_doc(project)
+        report_path = await asyncio.to_thread(report_service.generate_strategy_doc, project)
         channel_id = project.get("channel_id") or user_id
-        client.files_upload_v2(
+        await client.files_upload_v2(
             channel=channel_id,
             title=f"Strategy Report · {project.get('name', 'Project')}",
             filename=f"strategy-report-{project.get('id', 'project')}.md",
@@ -1134,60 +1251,60 @@ def export_strategy_doc(ack, body, client, logger):  # noqa: ANN001
         )
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to export strategy doc", exc_info=True)
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Unable to export the strategy doc right now.")
+        await client.chat_postEphemeral(
+            channel=user_id, user=user_id, text="Unable to export the strategy doc right now."
+        )
     finally:
         if report_path and report_path.exists():
             report_path.unlink()
 
 
-@app.action(re.compile(r"^(nav|tab)_"))
-def handle_navigation(ack, body, client):  # noqa: ANN001
-    ack()
-    user_id = body["user"]["id"]
-    tab = body["actions"][0]["value"]
-    publish_home_tab_async(client, user_id, tab)
+@app.action(NAV_ACTION_PATTERN)
+async def handle_navigation(ack, body, client):  # noqa: ANN001
+    await ack()
+    await publish_home_tab(client, body["user"]["id"])
 
 
 @app.action("open_project_dashboard")
-def open_project_dashboard(ack, body, client):  # noqa: ANN001
-    ack()
+async def open_project_dashboard(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     project_id = int(body["actions"][0]["value"])
-    projects = db_service.get_user_projects(user_id)
+    projects = await run_db(db_service.get_user_projects, user_id)
     if not any(project["id"] == project_id for project in projects):
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="You don't have access to that project.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="You don't have access to that project.")
         return
-    db_service.set_active_project(user_id, project_id)
-    publish_home_tab_async(client, user_id, "overview")
+    await run_db(db_service.set_active_project, user_id, project_id)
+    await publish_home_tab(client, user_id)
 
 
 @app.action("draft_assumption_from_last_convo")
-def draft_assumption_from_last_convo(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def draft_assumption_from_last_convo(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     try:
-        project = db_service.get_active_project(user_id)
+        project = await run_db(db_service.get_active_project, user_id)
         channel_id = project.get("channel_id") if project else None
         if not channel_id:
-            client.chat_postEphemeral(
+            await client.chat_postEphemeral(
                 channel=user_id,
                 user=user_id,
                 text="Link a project channel first so I can read the latest conversation.",
             )
             return
-        history = client.conversations_history(channel=channel_id, limit=10)
+        history = await client.conversations_history(channel=channel_id, limit=10)
         messages = history.get("messages", [])
         if not messages:
-            client.chat_postEphemeral(
+            await client.chat_postEphemeral(
                 channel=user_id,
                 user=user_id,
                 text="No recent messages found to draft from.",
             )
             return
         conversation_text = "\n".join(message.get("text", "") for message in reversed(messages) if message.get("text"))
-        analysis = ai_service.analyze_thread_structured(conversation_text)
+        analysis = await analyze_thread_cached(conversation_text)
         if analysis.get("error"):
-            client.chat_postEphemeral(
+            await client.chat_postEphemeral(
                 channel=user_id,
                 user=user_id,
                 text="I couldn't draft an assumption from that conversation yet.",
@@ -1198,13 +1315,13 @@ def draft_assumption_from_last_convo(ack, body, client, logger):  # noqa: ANN001
             "text": assumption.get("text", ""),
             "category": assumption.get("category", "Opportunity"),
         }
-        client.views_open(
+        await client.views_open(
             trigger_id=body["trigger_id"],
             view=open_log_assumption_modal(ai_data),
         )
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to draft assumption from conversation", exc_info=True)
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=user_id,
             user=user_id,
             text="Something went wrong drafting the assumption.",
@@ -1212,14 +1329,14 @@ def draft_assumption_from_last_convo(ack, body, client, logger):  # noqa: ANN001
 
 
 @app.action("remove_drive_file")
-def remove_drive_file(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def remove_drive_file(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     try:
         file_id = body["actions"][0].get("value")
-        project = db_service.get_active_project(user_id)
+        project = await run_db(db_service.get_active_project, user_id)
         if not project or not file_id:
-            client.chat_postEphemeral(channel=user_id, user=user_id, text="File not found.")
+            await client.chat_postEphemeral(channel=user_id, user=user_id, text="File not found.")
             return
         integrations = project.get("integrations") or {}
         drive_info = integrations.get("drive") or {}
@@ -1227,11 +1344,11 @@ def remove_drive_file(ack, body, client, logger):  # noqa: ANN001
         updated_files = [item for item in files if item.get("id") != file_id]
         drive_info["files"] = updated_files
         integrations["drive"] = drive_info
-        db_service.update_project_integrations(project["id"], integrations)
-        publish_home_tab_async(client, user_id, "overview")
+        await run_db(db_service.update_project_integrations, project["id"], integrations)
+        await publish_home_tab(client, user_id)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to remove drive file", exc_info=True)
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=user_id,
             user=user_id,
             text="Unable to remove that file right now.",
@@ -1239,25 +1356,25 @@ def remove_drive_file(ack, body, client, logger):  # noqa: ANN001
 
 
 @app.action("auto_fill_from_evidence")
-def auto_fill_from_evidence(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def auto_fill_from_evidence(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     try:
-        project = db_service.get_active_project(user_id)
+        project = await run_db(db_service.get_active_project, user_id)
         if not project:
-            client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+            await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
             return
-        context_text = ingestion_service.ingest_project_files(project["id"])
+        context_text = await asyncio.to_thread(ingestion_service.ingest_project_files, project["id"])
         if not context_text:
-            client.chat_postEphemeral(
+            await client.chat_postEphemeral(
                 channel=user_id,
                 user=user_id,
                 text="No readable evidence found in the connected files.",
             )
             return
-        draft = ai_service.extract_5_pillar_diagnostic(context_text)
+        draft = await asyncio.to_thread(ai_service.extract_5_pillar_diagnostic, context_text)
         if draft.get("error"):
-            client.chat_postEphemeral(
+            await client.chat_postEphemeral(
                 channel=user_id,
                 user=user_id,
                 text="I couldn't generate a diagnostic draft from that evidence yet.",
@@ -1276,7 +1393,8 @@ def auto_fill_from_evidence(ack, body, client, logger):  # noqa: ANN001
                     if q and a:
                         sections.append(f"{pillar_key} — {sub_cat}\n{q}: {a}")
         description = "\n\n".join(sections).strip() if sections else ""
-        db_service.update_project_details(
+        await run_db(
+            db_service.update_project_details,
             project_id=project["id"],
             name=project.get("name", ""),
             description=description,
@@ -1285,15 +1403,15 @@ def auto_fill_from_evidence(ack, body, client, logger):  # noqa: ANN001
         insights = draft.get("Insights") or []
         insights_text = "\n- ".join(insights) if insights else ""
         message = f"✅ Auto-fill complete. Insights:\n- {insights_text}" if insights_text else "✅ Auto-fill complete."
-        messenger_service.post_ephemeral(
+        await messenger_service.post_ephemeral(
             channel=user_id,
             user=user_id,
             text=message,
         )
-        publish_home_tab_async(client, user_id, "overview")
+        await publish_home_tab(client, user_id)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to auto-fill from evidence", exc_info=True)
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=user_id,
             user=user_id,
             text="Something went wrong while auto-filling from evidence.",
@@ -1301,30 +1419,30 @@ def auto_fill_from_evidence(ack, body, client, logger):  # noqa: ANN001
 
 
 @app.action("back_to_hub")
-def back_to_hub(ack, body, client):  # noqa: ANN001
-    ack()
+async def back_to_hub(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    publish_home_tab_hub(client, user_id)
+    await publish_home_tab_hub(client, user_id)
 
 
 @app.action("open_admin_dashboard")
 @admin_required
-def open_admin_dashboard(ack, body, client):  # noqa: ANN001
-    ack()
+async def open_admin_dashboard(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    all_projects = db_service.get_all_projects_with_counts()
+    all_projects = await run_db(db_service.get_all_projects_with_counts)
     view = UIManager.render_admin_dashboard(all_projects)
-    client.views_publish(user_id=user_id, view=view)
+    await _publish_other_home_view(client, user_id, view)
 
 
 @app.action("admin_purge_confirm")
 @admin_required
-def admin_purge_confirm(ack, body, client):  # noqa: ANN001
-    ack()
+async def admin_purge_confirm(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    all_projects = db_service.get_all_projects_with_counts()
+    all_projects = await run_db(db_service.get_all_projects_with_counts)
     empty_count = sum(1 for project in all_projects if project.get("member_count", 0) == 0)
-    client.views_open(
+    await client.views_open(
         trigger_id=body["trigger_id"],
         view={
             "type": "modal",
@@ -1348,51 +1466,51 @@ def admin_purge_confirm(ack, body, client):  # noqa: ANN001
 
 @app.view("admin_purge_submit")
 @admin_required
-def admin_purge_submit(ack, body, client):  # noqa: ANN001
-    ack()
+async def admin_purge_submit(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    deleted_count = db_service.delete_empty_projects()
-    client.chat_postEphemeral(
+    deleted_count = await run_db(db_service.delete_empty_projects)
+    await client.chat_postEphemeral(
         channel=user_id,
         user=user_id,
         text=f"✅ Deleted {deleted_count} empty project(s).",
     )
-    all_projects = db_service.get_all_projects_with_counts()
+    all_projects = await run_db(db_service.get_all_projects_with_counts)
     view = UIManager.render_admin_dashboard(all_projects)
-    client.views_publish(user_id=user_id, view=view)
+    await _publish_other_home_view(client, user_id, view)
 
 
 @app.action("admin_delete_project")
 @admin_required
-def admin_delete_project(ack, body, client):  # noqa: ANN001
-    ack()
+async def admin_delete_project(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     project_id = int(body["actions"][0]["value"])
-    db_service.delete_project(project_id)
-    client.chat_postEphemeral(channel=user_id, user=user_id, text="Project deleted.")
-    all_projects = db_service.get_all_projects_with_counts()
+    await run_db(db_service.delete_project, project_id)
+    await client.chat_postEphemeral(channel=user_id, user=user_id, text="Project deleted.")
+    all_projects = await run_db(db_service.get_all_projects_with_counts)
     view = UIManager.render_admin_dashboard(all_projects)
-    client.views_publish(user_id=user_id, view=view)
+    await _publish_other_home_view(client, user_id, view)
 
 
 @app.action("setup_step_1")
-def start_setup(ack, body, client):  # noqa: ANN001
-    ack()
-    client.views_open(trigger_id=body["trigger_id"], view=get_setup_step_1_modal())
+async def start_setup(ack, body, client):  # noqa: ANN001
+    await ack()
+    await client.views_open(trigger_id=body["trigger_id"], view=get_setup_step_1_modal())
 
 
 @app.action("open_create_project_modal")
-def open_create_modal(ack, body, client):  # noqa: ANN001
-    ack()
-    client.views_open(
+async def open_create_modal(ack, body, client):  # noqa: ANN001
+    await ack()
+    await client.views_open(
         trigger_id=body["trigger_id"],
         view=UIManager.render_create_project_modal(),
     )
 
 
 @app.view("create_project_submit")
-def handle_create_project(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_create_project(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     values = body["view"]["state"]["values"]
 
@@ -1418,19 +1536,20 @@ def handle_create_project(ack, body, client, logger):  # noqa: ANN001
         # Create channel logic... (keep your existing logic here)
         clean_name = f"evidently-{name.lower().replace(' ', '-')}"[:80]
         try:
-            c_resp = client.conversations_create(name=clean_name)
+            c_resp = await client.conversations_create(name=clean_name)
             channel_id = c_resp["channel"]["id"]
-            client.conversations_invite(channel=channel_id, users=user_id)
+            await client.conversations_invite(channel=channel_id, users=user_id)
         except Exception as e:
             logger.error("Failed to create channel '%s': %s", clean_name, e, exc_info=True)
-            client.chat_postEphemeral(
+            await client.chat_postEphemeral(
                 channel=user_id,
                 user=user_id,
                 text=f"I couldn't create a channel for your project. It might be a permissions issue or an invalid name. The project was created without a linked channel."
             )
 
     # 3. Create in DB (Pass the 'mission' variable!)
-    db_service.create_project(
+    project = await run_db(
+        db_service.create_project,
         user_id,
         name,
         opportunity=opportunity,
@@ -1439,156 +1558,154 @@ def handle_create_project(ack, body, client, logger):  # noqa: ANN001
         mission=mission,
         channel_id=channel_id,
     )
-    project = db_service.get_active_project(user_id)
-    if project:
-        _send_new_project_tour(client, user_id, project)
+    await _send_new_project_tour(client, user_id, project.flow_stage)
 
     # 4. Refresh Home
-    app_home_opened(client, {"user": user_id}, None)
+    await app_home_opened(client, {"user": user_id}, None)
 
 
-@app.action("create_collection_modal")
-def open_collection_modal(ack, body, client):  # noqa: ANN001
-    ack()
-    client.views_open(
-        trigger_id=body["trigger_id"],
-        view={
-            "type": "modal",
-            "callback_id": "create_collection_submit",
-            "title": {"type": "plain_text", "text": "New Collection"},
-            "close": {"type": "plain_text", "text": "Cancel"},
-            "blocks": [
-                {
-                    "type": "input",
-                    "block_id": "name",
-                    "label": {"type": "plain_text", "text": "Name"},
-                    "element": {"type": "plain_text_input", "action_id": "val"},
-                },
-                {
-                    "type": "input",
-                    "block_id": "desc",
-                    "label": {"type": "plain_text", "text": "Description"},
-                    "element": {"type": "plain_text_input", "action_id": "val", "multiline": True},
-                },
-            ],
-            "submit": {"type": "plain_text", "text": "Create"},
+_COLLECTION_MODAL = {
+    "type": "modal",
+    "callback_id": "create_collection_submit",
+    "title": {"type": "plain_text", "text": "New Collection"},
+    "close": {"type": "plain_text", "text": "Cancel"},
+    "blocks": [
+        {
+            "type": "input",
+            "block_id": "name",
+            "label": {"type": "plain_text", "text": "Name"},
+            "element": {"type": "plain_text_input", "action_id": "val"},
         },
-    )
+        {
+            "type": "input",
+            "block_id": "desc",
+            "label": {"type": "plain_text", "text": "Description"},
+            "element": {"type": "plain_text_input", "action_id": "val", "multiline": True},
+        },
+    ],
+    "submit": {"type": "plain_text", "text": "Create"},
+}
+
+
+@app.action("create_collection_modal")
+async def open_collection_modal(ack, body, client):  # noqa: ANN001
+    await ack()
+    await client.views_open(trigger_id=body["trigger_id"], view=_COLLECTION_MODAL)
 
 
 @app.view("create_collection_submit")
-def create_collection_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def create_collection_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     try:
         data = body["view"]["state"]["values"]
         name = data["name"]["val"]["value"]
         description = data["desc"]["val"]["value"]
-        project = db_service.get_active_project(user_id)
+        project = await run_db(db_service.get_active_project, user_id)
         if not project:
-            client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+            await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
             return
-        db_service.create_collection(project["id"], name, description)
-        publish_home_tab_async(client, user_id, "roadmap:collections")
+        await run_db(db_service.create_collection, project["id"], name, description)
+        await publish_home_tab(client, user_id)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to create collection: %s", exc, exc_info=True)
 
 
-@app.action("create_automation_modal")
-def open_automation_modal(ack, body, client):  # noqa: ANN001
-    ack()
-    client.views_open(
-        trigger_id=body["trigger_id"],
-        view={
-            "type": "modal",
-            "callback_id": "create_rule_submit",
-            "title": {"type": "plain_text", "text": "New Automation Rule"},
-            "close": {"type": "plain_text", "text": "Cancel"},
-            "blocks": [
-                {
-                    "type": "input",
-                    "block_id": "trigger",
-                    "label": {"type": "plain_text", "text": "When this happens..."},
-                    "element": {
-                        "type": "static_select",
-                        "action_id": "val",
-                        "options": [
-                            {
-                                "text": {"type": "plain_text", "text": "Experiment Created"},
-                                "value": "experiment_created",
-                            },
-                            {
-                                "text": {"type": "plain_text", "text": "Assumption Validated"},
-                                "value": "assumption_validated",
-                            },
-                            {"text": {"type": "plain_text", "text": "Every Monday"}, "value": "weekly_schedule"},
-                        ],
+_AUTOMATION_MODAL = {
+    "type": "modal",
+    "callback_id": "create_rule_submit",
+    "title": {"type": "plain_text", "text": "New Automation Rule"},
+    "close": {"type": "plain_text", "text": "Cancel"},
+    "blocks": [
+        {
+            "type": "input",
+            "block_id": "trigger",
+            "label": {"type": "plain_text", "text": "When this happens..."},
+            "element": {
+                "type": "static_select",
+                "action_id": "val",
+                "options": [
+                    {
+                        "text": {"type": "plain_text", "text": "Experiment Created"},
+                        "value": "experiment_created",
                     },
-                },
-                {
-                    "type": "input",
-                    "block_id": "action",
-                    "label": {"type": "plain_text", "text": "Do this..."},
-                    "element": {
-                        "type": "static_select",
-                        "action_id": "val",
-                        "options": [
-                            {
-                                "text": {"type": "plain_text", "text": "Notify Project Channel"},
-                                "value": "notify_channel",
-                            },
-                            {"text": {"type": "plain_text", "text": "Email Team Lead"}, "value": "email_lead"},
-                        ],
+                    {
+                        "text": {"type": "plain_text", "text": "Assumption Validated"},
+                        "value": "assumption_validated",
                     },
-                },
-            ],
-            "submit": {"type": "plain_text", "text": "Save Rule"},
+                    {"text": {"type": "plain_text", "text": "Every Monday"}, "value": "weekly_schedule"},
+                ],
+            },
         },
-    )
+        {
+            "type": "input",
+            "block_id": "action",
+            "label": {"type": "plain_text", "text": "Do this..."},
+            "element": {
+                "type": "static_select",
+                "action_id": "val",
+                "options": [
+                    {
+                        "text": {"type": "plain_text", "text": "Notify Project Channel"},
+                        "value": "notify_channel",
+                    },
+                    {"text": {"type": "plain_text", "text": "Email Team Lead"}, "value": "email_lead"},
+                ],
+            },
+        },
+    ],
+    "submit": {"type": "plain_text", "text": "Save Rule"},
+}
+
+
+@app.action("create_automation_modal")
+async def open_automation_modal(ack, body, client):  # noqa: ANN001
+    await ack()
+    await client.views_open(trigger_id=body["trigger_id"], view=_AUTOMATION_MODAL)
 
 
 @app.view("create_rule_submit")
-def create_rule_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def create_rule_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     try:
         data = body["view"]["state"]["values"]
         trigger = data["trigger"]["val"]["selected_option"]["value"]
         action = data["action"]["val"]["selected_option"]["value"]
-        project = db_service.get_active_project(user_id)
+        project = await run_db(db_service.get_active_project, user_id)
         if not project:
-            client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+            await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
             return
-        db_service.create_automation_rule(project["id"], trigger, action)
-        publish_home_tab_async(client, user_id, "team:automation")
+        await run_db(db_service.create_automation_rule, project["id"], trigger, action)
+        await publish_home_tab(client, user_id)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to create automation rule: %s", exc, exc_info=True)
 
 
 @app.action("select_active_project")
-def handle_project_switch(ack, body, client):  # noqa: ANN001
-    ack()
+async def handle_project_switch(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     selected_project_id = body["actions"][0]["selected_option"]["value"]
-    db_service.set_active_project(user_id, int(selected_project_id))
-    publish_home_tab_async(client, user_id)
+    await run_db(db_service.set_active_project, user_id, int(selected_project_id))
+    await publish_home_tab(client, user_id)
 
 
 @app.view("setup_step_2_submit")
-def handle_step_1(ack, body, client):  # noqa: ANN001
+async def handle_step_1(ack, body, client):  # noqa: ANN001
     problem = body["view"]["state"]["values"]["problem_block"]["problem_input"]["value"]
-    ack(response_action="push", view=get_setup_step_2_modal(problem))
+    await ack(response_action="push", view=get_setup_step_2_modal(problem))
 
 
 @app.command("/evidently-help")
-def handle_help_command(ack, body, client):  # noqa: ANN001
+async def handle_help_command(ack, body, client):  # noqa: ANN001
     """
     Opens the Instruction Manual / Help Guide.
     """
-    ack()
+    await ack()
     user_id = body["user_id"]
     blocks = UIManager.render_help_guide()
-    client.chat_postEphemeral(
+    await client.chat_postEphemeral(
         channel=body["channel_id"],
         user=user_id,
         text="Evidently Help Guide",
@@ -1597,14 +1714,14 @@ def handle_help_command(ack, body, client):  # noqa: ANN001
 
 
 @app.command("/evidently-link")
-def handle_link_project(ack, body, respond, client, logger):  # noqa: ANN001
-    ack()
+async def handle_link_project(ack, body, respond, client, logger):  # noqa: ANN001
+    await ack()
     try:
         project_name = (body.get("text") or "").strip()
         if not project_name:
-            client.views_open(trigger_id=body["trigger_id"], view=link_channel_modal())
+            await client.views_open(trigger_id=body["trigger_id"], view=link_channel_modal())
             return
-        user_projects = db_service.get_user_projects(body["user_id"])
+        user_projects = await run_db(db_service.get_user_projects, body["user_id"])
         normalized_name = project_name.lower()
         exact_matches = [
             item for item in user_projects if item.get("name", "").lower() == normalized_name
@@ -1613,35 +1730,36 @@ def handle_link_project(ack, body, respond, client, logger):  # noqa: ANN001
             item for item in user_projects if normalized_name in item.get("name", "").lower()
         ]
         if len(matches) != 1:
-            client.views_open(trigger_id=body["trigger_id"], view=link_channel_modal())
+            await client.views_open(trigger_id=body["trigger_id"], view=link_channel_modal())
             return
         project = matches[0]
         project_id = project["id"]
-        db_service.set_project_channel(project_id, body["channel_id"])
-        db_service.set_active_project(body["user_id"], project_id)
-        respond(f"✅ Channel linked to *{project['name']}*.")
-        publish_home_tab_async(client, body["user_id"])
+        await run_db(db_service.set_project_channel, project_id, body["channel_id"])
+        await run_db(db_service.set_active_project, body["user_id"], project_id)
+        await respond(f"✅ Channel linked to *{project['name']}*.")
+        await publish_home_tab(client, body["user_id"])
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to link project via command", exc_info=True)
-        respond("Unable to link project right now.")
+        await respond("Unable to link project right now.")
 
 
 @app.command("/evidently-log")
-def handle_log_command(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_log_command(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     channel_id = body["channel_id"]
     trigger_id = body["trigger_id"]
     try:
-        loading_response = client.views_open(trigger_id=trigger_id, view=get_loading_modal())
+        loading_response = await client.views_open(trigger_id=trigger_id, view=get_loading_modal())
         view_id = loading_response["view"]["id"]
     except SlackApiError as exc:
-        logger.error("Failed to open loading modal for log command: %s", exc, exc_info=True)
+        # Usually an expired trigger_id; the Slack error code is enough.
+        logger.warning("Failed to open loading modal for log command: %s", exc.response.get("error"))
         return
 
-    def background_task() -> None:
+    async def background_task() -> None:
         ai_data = None
         try:
-            history = client.conversations_history(channel=channel_id, limit=10)
+            history = await client.conversations_history(channel=channel_id, limit=10)
             messages = history.get("messages", [])
             if messages:
                 conversation_text = "\n".join(
@@ -1652,38 +1770,38 @@ def handle_log_command(ack, body, client, logger):  # noqa: ANN001
                 attachments = [
                     {"name": file.get("name"), "mimetype": file.get("mimetype")}
                     for message in messages
-                    for file in message.get("files", []) or []
+                    for file in message.get("files") or ()
                 ]
-                analysis = ai_service.analyze_thread_structured(conversation_text, attachments)
+                analysis = await analyze_thread_cached(conversation_text, attachments)
                 if analysis and not analysis.get("error"):
                     assumption = (analysis.get("assumptions") or [{}])[0]
                     ai_data = {
                         "text": assumption.get("text", ""),
                     }
-            client.views_update(view_id=view_id, view=open_log_assumption_modal(ai_data))
+            await client.views_update(view_id=view_id, view=open_log_assumption_modal(ai_data))
         except Exception as exc:  # noqa: BLE001
             logger.error("Failed to run log command in background", exc_info=True)
-            client.views_update(view_id=view_id, view=open_log_assumption_modal())
+            await client.views_update(view_id=view_id, view=open_log_assumption_modal())
     run_in_background(background_task)
 
 
 @app.command("/evidently-agenda")
-def handle_agenda_command(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_agenda_command(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     try:
         channel_id = body["channel_id"]
-        project = db_service.get_project_by_channel(channel_id)
+        project = await run_db(db_service.get_project_by_channel, channel_id)
         if not project:
-            project = db_service.get_active_project(body["user_id"])
+            project = await run_db(db_service.get_active_project, body["user_id"])
         if not project:
-            client.chat_postEphemeral(
+            await client.chat_postEphemeral(
                 channel=channel_id,
                 user=body["user_id"],
                 text="Please link a project to this channel first.",
             )
             return
-        agenda = report_service.generate_meeting_agenda(project["id"])
-        client.chat_postMessage(
+        agenda = await asyncio.to_thread(report_service.generate_meeting_agenda, project["id"])
+        await client.chat_postMessage(
             channel=channel_id,
             text="Meeting agenda",
             blocks=[
@@ -1693,80 +1811,80 @@ def handle_agenda_command(ack, body, client, logger):  # noqa: ANN001
         )
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to generate agenda", exc_info=True)
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=body["channel_id"],
             user=body["user_id"],
             text="Unable to generate the agenda right now.",
         )
 
 
+_FEEDBACK_MODAL = {
+    "type": "modal",
+    "callback_id": "feedback_submit",
+    "title": {"type": "plain_text", "text": "Send Feedback"},
+    "submit": {"type": "plain_text", "text": "Send"},
+    "close": {"type": "plain_text", "text": "Cancel"},
+    "blocks": [
+        {
+            "type": "input",
+            "block_id": "feedback_text",
+            "label": {"type": "plain_text", "text": "Your feedback"},
+            "element": {"type": "plain_text_input", "action_id": "feedback_input", "multiline": True},
+        }
+    ],
+}
+
+
 @app.command("/evidently-feedback")
-def handle_feedback_command(ack, body, client):  # noqa: ANN001
-    ack()
-    client.views_open(
-        trigger_id=body["trigger_id"],
-        view={
-            "type": "modal",
-            "callback_id": "feedback_submit",
-            "title": {"type": "plain_text", "text": "Send Feedback"},
-            "submit": {"type": "plain_text", "text": "Send"},
-            "close": {"type": "plain_text", "text": "Cancel"},
-            "blocks": [
-                {
-                    "type": "input",
-                    "block_id": "feedback_text",
-                    "label": {"type": "plain_text", "text": "Your feedback"},
-                    "element": {"type": "plain_text_input", "action_id": "feedback_input", "multiline": True},
-                }
-            ],
-        },
-    )
+async def handle_feedback_command(ack, body, client):  # noqa: ANN001
+    await ack()
+    await client.views_open(trigger_id=body["trigger_id"], view=_FEEDBACK_MODAL)
 
 
 @app.view("feedback_submit")
-def handle_feedback_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_feedback_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     feedback_text = body["view"]["state"]["values"]["feedback_text"]["feedback_input"]["value"]
     if not ADMIN_USER_ID:
-        client.chat_postMessage(
+        await client.chat_postMessage(
             channel=user_id,
             text="Thanks for the feedback! The admin channel isn't configured yet.",
         )
         return
     try:
-        client.chat_postMessage(
+        await client.chat_postMessage(
             channel=ADMIN_USER_ID,
             text=f"📝 Feedback from <@{user_id}>:\n{feedback_text}",
         )
-        client.chat_postMessage(
+        await client.chat_postMessage(
             channel=user_id,
             text="✅ Your feedback was sent. Thank you!",
         )
     except SlackApiError as exc:
         logger.error("Failed to send feedback: %s", exc, exc_info=True)
-        client.chat_postMessage(
+        await client.chat_postMessage(
             channel=user_id,
             text="❌ Something went wrong sending your feedback. Please try again.",
         )
 
 
 @app.command("/evidently-status")
-def handle_status_command(ack, body, client):  # noqa: ANN001
+async def handle_status_command(ack, body, client):  # noqa: ANN001
     """
     Posts a public 'Project Health Card' to the channel.
     """
-    ack()
+    await ack()
     user_id = body["user_id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=body["channel_id"], user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=body["channel_id"], user=user_id, text="Please create a project first.")
         return
 
-    metrics = db_service.get_metrics(project["id"])
+    metrics = await run_db(db_service.get_metrics, project["id"])
     blocks = get_project_status_blocks(project, metrics, user_id)
 
-    client.chat_postMessage(
+    await client.chat_postMessage(
         channel=body["channel_id"],
         blocks=blocks,
         text=f"Project Status: {project['name']}",
@@ -1774,17 +1892,17 @@ def handle_status_command(ack, body, client):  # noqa: ANN001
 
 
 @app.command("/evidently-fix-db")
-def handle_db_fix(ack, body, client):  # noqa: ANN001
-    ack()
+async def handle_db_fix(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user_id"]
     if user_id not in getattr(Config, "ADMIN_USERS", []):
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=user_id,
             user=user_id,
             text="⛔ You are not authorized to run this command.",
         )
         return
-    client.chat_postEphemeral(
+    await client.chat_postEphemeral(
         channel=user_id,
         user=user_id,
         text="🛠️ Attempting to patch database schema...",
@@ -1803,7 +1921,7 @@ def handle_db_fix(ack, body, client):  # noqa: ANN001
             except SQLAlchemyError:
                 logger.info("Skipping schema update for statement: %s", statement)
 
-    client.chat_postEphemeral(
+    await client.chat_postEphemeral(
         channel=user_id,
         user=user_id,
         text="✅ Database schema patched successfully.",
@@ -1811,12 +1929,12 @@ def handle_db_fix(ack, body, client):  # noqa: ANN001
 
 
 @app.command("/evidently-ask")
-def handle_ask_command(ack, body, client):  # noqa: ANN001
+async def handle_ask_command(ack, body, client):  # noqa: ANN001
     """
     Instantly fetches interview questions for a specific method.
     Usage: /evidently-ask [method]
     """
-    ack()
+    await ack()
     user_id = body["user_id"]
     text = body.get("text", "").strip()
     method_name = text if text else ToolkitService.DEFAULT_METHOD_NAME
@@ -1824,7 +1942,7 @@ def handle_ask_command(ack, body, client):  # noqa: ANN001
     questions = toolkit_service.get_question_bank(method_name)
     formatted_questions = "\n".join([f"• {question}" for question in questions])
     blocks = get_ask_blocks(method_name, formatted_questions)
-    client.chat_postEphemeral(
+    await client.chat_postEphemeral(
         channel=body["channel_id"],
         user=user_id,
         blocks=blocks,
@@ -1833,34 +1951,34 @@ def handle_ask_command(ack, body, client):  # noqa: ANN001
 
 
 @app.command("/evidently-scout")
-def handle_scout_command(ack, body, client):  # noqa: ANN001
+async def handle_scout_command(ack, body, client):  # noqa: ANN001
     """AI Research Assistant that finds competitors and market risks."""
-    ack()
+    await ack()
     user_id = body["user_id"]
     channel_id = body["channel_id"]
     region = body.get("text", "").strip() or "Global"
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
 
     if not project:
-        client.chat_postEphemeral(channel=channel_id, user=user_id, text="No active project found.")
+        await client.chat_postEphemeral(channel=channel_id, user=user_id, text="No active project found.")
         return
 
     problem_statement = (project.get("description") or "").strip()
     if not problem_statement:
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=channel_id,
             user=user_id,
             text="Add a project description before running Market Scout.",
         )
         return
 
-    client.chat_postEphemeral(
+    await client.chat_postEphemeral(
         channel=channel_id,
         user=user_id,
         text="🕵️ Scouting the market... analyzing competitors and risks...",
     )
 
-    analysis = ai_service.scout_market(problem_statement, region=region)
+    analysis = await asyncio.to_thread(ai_service.scout_market, problem_statement, region=region)
     competitors = analysis.get("competitors", [])
     risks = analysis.get("risks", [])
     competitors_text = "\n".join([f"• {item}" for item in competitors]) or "No competitors returned."
@@ -1888,23 +2006,23 @@ def handle_scout_command(ack, body, client):  # noqa: ANN001
             }
         )
 
-    client.chat_postMessage(channel=channel_id, blocks=blocks, text="Market scout results")
+    await client.chat_postMessage(channel=channel_id, blocks=blocks, text="Market scout results")
 
 
 @app.event("file_shared")
-def handle_setup_files(event, client, logger):  # noqa: ANN001
+async def handle_setup_files(event, client, logger):  # noqa: ANN001
     file_id = event.get("file_id")
     user_id = event.get("user_id")
     if not file_id or not user_id:
         return
 
-    file_info = client.files_info(file=file_id).get("file", {})
+    file_info = (await client.files_info(file=file_id)).get("file", {})
     channels = file_info.get("channels", [])
     if not channels:
         return
 
     channel_id = channels[0]
-    messenger_service.post_ephemeral(
+    await messenger_service.post_ephemeral(
         channel=channel_id,
         user=user_id,
         text=f"📄 I see you uploaded *{file_info.get('name', 'a file')}*. Want me to auto-fill your Canvas?",
@@ -1913,38 +2031,38 @@ def handle_setup_files(event, client, logger):  # noqa: ANN001
 
 
 @app.action("ignore_file")
-def ignore_file_upload(ack):  # noqa: ANN001
-    ack()
+async def ignore_file_upload(ack):  # noqa: ANN001
+    await ack()
 
 
 @app.action("analyze_file")
-def process_file_analysis(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def process_file_analysis(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     file_id = body["actions"][0]["value"]
     channel_id = body["channel"]["id"]
     user_id = body["user"]["id"]
 
-    messenger_service.post_ephemeral(
+    await messenger_service.post_ephemeral(
         channel=channel_id,
         user=user_id,
         text="🧠 Reading document... extracting assumptions...",
     )
 
-    file_info = client.files_info(file=file_id).get("file", {})
+    file_info = (await client.files_info(file=file_id)).get("file", {})
     download_url = file_info.get("url_private_download")
     if not download_url:
-        messenger_service.post_ephemeral(channel=channel_id, user=user_id, text="I couldn't access that file.")
+        await messenger_service.post_ephemeral(channel=channel_id, user=user_id, text="I couldn't access that file.")
         return
 
-    file_content = download_private_file(download_url)
+    file_content = await asyncio.to_thread(download_private_file, download_url)
     if not file_content:
-        messenger_service.post_ephemeral(channel=channel_id, user=user_id, text="I couldn't download that file.")
+        await messenger_service.post_ephemeral(channel=channel_id, user=user_id, text="I couldn't download that file.")
         return
 
     file_type = file_info.get("mimetype", "")
-    extraction = ingestion_service.extract_text_payload(file_content, file_type)
+    extraction = await asyncio.to_thread(ingestion_service.extract_text_payload, file_content, file_type)
     if extraction.get("error"):
-        messenger_service.post_ephemeral(
+        await messenger_service.post_ephemeral(
             channel=channel_id,
             user=user_id,
             text=extraction["error"],
@@ -1953,24 +2071,25 @@ def process_file_analysis(ack, body, client, logger):  # noqa: ANN001
 
     chunks = extraction.get("chunks", [])
     context_text = "\n".join(chunks[:3]) if chunks else extraction.get("text", "")
-    analysis = ai_service.generate_canvas_from_doc(context_text)
-    project = db_service.get_active_project(user_id)
+    analysis = await asyncio.to_thread(ai_service.generate_canvas_from_doc, context_text)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        messenger_service.post_ephemeral(channel=channel_id, user=user_id, text="No active project found.")
+        await messenger_service.post_ephemeral(channel=channel_id, user=user_id, text="No active project found.")
         return
 
     canvas_data = analysis.get("canvas_data", {})
     gaps = analysis.get("gaps_identified", [])
     follow_ups = analysis.get("follow_up_questions", [])
     summary_blocks = ModalFactory.document_insights_blocks(canvas_data, gaps, follow_ups)
-    messenger_service.post_message(channel=channel_id, blocks=summary_blocks, text="Document insights")
+    await messenger_service.post_message(channel=channel_id, blocks=summary_blocks, text="Document insights")
 
     if canvas_data.get("problem"):
-        db_service.add_canvas_item(project["id"], "Opportunity", canvas_data["problem"], is_ai=True)
+        await run_db(db_service.add_canvas_item, project["id"], "Opportunity", canvas_data["problem"], is_ai=True)
     if canvas_data.get("solution"):
-        db_service.add_canvas_item(project["id"], "Capability", canvas_data["solution"], is_ai=True)
+        await run_db(db_service.add_canvas_item, project["id"], "Capability", canvas_data["solution"], is_ai=True)
     if canvas_data.get("users"):
-        db_service.add_canvas_item(
+        await run_db(
+            db_service.add_canvas_item,
             project["id"],
             "Opportunity",
             "Target users: " + ", ".join(canvas_data["users"]),
@@ -1979,7 +2098,7 @@ def process_file_analysis(ack, body, client, logger):  # noqa: ANN001
 
     for risk in canvas_data.get("risks", []):
         payload = json.dumps({"project_id": project["id"], "risk": risk})
-        messenger_service.post_message(
+        await messenger_service.post_message(
             channel=channel_id,
             text="Review Assumption",
             blocks=ModalFactory.suggested_assumption_blocks(risk, payload),
@@ -1987,18 +2106,18 @@ def process_file_analysis(ack, body, client, logger):  # noqa: ANN001
 
 
 @app.action("accept_suggestion")
-def accept_suggestion(ack, body, client):  # noqa: ANN001
-    ack()
+async def accept_suggestion(ack, body, client):  # noqa: ANN001
+    await ack()
     payload = json.loads(body["actions"][0]["value"])
-    similar_title = db_service.find_similar_assumption(payload["project_id"], payload["risk"])
+    similar_title = await run_db(db_service.find_similar_assumption, payload["project_id"], payload["risk"])
     if similar_title:
-        messenger_service.post_ephemeral(
+        await messenger_service.post_ephemeral(
             channel=body["channel"]["id"],
             user=body["user"]["id"],
             text=f"⚠️ This looks similar to: “{similar_title}”.",
         )
-    db_service.create_assumption(payload["project_id"], {"title": payload["risk"]})
-    messenger_service.post_ephemeral(
+    await run_db(db_service.create_assumption, payload["project_id"], {"title": payload["risk"]})
+    await messenger_service.post_ephemeral(
         channel=body["channel"]["id"],
         user=body["user"]["id"],
         text="✅ Added to your assumption board.",
@@ -2006,9 +2125,9 @@ def accept_suggestion(ack, body, client):  # noqa: ANN001
 
 
 @app.action("reject_suggestion")
-def reject_suggestion(ack, body, client):  # noqa: ANN001
-    ack()
-    client.chat_postEphemeral(
+async def reject_suggestion(ack, body, client):  # noqa: ANN001
+    await ack()
+    await client.chat_postEphemeral(
         channel=body["channel"]["id"],
         user=body["user"]["id"],
         text="Ignored that suggestion.",
@@ -2016,10 +2135,10 @@ def reject_suggestion(ack, body, client):  # noqa: ANN001
 
 
 @app.action("edit_suggestion")
-def edit_suggestion(ack, body, client):  # noqa: ANN001
-    ack()
+async def edit_suggestion(ack, body, client):  # noqa: ANN001
+    await ack()
     payload = body["actions"][0]["value"]
-    client.views_open(
+    await client.views_open(
         trigger_id=body["trigger_id"],
         view={
             "type": "modal",
@@ -2045,31 +2164,31 @@ def edit_suggestion(ack, body, client):  # noqa: ANN001
 
 
 @app.view("edit_suggestion_submit")
-def handle_edit_suggestion_submit(ack, body, client):  # noqa: ANN001
-    ack()
+async def handle_edit_suggestion_submit(ack, body, client):  # noqa: ANN001
+    await ack()
     payload = json.loads(body["view"]["private_metadata"])
     values = body["view"]["state"]["values"]
     risk_text = values["risk_block"]["risk_input"]["value"]
-    similar_title = db_service.find_similar_assumption(payload["project_id"], risk_text)
-    response = client.conversations_open(users=body["user"]["id"])
+    similar_title = await run_db(db_service.find_similar_assumption, payload["project_id"], risk_text)
+    response = await client.conversations_open(users=body["user"]["id"])
     dm_channel = response.get("channel", {}).get("id")
 
     if similar_title and dm_channel:
-        messenger_service.post_ephemeral(
+        await messenger_service.post_ephemeral(
             channel=dm_channel,
             user=body["user"]["id"],
             text=f"⚠️ This looks similar to: “{similar_title}”."
         )
 
-    db_service.create_assumption(payload["project_id"], {"title": risk_text})
+    await run_db(db_service.create_assumption, payload["project_id"], {"title": risk_text})
 
     if dm_channel:
-        client.chat_postMessage(channel=dm_channel, text="✅ Added the edited assumption.")
+        await client.chat_postMessage(channel=dm_channel, text="✅ Added the edited assumption.")
 
 
 @app.view("setup_final_submit")
-def handle_final_setup(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_final_setup(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     try:
         values = body["view"]["state"]["values"]
@@ -2083,26 +2202,28 @@ def handle_final_setup(ack, body, client, logger):  # noqa: ANN001
         created_channel_name = None
 
         if channel_action == "create_new":
-            clean_name = re.sub(r"[^a-z0-9-_]", "", name.lower().replace(" ", "-"))
+            clean_name = CHANNEL_NAME_INVALID_CHARS.sub("", name.lower().replace(" ", "-"))
             channel_name = f"{CHANNEL_PREFIX}{clean_name}"[:80]
             try:
-                c_resp = client.conversations_create(name=channel_name)
+                c_resp = await client.conversations_create(name=channel_name)
                 channel_id = c_resp["channel"]["id"]
                 created_channel_name = c_resp["channel"]["name"]
-                client.conversations_invite(channel=channel_id, users=user_id)
-                client.chat_postMessage(
+                await client.conversations_invite(channel=channel_id, users=user_id)
+                await client.chat_postMessage(
                     channel=channel_id,
                     text=f"👋 Welcome to the home of *{name}*! I'll post updates here.",
                 )
             except SlackApiError as exc:
-                logger.error("Failed to create channel %s: %s", channel_name, exc, exc_info=True)
-                client.chat_postEphemeral(
+                logger.warning("Failed to create channel %s: %s", channel_name, exc.response.get("error"))
+                await client.chat_postEphemeral(
                     user=user_id,
                     channel=user_id,
                     text=f"⚠️ Could not create channel #{channel_name} (it might already exist).",
                 )
 
-        db_service.create_project(
+        # create_project returns the new row; no need to read the active project back.
+        project = await run_db(
+            db_service.create_project,
             user_id,
             name,
             opportunity=problem,
@@ -2112,9 +2233,7 @@ def handle_final_setup(ack, body, client, logger):  # noqa: ANN001
             mission=mission,
             channel_id=channel_id,
         )
-        project = db_service.get_active_project(user_id)
-        if project:
-            _send_new_project_tour(client, user_id, project)
+        await _send_new_project_tour(client, user_id, project.flow_stage)
 
         msg_text = f"🎉 *{name}* is live!"
         if created_channel_name:
@@ -2142,31 +2261,32 @@ def handle_final_setup(ack, body, client, logger):  # noqa: ANN001
             }
         )
 
-        client.chat_postMessage(
+        await client.chat_postMessage(
             channel=user_id,
             blocks=blocks,
             text=msg_text,
         )
-        publish_home_tab_async(client, user_id)
+        await publish_home_tab(client, user_id)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to complete setup: %s", exc, exc_info=True)
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             user=user_id,
             channel=user_id,
             text="Something went wrong creating the project.",
         )
 
 
-def open_assumption_modal(client, trigger_id: str) -> None:
-    client.views_open(
-        trigger_id=trigger_id,
-        view=UIManager.render_create_assumption_modal(),
-    )
+# The blank "New Roadmap Item" modal never changes, so build it once; views_open does not mutate it.
+_NEW_ASSUMPTION_MODAL = UIManager.render_create_assumption_modal()
+
+
+async def open_assumption_modal(client, trigger_id: str) -> None:
+    await client.views_open(trigger_id=trigger_id, view=_NEW_ASSUMPTION_MODAL)
 
 
 @app.action("assumption_category_select")
-def handle_assumption_category_select(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_assumption_category_select(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     try:
         selected_category = body["actions"][0]["selected_option"]["value"]
         view = body.get("view", {})
@@ -2187,12 +2307,12 @@ def handle_assumption_category_select(ack, body, client, logger):  # noqa: ANN00
                 "lane": initial_values["lane"],
                 "status": initial_values["status"],
             }
-            client.views_update(
+            await client.views_update(
                 view_id=view["id"],
                 view=open_log_assumption_modal(ai_data),
             )
         else:
-            client.views_update(
+            await client.views_update(
                 view_id=view["id"],
                 view=UIManager.render_create_assumption_modal(selected_category, initial_values),
             )
@@ -2200,7 +2320,7 @@ def handle_assumption_category_select(ack, body, client, logger):  # noqa: ANN00
         logger.error("Failed to update assumption modal prompts", exc_info=True)
 
 
-def open_edit_assumption_modal(client, trigger_id: str, assumption: dict) -> None:
+async def open_edit_assumption_modal(client, trigger_id: str, assumption: dict) -> None:
     lane_options = [
         {"text": {"type": "plain_text", "text": "Now"}, "value": "Now"},
         {"text": {"type": "plain_text", "text": "Next"}, "value": "Next"},
@@ -2216,7 +2336,7 @@ def open_edit_assumption_modal(client, trigger_id: str, assumption: dict) -> Non
         (option for option in status_options if option["value"] == assumption["validation_status"]),
         None,
     )
-    client.views_open(
+    await client.views_open(
         trigger_id=trigger_id,
         view={
             "type": "modal",
@@ -2272,8 +2392,8 @@ def open_edit_assumption_modal(client, trigger_id: str, assumption: dict) -> Non
     )
 
 
-def open_edit_assumption_text_modal(client, trigger_id: str, assumption: dict) -> None:
-    client.views_open(
+async def open_edit_assumption_text_modal(client, trigger_id: str, assumption: dict) -> None:
+    await client.views_open(
         trigger_id=trigger_id,
         view={
             "type": "modal",
@@ -2301,60 +2421,60 @@ def open_edit_assumption_text_modal(client, trigger_id: str, assumption: dict) -
 
 @app.action("open_create_assumption")
 @app.action("open_add_assumption")
-def open_create_assumption_modal(ack, body, client):  # noqa: ANN001
-    ack()
-    open_assumption_modal(client, body["trigger_id"])
+async def open_create_assumption_modal(ack, body, client):  # noqa: ANN001
+    await ack()
+    await open_assumption_modal(client, body["trigger_id"])
+
+
+_DRIVE_IMPORT_MODAL = {
+    "type": "modal",
+    "callback_id": "drive_import_submit",
+    "title": {"type": "plain_text", "text": "Import from Drive"},
+    "submit": {"type": "plain_text", "text": "Import"},
+    "close": {"type": "plain_text", "text": "Cancel"},
+    "blocks": [
+        {
+            "type": "input",
+            "block_id": "drive_link_block",
+            "label": {"type": "plain_text", "text": "Google Doc Link"},
+            "element": {
+                "type": "plain_text_input",
+                "action_id": "drive_link_input",
+                "placeholder": {"type": "plain_text", "text": "Paste a Google Doc URL"},
+            },
+        }
+    ],
+}
 
 
 @app.action("open_drive_import_modal")
-def open_drive_import_modal(ack, body, client):  # noqa: ANN001
-    ack()
-    client.views_open(
-        trigger_id=body["trigger_id"],
-        view={
-            "type": "modal",
-            "callback_id": "drive_import_submit",
-            "title": {"type": "plain_text", "text": "Import from Drive"},
-            "submit": {"type": "plain_text", "text": "Import"},
-            "close": {"type": "plain_text", "text": "Cancel"},
-            "blocks": [
-                {
-                    "type": "input",
-                    "block_id": "drive_link_block",
-                    "label": {"type": "plain_text", "text": "Google Doc Link"},
-                    "element": {
-                        "type": "plain_text_input",
-                        "action_id": "drive_link_input",
-                        "placeholder": {"type": "plain_text", "text": "Paste a Google Doc URL"},
-                    },
-                }
-            ],
-        },
-    )
+async def open_drive_import_modal(ack, body, client):  # noqa: ANN001
+    await ack()
+    await client.views_open(trigger_id=body["trigger_id"], view=_DRIVE_IMPORT_MODAL)
 
 
 @app.action("open_magic_import_modal")
-def open_magic_import_modal(ack, body, client):  # noqa: ANN001
-    open_drive_import_modal(ack, body, client)
+async def open_magic_import_modal(ack, body, client):  # noqa: ANN001
+    await open_drive_import_modal(ack, body, client)
 
 
 @app.view("drive_import_submit")
-def handle_drive_import_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_drive_import_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
     values = body["view"]["state"]["values"]
     link = values["drive_link_block"]["drive_link_input"]["value"]
     file_id = extract_drive_file_id(link or "")
     if not file_id:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please provide a valid Google Doc link.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please provide a valid Google Doc link.")
         return
-    token_data = db_service.get_google_token(project["id"])
+    token_data = await run_db(db_service.get_google_token, project["id"])
     if not token_data or not token_data.get("access_token"):
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=user_id,
             user=user_id,
             text="Google Drive is not connected. Use the Connect Google Drive button first.",
@@ -2365,9 +2485,10 @@ def handle_drive_import_submit(ack, body, client, logger):  # noqa: ANN001
     token_expiry = token_data.get("token_expiry")
     if refresh_token and google_service.token_is_expired(token_expiry):
         try:
-            refreshed = google_service.refresh_access_token(refresh_token)
+            refreshed = await run_google_call(google_service.refresh_access_token, refresh_token)
             access_token = refreshed.get("access_token", access_token)
-            db_service.update_google_tokens(
+            await run_db(
+                db_service.update_google_tokens,
                 project["id"],
                 access_token,
                 refreshed.get("refresh_token", refresh_token),
@@ -2375,126 +2496,126 @@ def handle_drive_import_submit(ack, body, client, logger):  # noqa: ANN001
             )
         except requests.exceptions.RequestException:
             logger.exception("Failed to refresh Google token")
-            client.chat_postEphemeral(
+            await client.chat_postEphemeral(
                 channel=user_id,
                 user=user_id,
                 text="Failed to refresh Google Drive access. Please reconnect Drive.",
             )
             return
     try:
-        content = google_service.fetch_file_content(file_id, access_token)
+        content = await run_google_call(google_service.fetch_file_content, file_id, access_token)
     except (requests.exceptions.RequestException, ValueError):
         logger.exception("Failed to fetch Drive content")
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=user_id,
             user=user_id,
             text="Unable to fetch that document. Check the link and permissions.",
         )
         return
-    assumptions = ai_extractor.extract_assumptions(content)
-    saved = save_assumptions_from_text(project["id"], assumptions)
-    client.chat_postEphemeral(
+    assumptions = await asyncio.to_thread(ai_extractor.extract_assumptions, content)
+    saved = await run_db(save_assumptions_from_text, project["id"], assumptions)
+    await client.chat_postEphemeral(
         channel=user_id,
         user=user_id,
         text=f"Imported {saved} assumptions from Drive.",
     )
-    publish_home_tab_async(client, user_id, "roadmap:roadmap")
+    await publish_home_tab(client, user_id)
+
+
+_MAGIC_PASTE_MODAL = {
+    "type": "modal",
+    "callback_id": "magic_paste_submit",
+    "title": {"type": "plain_text", "text": "Magic Paste"},
+    "submit": {"type": "plain_text", "text": "Import"},
+    "close": {"type": "plain_text", "text": "Cancel"},
+    "blocks": [
+        {
+            "type": "input",
+            "block_id": "magic_paste_block",
+            "label": {"type": "plain_text", "text": "Paste content"},
+            "element": {
+                "type": "plain_text_input",
+                "action_id": "magic_paste_input",
+                "multiline": True,
+            },
+        }
+    ],
+}
 
 
 @app.action("open_magic_paste_modal")
-def open_magic_paste_modal(ack, body, client):  # noqa: ANN001
-    ack()
-    client.views_open(
-        trigger_id=body["trigger_id"],
-        view={
-            "type": "modal",
-            "callback_id": "magic_paste_submit",
-            "title": {"type": "plain_text", "text": "Magic Paste"},
-            "submit": {"type": "plain_text", "text": "Import"},
-            "close": {"type": "plain_text", "text": "Cancel"},
-            "blocks": [
-                {
-                    "type": "input",
-                    "block_id": "magic_paste_block",
-                    "label": {"type": "plain_text", "text": "Paste content"},
-                    "element": {
-                        "type": "plain_text_input",
-                        "action_id": "magic_paste_input",
-                        "multiline": True,
-                    },
-                }
-            ],
-        },
-    )
+async def open_magic_paste_modal(ack, body, client):  # noqa: ANN001
+    await ack()
+    await client.views_open(trigger_id=body["trigger_id"], view=_MAGIC_PASTE_MODAL)
 
 
 @app.view("magic_paste_submit")
-def handle_magic_paste_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_magic_paste_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
     values = body["view"]["state"]["values"]
     pasted_text = values["magic_paste_block"]["magic_paste_input"]["value"]
     if not pasted_text:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please paste some content to import.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please paste some content to import.")
         return
-    assumptions = ai_extractor.extract_assumptions(pasted_text)
-    saved = save_assumptions_from_text(project["id"], assumptions)
-    client.chat_postEphemeral(
+    assumptions = await asyncio.to_thread(ai_extractor.extract_assumptions, pasted_text)
+    saved = await run_db(save_assumptions_from_text, project["id"], assumptions)
+    await client.chat_postEphemeral(
         channel=user_id,
         user=user_id,
         text=f"Imported {saved} assumptions from your pasted content.",
     )
-    publish_home_tab_async(client, user_id, "roadmap:roadmap")
+    await publish_home_tab(client, user_id)
 
 
 @app.action("edit_assumption")
-def open_edit_assumption(ack, body, client):  # noqa: ANN001
-    ack()
+async def open_edit_assumption(ack, body, client):  # noqa: ANN001
+    await ack()
     assumption_id = int(body["actions"][0]["value"])
-    assumption = db_service.get_assumption(assumption_id)
+    assumption = await run_db(db_service.get_assumption, assumption_id)
     if not assumption:
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=body["user"]["id"],
             user=body["user"]["id"],
             text="That roadmap item could not be found.",
         )
         return
-    open_edit_assumption_modal(client, body["trigger_id"], assumption)
+    await open_edit_assumption_modal(client, body["trigger_id"], assumption)
 
 
 @app.action("edit_assumption_text")
-def open_edit_assumption_text(ack, body, client):  # noqa: ANN001
-    ack()
+async def open_edit_assumption_text(ack, body, client):  # noqa: ANN001
+    await ack()
     assumption_id = int(body["actions"][0]["value"])
-    assumption = db_service.get_assumption(assumption_id)
+    assumption = await run_db(db_service.get_assumption, assumption_id)
     if not assumption:
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=body["user"]["id"],
             user=body["user"]["id"],
             text="That roadmap item could not be found.",
         )
         return
-    open_edit_assumption_text_modal(client, body["trigger_id"], assumption)
+    await open_edit_assumption_text_modal(client, body["trigger_id"], assumption)
 
 
 @app.action("add_canvas_item")
-def open_canvas_item_modal(ack, body, client):  # noqa: ANN001
-    ack()
+async def open_canvas_item_modal(ack, body, client):  # noqa: ANN001
+    await ack()
     section = body["actions"][0]["value"]
-    client.views_open(trigger_id=body["trigger_id"], view=add_canvas_item_modal(section))
+    await client.views_open(trigger_id=body["trigger_id"], view=add_canvas_item_modal(section))
 
 
 @app.action("attach_question_bank")
-def attach_question_bank(ack, body, client):  # noqa: ANN001
-    ack()
+async def attach_question_bank(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     initial_channel = project.get("channel_id") if project else None
-    client.views_open(
+    await client.views_open(
         trigger_id=body["trigger_id"],
         view={
             "type": "modal",
@@ -2543,8 +2664,8 @@ def attach_question_bank(ack, body, client):  # noqa: ANN001
 
 
 @app.view("insert_questions")
-def handle_insert_questions(ack, body, client):  # noqa: ANN001
-    ack()
+async def handle_insert_questions(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     values = body["view"]["state"]["values"]
     method = values.get("method_block", {}).get("method_select", {}).get("selected_option", {}).get("value")
@@ -2552,132 +2673,132 @@ def handle_insert_questions(ack, body, client):  # noqa: ANN001
     questions = toolkit_service.get_question_bank(method)
     questions_text = "\n".join([f"• {question}" for question in questions])
     message = f"📋 *Suggested Questions for {method}:*\n\n{questions_text}"
-    client.chat_postMessage(channel=channel_id, text=message)
+    await client.chat_postMessage(channel=channel_id, text=message)
 
 
 @app.view("add_canvas_item_submit")
-def add_canvas_item_submit(ack, body, client):  # noqa: ANN001
-    ack()
+async def add_canvas_item_submit(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
     section = body["view"]["private_metadata"]
     text = body["view"]["state"]["values"]["canvas_text"]["canvas_input"]["value"]
-    db_service.add_canvas_item(project["id"], section, text, is_ai=False)
-    publish_home_tab_async(client, user_id, "discovery:canvas")
+    await run_db(db_service.add_canvas_item, project["id"], section, text, is_ai=False)
+    await publish_home_tab(client, user_id)
 
 
 @app.action("ai_autofill_canvas")
-def handle_ai_canvas(ack, body, client):  # noqa: ANN001
-    ack()
+async def handle_ai_canvas(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     section = body["actions"][0]["value"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
     channel_id = body.get("channel", {}).get("id", user_id)
-    client.chat_postEphemeral(
+    await client.chat_postEphemeral(
         channel=channel_id,
         user=user_id,
         text=f"🧠 AI is brainstorming for '{section}'...",
     )
     context = f"{project['name']} — {project.get('description', '').strip()}"
 
-    def generate_canvas_item() -> None:
+    async def generate_canvas_item() -> None:
         try:
-            suggestion = ai_service.generate_canvas_suggestion(section, context)
-            db_service.add_canvas_item(project["id"], section, suggestion, is_ai=True)
-            publish_home_tab_async(client, user_id, "discovery:canvas")
+            suggestion = await asyncio.to_thread(ai_service.generate_canvas_suggestion, section, context)
+            await run_db(db_service.add_canvas_item, project["id"], section, suggestion, is_ai=True)
+            await publish_home_tab(client, user_id)
         except Exception:  # noqa: BLE001
             logger.exception("Failed to generate canvas suggestion for %s", user_id)
-            client.chat_postEphemeral(user=user_id, text=f"Sorry, I couldn't generate a suggestion for '{section}'. Please try again.")
+            await client.chat_postEphemeral(user=user_id, text=f"Sorry, I couldn't generate a suggestion for '{section}'. Please try again.")
 
 
 @app.action("change_stage")
-def open_change_stage(ack, body, client):  # noqa: ANN001
-    ack()
-    project = db_service.get_active_project(body["user"]["id"])
+async def open_change_stage(ack, body, client):  # noqa: ANN001
+    await ack()
+    project = await run_db(db_service.get_active_project, body["user"]["id"])
     if not project:
-        client.chat_postEphemeral(channel=body["user"]["id"], user=body["user"]["id"], text="Please create a project first.")
+        await client.chat_postEphemeral(channel=body["user"]["id"], user=body["user"]["id"], text="Please create a project first.")
         return
-    client.views_open(trigger_id=body["trigger_id"], view=change_stage_modal(project["stage"]))
+    await client.views_open(trigger_id=body["trigger_id"], view=change_stage_modal(project["stage"]))
 
 
 @app.view("change_stage_submit")
-def change_stage_submit(ack, body, client):  # noqa: ANN001
-    ack()
+async def change_stage_submit(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
     stage = body["view"]["state"]["values"]["stage_select"]["stage_input"]["selected_option"]["value"]
-    db_service.set_project_stage(project["id"], stage)
-    publish_home_tab_async(client, user_id, "experiments:framework")
+    await run_db(db_service.set_project_stage, project["id"], stage)
+    await publish_home_tab(client, user_id)
 
 
 @app.action("open_invite_member")
-def open_invite_member(ack, body, client):  # noqa: ANN001
-    ack()
-    client.views_open(trigger_id=body["trigger_id"], view=invite_member_modal())
+async def open_invite_member(ack, body, client):  # noqa: ANN001
+    await ack()
+    await client.views_open(trigger_id=body["trigger_id"], view=invite_member_modal())
 
 
 @app.view("invite_member_submit")
-def invite_member_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def invite_member_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     selected_user = body["view"]["state"]["values"]["member_select"]["selected_member"]["selected_user"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
-    added = db_service.add_project_member(project["id"], selected_user)
+    added = await run_db(db_service.add_project_member, project["id"], selected_user)
     if added:
         try:
-            client.chat_postMessage(
+            await client.chat_postMessage(
                 channel=selected_user,
                 text=f"You're now a member of the Evidently project *{project['name']}*.",
             )
         except Exception:  # noqa: BLE001
             logger.debug("Unable to send DM to invited member.", exc_info=True)
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Teammate added to the project.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Teammate added to the project.")
     else:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="That teammate is already in the project.")
-    publish_home_tab_async(client, user_id, "team:decision")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="That teammate is already in the project.")
+    await publish_home_tab(client, user_id)
 
 
 @app.action("open_link_channel")
-def open_link_channel(ack, body, client):  # noqa: ANN001
-    ack()
-    client.views_open(trigger_id=body["trigger_id"], view=link_channel_modal())
+async def open_link_channel(ack, body, client):  # noqa: ANN001
+    await ack()
+    await client.views_open(trigger_id=body["trigger_id"], view=link_channel_modal())
 
 
 @app.view("link_channel_submit")
-def link_channel_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def link_channel_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
     channel_id = body["view"]["state"]["values"]["channel_select"]["selected_channel"]["selected_channel"]
     tabs_state = body["view"]["state"]["values"].get("tab_template", {})
     selected_tabs = [option["value"] for option in tabs_state.get("tab_options", {}).get("selected_options", [])]
 
     try:
-        client.conversations_join(channel=channel_id)
-        info = client.conversations_info(channel=channel_id)
-        channel_name = info["channel"]["name"]
-        db_service.set_project_channel(project["id"], channel_id)
-        apply_channel_template(client, channel_id, selected_tabs)
-        client.chat_postEphemeral(channel=user_id, user=user_id, text=f"Linked #{channel_name} to this project.")
-        publish_home_tab_async(client, user_id, "team:integrations")
+        # conversations.join returns the channel object, so no separate conversations.info call is needed.
+        joined = await client.conversations_join(channel=channel_id)
+        channel_name = joined["channel"]["name"]
+        await run_db(db_service.set_project_channel, project["id"], channel_id)
+        await apply_channel_template(client, channel_id, selected_tabs)
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text=f"Linked #{channel_name} to this project.")
+        await publish_home_tab(client, user_id)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to link channel: %s", exc, exc_info=True)
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Unable to link that channel right now.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Unable to link that channel right now.")
 
 
 def _set_next_active_project(user_id: str, excluded_project_id: int | None = None) -> None:
@@ -2695,14 +2816,14 @@ def _set_next_active_project(user_id: str, excluded_project_id: int | None = Non
 
 @app.action("open_edit_project")
 @app.action("open_edit_project_modal")
-def open_edit_project(ack, body, client):  # noqa: ANN001
-    ack()
+async def open_edit_project(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
-    client.views_open(
+    await client.views_open(
         trigger_id=body["trigger_id"],
         view={
             "type": "modal",
@@ -2747,67 +2868,67 @@ def open_edit_project(ack, body, client):  # noqa: ANN001
     )
 
 
-def _handle_project_management_action(ack, body, client, action_name: str) -> None:  # noqa: ANN001
+async def _handle_project_management_action(ack, body, client, action_name: str) -> None:  # noqa: ANN001
     """Helper to consolidate project management action logic."""
-    ack()
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
 
     if action_name == "archive":
-        db_service.archive_project(project["id"])
+        await run_db(db_service.archive_project, project["id"])
     elif action_name == "leave":
-        member_count = db_service.count_project_members(project["id"])
+        member_count = await run_db(db_service.count_project_members, project["id"])
         if member_count <= 1:
-            db_service.archive_project(project["id"])
-            db_service.leave_project(project["id"], user_id)
+            await run_db(db_service.archive_project, project["id"])
+            await run_db(db_service.leave_project, project["id"], user_id)
         else:
-            db_service.leave_project(project["id"], user_id)
+            await run_db(db_service.leave_project, project["id"], user_id)
     elif action_name == "delete":
-        db_service.delete_project(project["id"])
+        await run_db(db_service.delete_project, project["id"])
 
-    db_service.clear_active_project(user_id)
-    publish_home_tab_hub(client, user_id)
+    await run_db(db_service.clear_active_project, user_id)
+    await publish_home_tab_hub(client, user_id)
 
 
 @app.action("archive_project")
-def archive_project(ack, body, client):  # noqa: ANN001
-    _handle_project_management_action(ack, body, client, "archive")
+async def archive_project(ack, body, client):  # noqa: ANN001
+    await _handle_project_management_action(ack, body, client, "archive")
 
 
 @app.action("leave_project")
-def leave_project(ack, body, client):  # noqa: ANN001
-    _handle_project_management_action(ack, body, client, "leave")
+async def leave_project(ack, body, client):  # noqa: ANN001
+    await _handle_project_management_action(ack, body, client, "leave")
 
 
 @app.action("delete_project_confirm")
-def delete_project_confirm(ack, body, client):  # noqa: ANN001
-    _handle_project_management_action(ack, body, client, "delete")
+async def delete_project_confirm(ack, body, client):  # noqa: ANN001
+    await _handle_project_management_action(ack, body, client, "delete")
 
 
 @app.view("edit_project_submit")
-def handle_edit_project_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_edit_project_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
     try:
         values = body["view"]["state"]["values"]
         name = values["name_block"]["name_input"]["value"]
         description = values["description_block"]["description_input"]["value"]
         mission = values["mission_block"]["mission_input"]["value"]
-        db_service.update_project_details(project["id"], name, description, mission)
-        publish_home_tab_async(client, user_id)
+        await run_db(db_service.update_project_details, project["id"], name, description, mission)
+        await publish_home_tab(client, user_id)
     except Exception:  # noqa: BLE001
         logger.error("Failed to update project details", exc_info=True)
 
 
 @app.view("edit_project_submission")
-def handle_edit_project_submission(ack, body, client, logger):  # noqa: ANN001
+async def handle_edit_project_submission(ack, body, client, logger):  # noqa: ANN001
     user_id = body["user"]["id"]
     project_id = None
     try:
@@ -2815,90 +2936,94 @@ def handle_edit_project_submission(ack, body, client, logger):  # noqa: ANN001
     except ValueError:
         project_id = None
     if not project_id:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Unable to locate that project.")
-        ack()
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Unable to locate that project.")
+        await ack()
         return
     try:
         values = body["view"]["state"]["values"]
         name = values["name_block"]["name_input"]["value"]
         description = values["description_block"]["description_input"]["value"]
         mission = values["mission_block"]["mission_input"]["value"]
-        db_service.update_project(project_id, {"name": name, "mission": mission, "description": description})
-        publish_home_tab_async(client, user_id, "overview")
+        await run_db(
+            db_service.update_project, project_id, {"name": name, "mission": mission, "description": description}
+        )
+        await publish_home_tab(client, user_id)
     except Exception:  # noqa: BLE001
         logger.error("Failed to update project details", exc_info=True)
-    ack()
+    await ack()
 
 
 @app.view("magic_import_submission")
-def handle_magic_import_submission(ack, body, client, logger):  # noqa: ANN001
+async def handle_magic_import_submission(ack, body, client, logger):  # noqa: ANN001
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
-        ack()
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await ack()
         return
     try:
         values = body["view"]["state"]["values"]
         text_input = values["magic_import_block"]["magic_import_input"]["value"]
     except KeyError:
         logger.error("Magic import submission missing expected input fields.")
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please provide text to import.")
-        ack()
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please provide text to import.")
+        await ack()
         return
     try:
-        assumptions = ai_service.extract_assumptions(text_input)
-        saved = save_assumptions_from_text(project["id"], assumptions)
-        client.chat_postEphemeral(
+        assumptions = await asyncio.to_thread(ai_service.extract_assumptions, text_input)
+        saved = await run_db(save_assumptions_from_text, project["id"], assumptions)
+        await client.chat_postEphemeral(
             channel=user_id,
             user=user_id,
             text=f"Imported {saved} assumptions from the magic import.",
         )
-        publish_home_tab_async(client, user_id, "roadmap:roadmap")
+        await publish_home_tab(client, user_id)
     except Exception:  # noqa: BLE001
         logger.error("Failed to import assumptions from magic import", exc_info=True)
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Magic import failed. Please try again.")
-    ack()
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Magic import failed. Please try again.")
+    await ack()
 
 
 @app.view("invite_member_submission")
-def handle_invite_member_submission(ack, body, client, logger):  # noqa: ANN001
+async def handle_invite_member_submission(ack, body, client, logger):  # noqa: ANN001
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
-        ack()
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await ack()
         return
     selected_user = body["view"]["state"]["values"]["member_select"]["selected_member"]["selected_user"]
     try:
-        added = db_service.add_project_member(project["id"], selected_user)
+        added = await run_db(db_service.add_project_member, project["id"], selected_user)
         if added:
             try:
-                client.chat_postMessage(
+                await client.chat_postMessage(
                     channel=selected_user,
                     text=f"You're now a member of the Evidently project *{project['name']}*.",
                 )
             except Exception:  # noqa: BLE001
                 logger.debug("Unable to send DM to invited member.", exc_info=True)
-            client.chat_postEphemeral(channel=user_id, user=user_id, text="Teammate added to the project.")
+            await client.chat_postEphemeral(channel=user_id, user=user_id, text="Teammate added to the project.")
         else:
-            client.chat_postEphemeral(channel=user_id, user=user_id, text="That teammate is already in the project.")
-        publish_home_tab_async(client, user_id, "team:decision")
+            await client.chat_postEphemeral(
+                channel=user_id, user=user_id, text="That teammate is already in the project."
+            )
+        await publish_home_tab(client, user_id)
     except Exception:  # noqa: BLE001
         logger.error("Failed to add project member", exc_info=True)
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Unable to add that teammate right now.")
-    ack()
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Unable to add that teammate right now.")
+    await ack()
 
 
 @app.action("confirm_archive_project")
-def confirm_archive_project(ack, body, client):  # noqa: ANN001
-    ack()
+async def confirm_archive_project(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
-    client.views_open(
+    await client.views_open(
         trigger_id=body["trigger_id"],
         view={
             "type": "modal",
@@ -2921,27 +3046,27 @@ def confirm_archive_project(ack, body, client):  # noqa: ANN001
 
 
 @app.view("archive_project_submit")
-def handle_archive_project_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_archive_project_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     try:
         project_id = int(body["view"]["private_metadata"])
-        db_service.archive_project(project_id)
-        _set_next_active_project(user_id, excluded_project_id=project_id)
-        publish_home_tab_async(client, user_id)
+        await run_db(db_service.archive_project, project_id)
+        await run_db(_set_next_active_project, user_id, excluded_project_id=project_id)
+        await publish_home_tab(client, user_id)
     except Exception:  # noqa: BLE001
         logger.error("Failed to archive project", exc_info=True)
 
 
 @app.action("confirm_delete_project")
-def confirm_delete_project(ack, body, client):  # noqa: ANN001
-    ack()
+async def confirm_delete_project(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
-    client.views_open(
+    await client.views_open(
         trigger_id=body["trigger_id"],
         view={
             "type": "modal",
@@ -2964,84 +3089,84 @@ def confirm_delete_project(ack, body, client):  # noqa: ANN001
 
 
 @app.view("delete_project_submit")
-def handle_delete_project_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_delete_project_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     try:
         project_id = int(body["view"]["private_metadata"])
-        db_service.delete_project(project_id)
-        db_service.clear_active_project(user_id)
-        publish_home_tab_async(client, user_id)
+        await run_db(db_service.delete_project, project_id)
+        await run_db(db_service.clear_active_project, user_id)
+        await publish_home_tab(client, user_id)
     except Exception:  # noqa: BLE001
         logger.error("Failed to delete project", exc_info=True)
 
 
 @app.action("open_create_channel")
-def open_create_channel(ack, body, client):  # noqa: ANN001
-    ack()
+async def open_create_channel(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
-    client.views_open(trigger_id=body["trigger_id"], view=create_channel_modal(project["name"]))
+    await client.views_open(trigger_id=body["trigger_id"], view=create_channel_modal(project["name"]))
 
 
 @app.action("channel_action")
-def handle_channel_action(ack):  # noqa: ANN001
-    ack()
+async def handle_channel_action(ack):  # noqa: ANN001
+    await ack()
 
 
 @app.view("create_channel_submit")
-def create_channel_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def create_channel_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
     values = body["view"]["state"]["values"]
     channel_name = values["channel_name"]["channel_input"]["value"].strip().lower().replace(" ", "-")
-    channel_name = re.sub(r"[^a-z0-9-_]", "", channel_name)
+    channel_name = CHANNEL_NAME_INVALID_CHARS.sub("", channel_name)
     members = values.get("member_select", {}).get("selected_members", {}).get("selected_users") or []
     tabs_state = values.get("tab_template", {})
     selected_tabs = [option["value"] for option in tabs_state.get("tab_options", {}).get("selected_options", [])]
 
     try:
-        create_response = client.conversations_create(name=channel_name)
+        create_response = await client.conversations_create(name=channel_name)
         channel_id = create_response["channel"]["id"]
-        client.conversations_join(channel=channel_id)
+        # The bot created the channel, so it is already a member; no conversations.join needed.
         if members:
-            client.conversations_invite(channel=channel_id, users=",".join(members))
-        db_service.set_project_channel(project["id"], channel_id)
-        apply_channel_template(client, channel_id, selected_tabs)
-        client.chat_postMessage(
+            await client.conversations_invite(channel=channel_id, users=",".join(members))
+        await run_db(db_service.set_project_channel, project["id"], channel_id)
+        await apply_channel_template(client, channel_id, selected_tabs)
+        await client.chat_postMessage(
             channel=channel_id,
             text=f"Welcome to *{project['name']}*! This channel is now linked to the Evidently project.",
         )
-        client.chat_postEphemeral(channel=user_id, user=user_id, text=f"Created and linked #{channel_name}.")
-        publish_home_tab_async(client, user_id, "team:integrations")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text=f"Created and linked #{channel_name}.")
+        await publish_home_tab(client, user_id)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to create channel: %s", exc, exc_info=True)
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Unable to create that channel right now.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Unable to create that channel right now.")
 
 
 @app.action("open_extract_insights")
-def open_extract_insights(ack, body, client):  # noqa: ANN001
-    ack()
-    client.views_open(trigger_id=body["trigger_id"], view=extract_insights_modal())
+async def open_extract_insights(ack, body, client):  # noqa: ANN001
+    await ack()
+    await client.views_open(trigger_id=body["trigger_id"], view=extract_insights_modal())
 
 
 @app.view("extract_insights_submit")
-def extract_insights_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def extract_insights_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     values = body["view"]["state"]["values"]
     channel_id = values["channel_select"]["channel_input"]["selected_channel"]
     message_link = values.get("message_link", {}).get("message_input", {}).get("value")
     if message_link:
         link_channel, ts = parse_message_link(message_link)
         if not link_channel or not ts:
-            client.chat_postEphemeral(
+            await client.chat_postEphemeral(
                 channel=body["user"]["id"],
                 user=body["user"]["id"],
                 text="That message link does not look valid. Try copying it again.",
@@ -3049,9 +3174,9 @@ def extract_insights_submit(ack, body, client, logger):  # noqa: ANN001
             return
         channel_id = link_channel
     else:
-        history = client.conversations_history(channel=channel_id, limit=1)
+        history = await client.conversations_history(channel=channel_id, limit=1)
         if not history.get("messages"):
-            client.chat_postEphemeral(
+            await client.chat_postEphemeral(
                 channel=body["user"]["id"],
                 user=body["user"]["id"],
                 text="No recent messages found in that channel.",
@@ -3059,7 +3184,7 @@ def extract_insights_submit(ack, body, client, logger):  # noqa: ANN001
             return
         ts = history["messages"][0]["ts"]
 
-    run_thread_analysis(client, channel_id, ts, logger)
+    await run_thread_analysis(client, channel_id, ts, logger)
 
 
 def _get_integration_modal_config(integration_type: str) -> tuple[str, str]:
@@ -3072,7 +3197,7 @@ def _get_integration_modal_config(integration_type: str) -> tuple[str, str]:
     return "Integration", "External URL or ID"
 
 
-def _open_integration_modal(client, trigger_id: str, project: dict[str, Any], integration_type: str) -> None:
+async def _open_integration_modal(client, trigger_id: str, project: dict[str, Any], integration_type: str) -> None:
     title, label = _get_integration_modal_config(integration_type)
     integrations = project.get("integrations") or {}
     existing_value = None
@@ -3087,7 +3212,7 @@ def _open_integration_modal(client, trigger_id: str, project: dict[str, Any], in
     if existing_value:
         element["initial_value"] = existing_value
 
-    client.views_open(
+    await client.views_open(
         trigger_id=trigger_id,
         view={
             "type": "modal",
@@ -3109,44 +3234,44 @@ def _open_integration_modal(client, trigger_id: str, project: dict[str, Any], in
 
 
 @app.action("open_integration_modal_drive")
-def open_integration_modal_drive(ack, body, client):  # noqa: ANN001
-    ack()
+async def open_integration_modal_drive(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
-    _open_integration_modal(client, body["trigger_id"], project, "drive")
+    await _open_integration_modal(client, body["trigger_id"], project, "drive")
 
 
 @app.action("connect_google_drive")
-def connect_google_drive(ack, body, client):  # noqa: ANN001
-    ack()
-    _send_google_auth_link(body["user"]["id"], client)
+async def connect_google_drive(ack, body, client):  # noqa: ANN001
+    await ack()
+    await _send_google_auth_link(body["user"]["id"], client)
 
 
 @app.action("start_google_auth")
-def start_google_auth(ack, body, client):  # noqa: ANN001
-    ack()
-    _send_google_auth_link(body["user"]["id"], client)
+async def start_google_auth(ack, body, client):  # noqa: ANN001
+    await ack()
+    await _send_google_auth_link(body["user"]["id"], client)
 
 
-def _send_google_auth_link(user_id: str, client) -> None:  # noqa: ANN001
-    project = db_service.get_active_project(user_id)
+async def _send_google_auth_link(user_id: str, client) -> None:  # noqa: ANN001
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
     try:
-        state = db_service.create_oauth_state(user_id, project["id"])
+        state = await run_db(db_service.create_oauth_state, user_id, project["id"])
         auth_url = google_service.get_auth_url(state)
     except ValueError:
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=user_id,
             user=user_id,
             text="Google OAuth is not configured. Set GOOGLE_CLIENT_ID/SECRET and GOOGLE_REDIRECT_URI.",
         )
         return
-    client.chat_postEphemeral(
+    await client.chat_postEphemeral(
         channel=user_id,
         user=user_id,
         text=f"Connect your Google Drive here: {auth_url}",
@@ -3154,30 +3279,30 @@ def _send_google_auth_link(user_id: str, client) -> None:  # noqa: ANN001
 
 
 @app.action("open_integration_modal_asana")
-def open_integration_modal_asana(ack, body, client):  # noqa: ANN001
-    ack()
+async def open_integration_modal_asana(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
-    _open_integration_modal(client, body["trigger_id"], project, "asana")
+    await _open_integration_modal(client, body["trigger_id"], project, "asana")
 
 
 @app.action("open_integration_modal_miro")
-def open_integration_modal_miro(ack, body, client):  # noqa: ANN001
-    ack()
+async def open_integration_modal_miro(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
-    _open_integration_modal(client, body["trigger_id"], project, "miro")
+    await _open_integration_modal(client, body["trigger_id"], project, "miro")
 
 
 @app.view("integration_modal_submit")
-def handle_integration_modal_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_integration_modal_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     try:
         metadata = json.loads(body["view"]["private_metadata"] or "{}")
@@ -3186,78 +3311,82 @@ def handle_integration_modal_submit(ack, body, client, logger):  # noqa: ANN001
         values = body["view"]["state"]["values"]
         external_id = values["integration_block"]["integration_value"].get("value") or None
         if integration_type and project_id:
-            db_service.add_integration_link(project_id, integration_type, external_id)
-        publish_home_tab_async(client, user_id, "team:integrations")
+            await run_db(db_service.add_integration_link, project_id, integration_type, external_id)
+        await publish_home_tab(client, user_id)
     except (json.JSONDecodeError, ValueError, SQLAlchemyError):
         logger.exception("Failed to update integration settings")
 
 
 @app.action("connect_drive")
-def connect_drive(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def connect_drive(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
-    folder = integration_service.create_drive_folder(project["name"])
+    folder = await run_google_call(integration_service.create_drive_folder, project["name"])
     if folder.get("error"):
-        client.chat_postEphemeral(channel=user_id, user=user_id, text=folder["error"])
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text=folder["error"])
         return
-    db_service.add_integration_link(project["id"], "drive", folder["id"])
-    client.chat_postEphemeral(
+    await run_db(db_service.add_integration_link, project["id"], "drive", folder["id"])
+    await client.chat_postEphemeral(
         channel=user_id,
         user=user_id,
         text=f"Drive folder created: {folder['link']}",
     )
-    publish_home_tab_async(client, user_id, "team:integrations")
+    await publish_home_tab(client, user_id)
 
 
 @app.action("connect_asana")
-def connect_asana(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def connect_asana(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
     if not Config.ASANA_WORKSPACE_ID:
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=user_id,
             user=user_id,
             text="Asana workspace ID is missing. Set ASANA_WORKSPACE_ID to enable this.",
         )
         return
-    asana_project = integration_service.create_asana_project(project["name"], Config.ASANA_WORKSPACE_ID)
+    asana_project = await asyncio.to_thread(
+        integration_service.create_asana_project, project["name"], Config.ASANA_WORKSPACE_ID
+    )
     if asana_project.get("error"):
-        client.chat_postEphemeral(channel=user_id, user=user_id, text=asana_project["error"])
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text=asana_project["error"])
         return
-    db_service.add_integration_link(project["id"], "asana", asana_project["id"])
-    client.chat_postEphemeral(
+    await run_db(db_service.add_integration_link, project["id"], "asana", asana_project["id"])
+    await client.chat_postEphemeral(
         channel=user_id,
         user=user_id,
         text=f"Asana project created: {asana_project['link']}",
     )
-    publish_home_tab_async(client, user_id, "team:integrations")
+    await publish_home_tab(client, user_id)
 
 
-def check_asana_alignment(project: dict, channel_id: str, client) -> None:  # noqa: ANN001
+async def check_asana_alignment(project: dict, channel_id: str, client) -> None:  # noqa: ANN001
     integrations = project.get("integrations", {})
     asana_project_id = integrations.get("asana", {}).get("project_id")
     if not asana_project_id:
-        client.chat_postMessage(channel=channel_id, text="Asana is not connected for this project.")
+        await client.chat_postMessage(channel=channel_id, text="Asana is not connected for this project.")
         return
 
-    tasks_response = integration_service.get_asana_tasks(asana_project_id)
+    tasks_response = await asyncio.to_thread(integration_service.get_asana_tasks, asana_project_id)
     if tasks_response.get("error"):
-        client.chat_postMessage(channel=channel_id, text=tasks_response["error"])
+        await client.chat_postMessage(channel=channel_id, text=tasks_response["error"])
         return
     task_names = [task.get("name", "") for task in tasks_response.get("tasks", [])]
 
-    history = client.conversations_history(channel=channel_id, limit=50)
+    history = await client.conversations_history(channel=channel_id, limit=50)
     messages = history.get("messages", [])
     conversation_text = "\n".join([message.get("text", "") for message in messages if message.get("text")])
-    action_items = ai_service.extract_action_items(conversation_text) if conversation_text else []
+    action_items = []
+    if conversation_text:
+        action_items = await asyncio.to_thread(ai_service.extract_action_items, conversation_text)
 
     missing_items = []
     for item in action_items:
@@ -3265,7 +3394,7 @@ def check_asana_alignment(project: dict, channel_id: str, client) -> None:  # no
             missing_items.append(item)
 
     if not missing_items:
-        client.chat_postMessage(
+        await client.chat_postMessage(
             channel=channel_id,
             text="✅ Asana looks aligned with recent chat.",
         )
@@ -3279,7 +3408,7 @@ def check_asana_alignment(project: dict, channel_id: str, client) -> None:  # no
         for item in missing_items
     ]
     payload = json.dumps({"project_id": project["id"], "items": missing_items})
-    client.chat_postMessage(
+    await client.chat_postMessage(
         channel=channel_id,
         text="📋 Project Alignment Check",
         blocks=[
@@ -3308,24 +3437,24 @@ def check_asana_alignment(project: dict, channel_id: str, client) -> None:  # no
 
 
 @app.command("/evidently-asana-check")
-def handle_asana_check_command(ack, body, client):  # noqa: ANN001
-    ack()
+async def handle_asana_check_command(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user_id"]
     channel_id = body["channel_id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=channel_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=channel_id, user=user_id, text="Please create a project first.")
         return
-    check_asana_alignment(project, channel_id, client)
+    await check_asana_alignment(project, channel_id, client)
 
 
 @app.action("bulk_sync_asana")
-def handle_bulk_sync_asana(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_bulk_sync_asana(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     payload = json.loads(body["actions"][0]["value"])
-    project = db_service.get_project(payload["project_id"])
+    project = await run_db(db_service.get_project, payload["project_id"])
     if not project:
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=body["channel"]["id"],
             user=body["user"]["id"],
             text="Project not found.",
@@ -3334,13 +3463,14 @@ def handle_bulk_sync_asana(ack, body, client, logger):  # noqa: ANN001
 
     synced = 0
     for item in payload.get("items", []):
-        asana_task = integration_service.create_asana_task(
+        asana_task = await asyncio.to_thread(
+            integration_service.create_asana_task,
             project_name=project["name"],
             task_name=item,
             description=f"Auto-synced from Slack: {item}",
         )
         if asana_task.get("error"):
-            client.chat_postEphemeral(
+            await client.chat_postEphemeral(
                 channel=body["channel"]["id"],
                 user=body["user"]["id"],
                 text=asana_task["error"],
@@ -3349,7 +3479,7 @@ def handle_bulk_sync_asana(ack, body, client, logger):  # noqa: ANN001
         if asana_task.get("link"):
             synced += 1
 
-    client.chat_postEphemeral(
+    await client.chat_postEphemeral(
         channel=body["channel"]["id"],
         user=body["user"]["id"],
         text=f"✅ Synced {synced} items to Asana.",
@@ -3357,39 +3487,43 @@ def handle_bulk_sync_asana(ack, body, client, logger):  # noqa: ANN001
 
 
 @app.action("export_report")
-def handle_export_report(ack, body, client):  # noqa: ANN001
-    ack()
-    _run_export_report(body, client)
+async def handle_export_report(ack, body, client):  # noqa: ANN001
+    await ack()
+    await _run_export_report(body, client)
 
 
 @app.action("export_report_footer")
-def handle_export_report_footer(ack, body, client):  # noqa: ANN001
-    ack()
-    _run_export_report(body, client)
+async def handle_export_report_footer(ack, body, client):  # noqa: ANN001
+    await ack()
+    await _run_export_report(body, client)
 
 
-def _run_export_report(body, client) -> None:  # noqa: ANN001
+async def _run_export_report(body, client) -> None:  # noqa: ANN001
     action_value = body["actions"][0].get("value", "pdf")
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
     if action_value == "csv":
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=user_id,
             user=user_id,
             text="📤 Generating CSV export... please wait.",
         )
         assumptions = project.get("assumptions", [])
-        df = pd.DataFrame(assumptions)
-        df = df.reindex(columns=["id", "title", "lane", "validation_status", "confidence_score"])
-        buffer = io.BytesIO()
-        buffer.write(df.to_csv(index=False).encode("utf-8"))
-        buffer.seek(0)
-        response = client.conversations_open(users=user_id)
+        text_buffer = io.StringIO()
+        writer = csv.DictWriter(
+            text_buffer,
+            fieldnames=["id", "title", "lane", "validation_status", "confidence_score"],
+            extrasaction="ignore",
+        )
+        writer.writeheader()
+        writer.writerows(assumptions)
+        csv_bytes = text_buffer.getvalue().encode("utf-8")
+        response = await client.conversations_open(users=user_id)
         if not response.get("ok"):
-            client.chat_postEphemeral(
+            await client.chat_postEphemeral(
                 channel=user_id,
                 user=user_id,
                 text=(
@@ -3399,26 +3533,30 @@ def _run_export_report(body, client) -> None:  # noqa: ANN001
             )
             return
         dm_channel = response["channel"]["id"]
-        client.files_upload_v2(
+        await client.files_upload_v2(
             channel=dm_channel,
-            file=buffer,
+            file=csv_bytes,
             filename=f"{project['name'].lower().replace(' ', '-')}-assumptions.csv",
             title="Evidently Assumptions Export",
             initial_comment="Here is your assumptions export. 💾",
         )
         return
-    client.chat_postEphemeral(
+    await client.chat_postEphemeral(
         channel=user_id,
         user=user_id,
         text="📄 Generating PDF report... please wait.",
     )
+    # reportlab is only needed for this export; importing it here keeps it off the cold-start path.
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
     buffer = io.BytesIO()
     pdf = canvas.Canvas(buffer, pagesize=letter)
     pdf.setFont("Helvetica-Bold", 16)
     pdf.drawString(72, 750, f"Learning Report: {project['name']}")
     pdf.setFont("Helvetica", 12)
     y_position = 720
-    metrics = db_service.get_metrics(project["id"])
+    metrics = await run_db(db_service.get_metrics, project["id"])
     pdf.drawString(72, y_position, "Summary Metrics")
     y_position -= 18
     pdf.drawString(90, y_position, f"Experiments Run: {metrics['experiments']}")
@@ -3429,7 +3567,7 @@ def _run_export_report(body, client) -> None:  # noqa: ANN001
     y_position -= 24
     pdf.drawString(72, y_position, "Recent Experiments")
     y_position -= 18
-    experiments = db_service.get_experiments(project["id"])
+    experiments = await run_db(db_service.get_experiments, project["id"])
     if not experiments:
         pdf.drawString(90, y_position, "No experiments logged yet.")
     else:
@@ -3444,16 +3582,16 @@ def _run_export_report(body, client) -> None:  # noqa: ANN001
             y_position -= 16
     pdf.save()
     buffer.seek(0)
-    response = client.conversations_open(users=user_id)
+    response = await client.conversations_open(users=user_id)
     if not response.get("ok"):
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=user_id,
             user=user_id,
             text=f"Could not open a direct message to send the report. Error: {response.get('error', 'Unknown error')}",
         )
         return
     dm_channel = response["channel"]["id"]
-    client.files_upload_v2(
+    await client.files_upload_v2(
         channel=dm_channel,
         file=buffer,
         filename=f"{project['name'].lower().replace(' ', '-')}-report.pdf",
@@ -3463,15 +3601,17 @@ def _run_export_report(body, client) -> None:  # noqa: ANN001
 
 
 @app.action("broadcast_update")
-def handle_broadcast_update(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_broadcast_update(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=body["channel"]["id"], user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(
+            channel=body["channel"]["id"], user=user_id, text="Please create a project first."
+        )
         return
 
-    metrics = db_service.get_metrics(project["id"])
+    metrics = await run_db(db_service.get_metrics, project["id"])
     leadership_channel = Config.LEADERSHIP_CHANNEL
     blocks = [
         {
@@ -3508,15 +3648,15 @@ def handle_broadcast_update(ack, body, client, logger):  # noqa: ANN001
     ]
 
     try:
-        client.chat_postMessage(channel=leadership_channel, blocks=blocks)
-        client.chat_postEphemeral(
+        await client.chat_postMessage(channel=leadership_channel, blocks=blocks)
+        await client.chat_postEphemeral(
             channel=body["channel"]["id"],
             user=user_id,
             text=f"✅ Update posted to {leadership_channel}",
         )
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to broadcast update", exc_info=True)
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=body["channel"]["id"],
             user=user_id,
             text=f"❌ Could not post to leadership channel: {exc}",
@@ -3524,19 +3664,19 @@ def handle_broadcast_update(ack, body, client, logger):  # noqa: ANN001
 
 
 @app.view("create_assumption_submit")
-def handle_create_assumption(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_create_assumption(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     try:
         values = body["view"]["state"]["values"]
-        project = db_service.get_active_project(user_id)
+        project = await run_db(db_service.get_active_project, user_id)
         if not project:
-            client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+            await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
             return
 
         if "assumption_text" in values:
             raw_text = values["assumption_text"]["assumption_text_input"]["value"]
-            extraction = ai_service.extract_structured_assumption(raw_text)
+            extraction = await asyncio.to_thread(ai_service.extract_structured_assumption, raw_text)
             if extraction.get("error"):
                 extraction = {
                     "title": raw_text.strip(),
@@ -3553,20 +3693,17 @@ def handle_create_assumption(ack, body, client, logger):  # noqa: ANN001
                 framework,
             )
             sub_category = str(extracted_sub_category).strip() if extracted_sub_category else "General"
-            confidence_value = extraction.get("estimated_confidence_score", 0)
-            try:
-                confidence_score = int(confidence_value)
-            except (TypeError, ValueError):
-                confidence_score = 0
-            confidence_score = max(0, min(5, confidence_score))
-            similar_title = db_service.find_similar_assumption(project["id"], title)
+            # AiService already coerces and clamps this to 0-5; the fallback above uses 0.
+            confidence_score = extraction.get("estimated_confidence_score", 0)
+            similar_title = await run_db(db_service.find_similar_assumption, project["id"], title)
             if similar_title:
-                messenger_service.post_ephemeral(
+                await messenger_service.post_ephemeral(
                     channel=user_id,
                     user=user_id,
                     text=f"⚠️ This looks similar to an existing assumption: “{similar_title}”.",
                 )
-            db_service.create_assumption(
+            await run_db(
+                db_service.create_assumption,
                 project_id=project["id"],
                 data={
                     "title": title,
@@ -3578,7 +3715,7 @@ def handle_create_assumption(ack, body, client, logger):  # noqa: ANN001
             )
             category_label = str(category).split(". ", 1)[-1].title()
             sub_category_label = str(sub_category).strip().title()
-            messenger_service.post_ephemeral(
+            await messenger_service.post_ephemeral(
                 channel=user_id,
                 user=user_id,
                 text=(
@@ -3598,15 +3735,16 @@ def handle_create_assumption(ack, body, client, logger):  # noqa: ANN001
             except (ValueError, TypeError):
                 density = 0
 
-            similar_title = db_service.find_similar_assumption(project["id"], title)
+            similar_title = await run_db(db_service.find_similar_assumption, project["id"], title)
             if similar_title:
-                messenger_service.post_ephemeral(
+                await messenger_service.post_ephemeral(
                     channel=user_id,
                     user=user_id,
                     text=f"⚠️ This looks similar to an existing assumption: “{similar_title}”.",
                 )
 
-            db_service.create_assumption(
+            await run_db(
+                db_service.create_assumption,
                 project_id=project["id"],
                 data={
                     "title": title,
@@ -3619,14 +3757,14 @@ def handle_create_assumption(ack, body, client, logger):  # noqa: ANN001
                     "owner_id": user_id,
                 },
             )
-        publish_home_tab_async(client, user_id, "roadmap:roadmap")
+        await publish_home_tab(client, user_id)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to create assumption: %s", exc, exc_info=True)
 
 
 @app.view("edit_assumption_submit")
-def handle_edit_assumption_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_edit_assumption_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     assumption_id = int(body["view"]["private_metadata"])
     try:
@@ -3640,7 +3778,8 @@ def handle_edit_assumption_submit(ack, body, client, logger):  # noqa: ANN001
         except (ValueError, TypeError):
             density = 0
 
-        db_service.update_assumption(
+        await run_db(
+            db_service.update_assumption,
             assumption_id,
             {
                 "title": title,
@@ -3649,33 +3788,31 @@ def handle_edit_assumption_submit(ack, body, client, logger):  # noqa: ANN001
                 "evidence_density": density,
             },
         )
-        publish_home_tab_async(client, user_id, "roadmap:roadmap")
+        await publish_home_tab(client, user_id)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to update assumption: %s", exc, exc_info=True)
 
 
 @app.view("edit_assumption_text_submit")
-def handle_edit_assumption_text_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_edit_assumption_text_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     assumption_id = int(body["view"]["private_metadata"])
     try:
         values = body["view"]["state"]["values"]
         title = values["assumption_text"]["text_input"]["value"]
-        db_service.update_assumption_title(assumption_id, title)
-        publish_home_tab_async(client, user_id, "roadmap:roadmap")
+        await run_db(db_service.update_assumption_title, assumption_id, title)
+        await publish_home_tab(client, user_id)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to update assumption text: %s", exc, exc_info=True)
 
 
 @app.action("design_experiment")
-def open_experiment_browser(ack, body, client):  # noqa: ANN001
-    ack()
-    value = body["actions"][0]["value"]
-    if ":" in value:
-        assumption_id, category = value.split(":", 1)
-    else:
-        assumption_id, category = value, "desirability"
+async def open_experiment_browser(ack, body, client):  # noqa: ANN001
+    await ack()
+    assumption_id, separator, category = body["actions"][0]["value"].partition(":")
+    if not separator:
+        category = "desirability"
     recommendations = playbook.get_recommendations(category)
 
     blocks = [
@@ -3709,7 +3846,7 @@ def open_experiment_browser(ack, body, client):  # noqa: ANN001
             )
             blocks.append(NestaUI.divider())
 
-    client.views_open(
+    await client.views_open(
         trigger_id=body["trigger_id"],
         view={
             "type": "modal",
@@ -3720,57 +3857,48 @@ def open_experiment_browser(ack, body, client):  # noqa: ANN001
 
 
 @app.action("confirm_experiment_method")
-def confirm_experiment_method(ack, body, client):  # noqa: ANN001
-    ack()
-    assumption_id, method_id = body["actions"][0]["value"].split(":")
+async def confirm_experiment_method(ack, body, client):  # noqa: ANN001
+    await ack()
+    assumption_id, _, method_id = body["actions"][0]["value"].partition(":")
     method = playbook.get_method_details(method_id)
     method_name = method["name"] if method else method_id
-    client.chat_postEphemeral(
+    await client.chat_postEphemeral(
         channel=body["user"]["id"],
         user=body["user"]["id"],
         text=f"✅ Selected {method_name} for assumption {assumption_id}.",
     )
 
     tip = playbook.get_random_tip()
-    client.chat_postMessage(
+    await client.chat_postMessage(
         channel=body["user"]["id"],
         blocks=[NestaUI.tip_panel(tip)],
         text=f"Nesta tip: {tip}",
     )
 
 
+_AI_SUGGESTIONS_LOADING_VIEW = {
+    "type": "modal",
+    "title": {"type": "plain_text", "text": "AI Suggestions"},
+    "close": {"type": "plain_text", "text": "Close"},
+    "blocks": [{"type": "section", "text": {"type": "mrkdwn", "text": "AI is drafting experiment suggestions..."}}],
+}
+
+
 @app.action("ai_recommend_experiments")
-def handle_ai_experiments(ack, body, client):  # noqa: ANN001
-    ack()
+async def handle_ai_experiments(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
-    project = db_service.get_active_project(user_id)
+    project = await run_db(db_service.get_active_project, user_id)
     if not project:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
         return
     context = f"Project: {project['name']}\nStage: {project['stage']}\nCanvas: {project.get('canvas_items', [])}"
 
-    loading_blocks = [
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": "AI is drafting experiment suggestions...",
-            },
-        }
-    ]
-    response = client.views_open(
-        trigger_id=body["trigger_id"],
-        view={
-            "type": "modal",
-            "title": {"type": "plain_text", "text": "AI Suggestions"},
-            "close": {"type": "plain_text", "text": "Close"},
-            "blocks": loading_blocks,
-        },
-    )
+    response = await client.views_open(trigger_id=body["trigger_id"], view=_AI_SUGGESTIONS_LOADING_VIEW)
     view_id = response["view"]["id"]
 
-    def update_view() -> None:
-        suggestions = ai_service.generate_experiment_suggestions(context)
+    async def update_view() -> None:
+        suggestions = await generate_experiment_suggestions_shared(context)
         blocks = [
             {
                 "type": "section",
@@ -3782,7 +3910,7 @@ def handle_ai_experiments(ack, body, client):  # noqa: ANN001
             {"type": "divider"},
             {"type": "section", "text": {"type": "mrkdwn", "text": suggestions}},
         ]
-        client.views_update(
+        await client.views_update(
             view_id=view_id,
             view={
                 "type": "modal",
@@ -3796,21 +3924,25 @@ def handle_ai_experiments(ack, body, client):  # noqa: ANN001
 
 
 @app.action("open_create_experiment_modal")
-def open_create_experiment_modal(ack, body, client):  # noqa: ANN001
-    ack()
-    _open_create_experiment_modal(client, body["trigger_id"])
+async def open_create_experiment_modal(ack, body, client):  # noqa: ANN001
+    await ack()
+    await _open_create_experiment_modal(client, body["trigger_id"])
 
 
 @app.action("log_experiment_for_assumption")
-def log_experiment_for_assumption(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def log_experiment_for_assumption(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     assumption_id = int(body["actions"][0]["value"])
-    assumption = db_service.get_assumption(assumption_id)
+    assumption = await run_db(db_service.get_assumption, assumption_id)
     if not assumption:
-        client.chat_postEphemeral(channel=body["user"]["id"], user=body["user"]["id"], text="Assumption not found.")
+        await client.chat_postEphemeral(
+            channel=body["user"]["id"], user=body["user"]["id"], text="Assumption not found."
+        )
         return
     phase = assumption.get("test_and_learn_phase", "define")
-    recommendation = ai_service.recommend_playbook_method(phase, assumption.get("title", ""), playbook.methods)
+    recommendation = await asyncio.to_thread(
+        ai_service.recommend_playbook_method, phase, assumption.get("title", ""), playbook.methods
+    )
     method_id = recommendation.get("method_id") if isinstance(recommendation, dict) else None
     method = playbook.get_method_details(method_id) if method_id else None
     initial_method = method.get("name") if method else None
@@ -3818,7 +3950,7 @@ def log_experiment_for_assumption(ack, body, client, logger):  # noqa: ANN001
     if initial_method:
         reason = recommendation.get("reason", "matches the current phase")
         suggestion_note = f"Pre-selected: *{initial_method}* because {reason}."
-    _open_create_experiment_modal(
+    await _open_create_experiment_modal(
         client,
         body["trigger_id"],
         initial_method=initial_method,
@@ -3828,12 +3960,12 @@ def log_experiment_for_assumption(ack, body, client, logger):  # noqa: ANN001
 
 
 @app.action("create_experiment_manual")
-def open_manual_experiment_modal(ack, body, client):  # noqa: ANN001
-    ack()
-    _open_create_experiment_modal(client, body["trigger_id"])
+async def open_manual_experiment_modal(ack, body, client):  # noqa: ANN001
+    await ack()
+    await _open_create_experiment_modal(client, body["trigger_id"])
 
 
-def _open_create_experiment_modal(
+async def _open_create_experiment_modal(
     client,
     trigger_id: str,
     initial_method: str | None = None,
@@ -3890,7 +4022,7 @@ def _open_create_experiment_modal(
             },
         ]
     )
-    client.views_open(
+    await client.views_open(
         trigger_id=trigger_id,
         view={
             "type": "modal",
@@ -3905,8 +4037,8 @@ def _open_create_experiment_modal(
 
 
 @app.view("create_experiment_submit")
-def handle_create_experiment(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_create_experiment(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     try:
         values = body["view"]["state"]["values"]
@@ -3916,12 +4048,13 @@ def handle_create_experiment(ack, body, client, logger):  # noqa: ANN001
         assumption_id_value = (body["view"].get("private_metadata") or "").strip()
         assumption_id = int(assumption_id_value) if assumption_id_value else None
 
-        project = db_service.get_active_project(user_id)
+        project = await run_db(db_service.get_active_project, user_id)
         if not project:
-            client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
+            await client.chat_postEphemeral(channel=user_id, user=user_id, text="Please create a project first.")
             return
 
-        db_service.create_experiment(
+        await run_db(
+            db_service.create_experiment,
             project_id=project["id"],
             title=title,
             method=method,
@@ -3929,7 +4062,7 @@ def handle_create_experiment(ack, body, client, logger):  # noqa: ANN001
             assumption_id=assumption_id,
         )
         if project.get("channel_id"):
-            client.chat_postMessage(
+            await client.chat_postMessage(
                 channel=project["channel_id"],
                 text=f"🧪 *New Experiment Created: {title}*\n_{hypothesis}_",
                 blocks=[
@@ -3945,12 +4078,12 @@ def handle_create_experiment(ack, body, client, logger):  # noqa: ANN001
                     },
                 ],
             )
-        publish_home_tab_async(client, user_id, "experiments:active")
+        await publish_home_tab(client, user_id)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to create experiment: %s", exc, exc_info=True)
 
 
-def open_update_experiment_modal(client, trigger_id: str, experiment: dict) -> None:  # noqa: ANN001
+async def open_update_experiment_modal(client, trigger_id: str, experiment: dict) -> None:  # noqa: ANN001
     status_options = [
         {"text": {"type": "plain_text", "text": "Planning"}, "value": "Planning"},
         {"text": {"type": "plain_text", "text": "🟢 Live"}, "value": "Live"},
@@ -3963,7 +4096,7 @@ def open_update_experiment_modal(client, trigger_id: str, experiment: dict) -> N
         None,
     )
 
-    client.views_open(
+    await client.views_open(
         trigger_id=trigger_id,
         view={
             "type": "modal",
@@ -4021,42 +4154,42 @@ def open_update_experiment_modal(client, trigger_id: str, experiment: dict) -> N
 
 
 @app.action("update_experiment")
-def open_update_experiment_modal_action(ack, body, client):  # noqa: ANN001
-    ack()
+async def open_update_experiment_modal_action(ack, body, client):  # noqa: ANN001
+    await ack()
     experiment_id = int(body["actions"][0]["value"])
-    experiment = db_service.get_experiment(experiment_id)
+    experiment = await run_db(db_service.get_experiment, experiment_id)
     if not experiment:
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=body["user"]["id"],
             user=body["user"]["id"],
             text="That experiment could not be found.",
         )
         return
-    open_update_experiment_modal(client, body["trigger_id"], experiment)
+    await open_update_experiment_modal(client, body["trigger_id"], experiment)
 
 
 @app.action("delete_experiment")
-def delete_experiment(ack, body, client):  # noqa: ANN001
-    ack()
+async def delete_experiment(ack, body, client):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     experiment_id = int(body["actions"][0]["value"])
-    experiment = db_service.get_experiment(experiment_id)
+    experiment = await run_db(db_service.get_experiment, experiment_id)
     if not experiment:
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=user_id,
             user=user_id,
             text="That experiment could not be found.",
         )
         return
-    db_service.delete_experiment(experiment_id)
-    publish_home_tab_async(client, user_id)
+    await run_db(db_service.delete_experiment, experiment_id)
+    await publish_home_tab(client, user_id)
 
 
 ASANA_DATASET_LINK_PREFIX = "asana:"
 
 
-def _sync_experiment_to_asana(
-    client: "WebClient",
+async def _sync_experiment_to_asana(
+    client: AsyncWebClient,
     user_id: str,
     project: dict,
     experiment: dict,
@@ -4067,25 +4200,27 @@ def _sync_experiment_to_asana(
         f"Method: {experiment.get('method', '—')}\n"
         f"Current KPI: {experiment.get('primary_kpi', '—')}"
     )
-    asana_task = integration_service.create_asana_task(
+    asana_task = await asyncio.to_thread(
+        integration_service.create_asana_task,
         project_name=project["name"],
         task_name=experiment.get("title", "Experiment"),
         description=description,
     )
     if asana_task.get("error"):
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=channel_id,
             user=user_id,
             text=asana_task["error"],
         )
         return False
     if asana_task.get("task_id"):
-        db_service.update_experiment(
+        await run_db(
+            db_service.update_experiment,
             experiment["id"],
             data={"dataset_link": f"{ASANA_DATASET_LINK_PREFIX}{asana_task['task_id']}"},
         )
     if asana_task.get("link"):
-        client.chat_postMessage(
+        await client.chat_postMessage(
             channel=channel_id,
             text=f"✅ Synced to Asana: <{asana_task['link']}|View Task>",
         )
@@ -4093,8 +4228,8 @@ def _sync_experiment_to_asana(
 
 
 @app.view("update_experiment_submit")
-def handle_update_experiment_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_update_experiment_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     experiment_id = int(body["view"]["private_metadata"])
     try:
@@ -4104,42 +4239,43 @@ def handle_update_experiment_submit(ack, body, client, logger):  # noqa: ANN001
         status = values["status_block"]["status"]["selected_option"]["value"]
         kpi_value = values.get("kpi_block", {}).get("kpi_value", {}).get("value")
 
-        db_service.update_experiment(
+        await run_db(
+            db_service.update_experiment,
             experiment_id,
             data={"title": title, "hypothesis": hypothesis},
             status=status,
             kpi=kpi_value,
         )
-        project = db_service.get_active_project(user_id)
+        project = await run_db(db_service.get_active_project, user_id)
         if project and project.get("channel_id"):
             status_emoji = {"Live": "🟢", "Completed": "✅", "Paused": "🛑"}.get(status, "🔵")
-            client.chat_postMessage(
+            await client.chat_postMessage(
                 channel=project["channel_id"],
                 text=f"{status_emoji} *Experiment Update: {status}*",
             )
             if status == "Live":
-                experiment = db_service.get_experiment(experiment_id)
+                experiment = await run_db(db_service.get_experiment, experiment_id)
                 if experiment:
-                    _sync_experiment_to_asana(
+                    await _sync_experiment_to_asana(
                         client,
                         user_id,
                         project,
                         experiment,
                         project["channel_id"],
                     )
-        publish_home_tab_async(client, user_id, "experiments:active")
+        await publish_home_tab(client, user_id)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to update experiment: %s", exc, exc_info=True)
 
 
 @app.action("experiment_overflow")
-def handle_experiment_overflow(ack, body, client):  # noqa: ANN001
-    ack()
+async def handle_experiment_overflow(ack, body, client):  # noqa: ANN001
+    await ack()
     selection = body["actions"][0]["selected_option"]["value"]
-    action_type, experiment_id = selection.split(":", 1)
-    experiment = db_service.get_experiment(int(experiment_id))
+    action_type, _, experiment_id = selection.partition(":")
+    experiment = await run_db(db_service.get_experiment, int(experiment_id))
     if not experiment:
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=body["user"]["id"],
             user=body["user"]["id"],
             text="That experiment could not be found.",
@@ -4147,25 +4283,25 @@ def handle_experiment_overflow(ack, body, client):  # noqa: ANN001
         return
 
     if action_type == "edit":
-        open_update_experiment_modal(client, body["trigger_id"], experiment)
+        await open_update_experiment_modal(client, body["trigger_id"], experiment)
         return
     if action_type == "archive":
-        db_service.update_experiment(experiment["id"], status="Archived")
-        client.chat_postMessage(
+        await run_db(db_service.update_experiment, experiment["id"], status="Archived")
+        await client.chat_postMessage(
             channel=body["channel"]["id"],
             text=f"📦 Archived experiment: {experiment.get('title', 'Untitled')}.",
         )
         return
     if action_type == "sync":
-        project = db_service.get_active_project(body["user"]["id"])
+        project = await run_db(db_service.get_active_project, body["user"]["id"])
         if not project:
-            client.chat_postEphemeral(
+            await client.chat_postEphemeral(
                 channel=body["channel"]["id"],
                 user=body["user"]["id"],
                 text="Please create a project first.",
             )
             return
-        _sync_experiment_to_asana(
+        await _sync_experiment_to_asana(
             client,
             body["user"]["id"],
             project,
@@ -4175,10 +4311,10 @@ def handle_experiment_overflow(ack, body, client):  # noqa: ANN001
 
 
 @app.action("draft_experiment_from_chat")
-def handle_draft_experiment_from_chat(ack, body, client):  # noqa: ANN001
-    ack()
+async def handle_draft_experiment_from_chat(ack, body, client):  # noqa: ANN001
+    await ack()
     hypothesis_text = body["actions"][0]["value"]
-    client.views_open(
+    await client.views_open(
         trigger_id=body["trigger_id"],
         view={
             "type": "modal",
@@ -4228,14 +4364,14 @@ def handle_draft_experiment_from_chat(ack, body, client):  # noqa: ANN001
 
 
 @app.event("message")
-def passive_listener(event, client, logger):  # noqa: ANN001
+async def passive_listener(event, client, logger):  # noqa: ANN001
     if event.get("subtype") or event.get("bot_id"):
         return
     text = event.get("text", "").lower()
     if not text:
         return
     if "we should test" in text or "hypothesis" in text:
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=event["channel"],
             user=event["user"],
             text="🕵️ I detected a new hypothesis!",
@@ -4267,12 +4403,12 @@ def passive_listener(event, client, logger):  # noqa: ANN001
 
 # --- 2. 'SO WHAT?' AI SUMMARISER WITH LIVE STATUS ---
 @app.event("member_joined_channel")
-def handle_channel_join(event, say, client, logger):  # noqa: ANN001
+async def handle_channel_join(event, say, client, logger):  # noqa: ANN001
     """Greets the channel when the bot is added."""
     try:
-        bot_id = client.auth_test()["user_id"]
+        bot_id = (await client.auth_test())["user_id"]
         if event["user"] == bot_id:
-            say(
+            await say(
                 blocks=[
                     {
                         "type": "section",
@@ -4307,43 +4443,40 @@ def handle_channel_join(event, say, client, logger):  # noqa: ANN001
 
 
 @app.event("app_mention")
-def handle_mention(body, say, client, logger):  # noqa: ANN001
+async def handle_mention(body, say, client, logger):  # noqa: ANN001
     event = body["event"]
     thread_ts = event.get("thread_ts", event["ts"])
     channel_id = event["channel"]
-    run_thread_analysis(client, channel_id, thread_ts, logger)
+    await run_thread_analysis(client, channel_id, thread_ts, logger)
 
 
 @app.shortcut("extract_insights")
-def handle_extract_insights_shortcut(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_extract_insights_shortcut(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     message = body.get("message")
     if not message:
-        client.views_open(trigger_id=body["trigger_id"], view=extract_insights_modal())
+        await client.views_open(trigger_id=body["trigger_id"], view=extract_insights_modal())
         return
 
-    loading_view = client.views_open(trigger_id=body["trigger_id"], view=get_loading_modal())
-    view_id = loading_view["view"]["id"]
-
     channel_id = body["channel"]["id"]
     thread_ts = message.get("thread_ts", message["ts"])
 
-    def run_analysis() -> None:
+    history_task = asyncio.create_task(collect_thread(client, channel_id, thread_ts))
+    try:
+        loading_view = await client.views_open(trigger_id=body["trigger_id"], view=get_loading_modal())
+    except Exception:
+        history_task.cancel()
+        raise
+    view_id = loading_view["view"]["id"]
+
+    async def run_analysis() -> None:
         try:
-            history = client.conversations_replies(channel=channel_id, ts=thread_ts)
-            messages = history["messages"]
-            full_text = "\n".join([f"{m.get('user', 'User')}: {m.get('text')}" for m in messages])
-
-            attachments = [
-                {"name": file.get("name"), "mimetype": file.get("mimetype")}
-                for message in messages
-                for file in message.get("files", []) or []
-            ]
+            _messages, full_text, attachments = await history_task
 
-            analysis = ai_service.analyze_thread_structured(full_text, attachments)
+            analysis = await analyze_thread_cached(full_text, attachments)
 
             if analysis.get("error"):
-                client.views_update(
+                await client.views_update(
                     view_id=view_id,
                     view={
                         "type": "modal",
@@ -4354,7 +4487,7 @@ def handle_extract_insights_shortcut(ack, body, client, logger):  # noqa: ANN001
                 )
                 return
 
-            client.views_update(
+            await client.views_update(
                 view_id=view_id,
                 view={
                     "type": "modal",
@@ -4366,7 +4499,7 @@ def handle_extract_insights_shortcut(ack, body, client, logger):  # noqa: ANN001
             )
         except Exception as exc:  # noqa: BLE001
             logger.error("Error handling extract insights shortcut: %s", exc, exc_info=True)
-            client.views_update(
+            await client.views_update(
                 view_id=view_id,
                 view={
                     "type": "modal",
@@ -4381,105 +4514,107 @@ def handle_extract_insights_shortcut(ack, body, client, logger):  # noqa: ANN001
                 },
             )
 
-    analysis_thread = threading.Thread(target=run_analysis, daemon=True)
-    analysis_thread.start()
+    run_in_background(run_analysis)
 
 # --- 3. ACTIVE PERSISTENCE / NUDGES ---
+# Nudge button prefix -> (status to record, or None, and the confirmation template).
+_NUDGE_ACTIONS = {
+    "val": ("Validated", "Assumption {} marked as validated."),
+    "arch": ("Rejected", "Assumption {} archived."),
+    "gen": (None, "Generating experiment for assumption {}..."),
+}
+
+
 @app.action("nudge_action")
-def handle_nudge_action(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_nudge_action(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     action_value = body["actions"][0]["value"]
 
     try:
-        action_type, assumption_id = action_value.split("_", 1)
-
-        if action_type == "gen":
-            client.chat_postEphemeral(
-                channel=body["channel_id"],
-                user=user_id,
-                text=f"Generating experiment for assumption {assumption_id}...",
-            )
-        elif action_type == "val":
-            db_service.update_assumption_validation_status(int(assumption_id), "Validated")
-            client.chat_postEphemeral(
-                channel=body["channel_id"], user=user_id, text=f"Assumption {assumption_id} marked as validated."
-            )
-        elif action_type == "arch":
-            db_service.update_assumption_validation_status(int(assumption_id), "Rejected")
-            client.chat_postEphemeral(
-                channel=body["channel_id"], user=user_id, text=f"Assumption {assumption_id} archived."
-            )
-        else:
-            client.chat_postEphemeral(channel=body["channel_id"], user=user_id, text="Unknown action type.")
+        action_type, _, assumption_id = action_value.partition("_")
+        nudge = _NUDGE_ACTIONS.get(action_type)
+        if nudge is None:
+            await client.chat_postEphemeral(channel=body["channel_id"], user=user_id, text="Unknown action type.")
+            return
+        status, message = nudge
+        if status:
+            assumption_status_buffer.enqueue(int(assumption_id), status, user_id)
+        await client.chat_postEphemeral(channel=body["channel_id"], user=user_id, text=message.format(assumption_id))
+    except ValueError:
+        # Malformed button value (non-numeric assumption id); expected, so skip the traceback.
+        logger.warning("Invalid nudge action value %r for user %s", action_value, user_id)
+        await client.chat_postEphemeral(
+            channel=body.get("channel_id"), user=user_id, text="An error occurred while processing your request."
+        )
     except Exception as exc:  # noqa: BLE001
         logger.error("Error handling nudge action for user %s: %s", user_id, exc, exc_info=True)
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=body.get("channel_id"), user=user_id, text="An error occurred while processing your request."
         )
 
 
 @app.action("keep_assumption")
-def handle_keep(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_keep(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     try:
         user_id = body["user"]["id"]
         assumption_id = body["actions"][0]["value"]
-        db_service.update_assumption_validation_status(int(assumption_id), "Validated")
-        client.chat_postMessage(channel=user_id, text=f"✅ Assumption {assumption_id} marked as validated.")
+        assumption_status_buffer.enqueue(int(assumption_id), "Validated", user_id)
+        await client.chat_postMessage(channel=user_id, text=f"✅ Assumption {assumption_id} marked as validated.")
     except Exception as exc:  # noqa: BLE001
         logger.error("Error in handle_keep action: %s", exc, exc_info=True)
 
 
 @app.action("validate_assumption")
-def handle_validate_assumption(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_validate_assumption(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     try:
         user_id = body["user"]["id"]
         assumption_id = body["actions"][0]["value"]
-        db_service.update_assumption_validation_status(int(assumption_id), "Validated")
-        client.chat_postMessage(channel=user_id, text=f"✅ Assumption {assumption_id} marked as validated.")
+        assumption_status_buffer.enqueue(int(assumption_id), "Validated", user_id)
+        await client.chat_postMessage(channel=user_id, text=f"✅ Assumption {assumption_id} marked as validated.")
     except Exception as exc:  # noqa: BLE001
         logger.error("Error in handle_mark_validated action: %s", exc, exc_info=True)
 
 
 @app.action("keep_testing")
-def handle_keep_testing(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_keep_testing(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     try:
         user_id = body["user"]["id"]
         assumption_id = body["actions"][0]["value"]
-        db_service.touch_assumption(int(assumption_id))
-        client.chat_postMessage(channel=user_id, text=f"🔄 Assumption {assumption_id} is still in testing.")
+        await run_db(db_service.touch_assumption, int(assumption_id))
+        await client.chat_postMessage(channel=user_id, text=f"🔄 Assumption {assumption_id} is still in testing.")
     except Exception as exc:  # noqa: BLE001
         logger.error("Error in handle_keep_testing action: %s", exc, exc_info=True)
 
 
 @app.action("archive_assumption")
-def handle_archive(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_archive(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     try:
         user_id = body["user"]["id"]
         assumption_id = body["actions"][0]["value"]
-        db_service.update_assumption_validation_status(int(assumption_id), "Rejected")
-        client.chat_postMessage(channel=user_id, text=f"🗑️ Assumption {assumption_id} marked as rejected.")
+        assumption_status_buffer.enqueue(int(assumption_id), "Rejected", user_id)
+        await client.chat_postMessage(channel=user_id, text=f"🗑️ Assumption {assumption_id} marked as rejected.")
     except Exception as exc:  # noqa: BLE001
         logger.error("Error in handle_archive action: %s", exc, exc_info=True)
 
 
 @app.action("gen_experiment_modal")
-def handle_gen_experiment(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_gen_experiment(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     try:
         assumption_text = body["actions"][0]["value"]
         trigger_id = body["trigger_id"]
         loading_view = experiment_modal(assumption_text, "Generating suggestions...")
-        response = client.views_open(trigger_id=trigger_id, view=loading_view)
+        response = await client.views_open(trigger_id=trigger_id, view=loading_view)
         view_id = response["view"]["id"]
 
-        def update_modal() -> None:
-            suggestions = ai_service.generate_experiment_suggestions(assumption_text)
-            client.views_update(view_id=view_id, view=experiment_modal(assumption_text, suggestions))
+        async def update_modal() -> None:
+            suggestions = await generate_experiment_suggestions_shared(assumption_text)
+            await client.views_update(view_id=view_id, view=experiment_modal(assumption_text, suggestions))
 
         run_in_background(update_modal)
     except Exception as exc:  # noqa: BLE001
@@ -4487,77 +4622,79 @@ def handle_gen_experiment(ack, body, client, logger):  # noqa: ANN001
 
 
 # --- 5. DECISION ROOM ---
-@app.action("trigger_decision_room")
-def open_decision_room(ack, body, client):  # noqa: ANN001
-    ack()
-    client.views_open(
-        trigger_id=body["trigger_id"],
-        view={
-            "type": "modal",
-            "callback_id": "start_decision_submit",
-            "title": {"type": "plain_text", "text": "Start Decision Room"},
-            "close": {"type": "plain_text", "text": "Cancel"},
-            "blocks": [
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": "Pick a channel to host the scoring session. If you don't see it, link a channel from the Home tab first.",
-                    },
-                },
-                {
-                    "type": "input",
-                    "block_id": "channel_select",
-                    "element": {"type": "channels_select", "action_id": "selected_channel"},
-                    "label": {"type": "plain_text", "text": "Channel"},
-                },
-            ],
-            "submit": {"type": "plain_text", "text": "Start Scoring"},
+_START_DECISION_MODAL = {
+    "type": "modal",
+    "callback_id": "start_decision_submit",
+    "title": {"type": "plain_text", "text": "Start Decision Room"},
+    "close": {"type": "plain_text", "text": "Cancel"},
+    "blocks": [
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": "Pick a channel to host the scoring session. If you don't see it, link a channel from the Home tab first.",
+            },
         },
-    )
+        {
+            "type": "input",
+            "block_id": "channel_select",
+            "element": {"type": "channels_select", "action_id": "selected_channel"},
+            "label": {"type": "plain_text", "text": "Channel"},
+        },
+    ],
+    "submit": {"type": "plain_text", "text": "Start Scoring"},
+}
+
+
+@app.action("trigger_decision_room")
+async def open_decision_room(ack, body, client):  # noqa: ANN001
+    await ack()
+    await client.views_open(trigger_id=body["trigger_id"], view=_START_DECISION_MODAL)
 
 
 @app.view("start_decision_submit")
-def start_decision_room(ack, body, client, view):  # noqa: ANN001
-    ack()
+async def start_decision_room(ack, body, client, view):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     channel_id = view["state"]["values"]["channel_select"]["selected_channel"]["selected_channel"]
 
-    success, message, _session_id = decision_service.start_session(
+    success, message, _session_id = await decision_service.start_session(
         channel_id,
         client=client,
         user_id=user_id,
     )
     if not success:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text=f"❌ {message}")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text=f"❌ {message}")
 
 
 @app.action("open_silent_score")
-def open_silent_score(ack, body, client):  # noqa: ANN001
-    ack()
-    session_id, assumption_id = body["actions"][0]["value"].split(":")
-    assumption = db_service.get_assumption(int(assumption_id))
+async def open_silent_score(ack, body, client):  # noqa: ANN001
+    await ack()
+    session_id, _, assumption_id = body["actions"][0]["value"].partition(":")
+    assumption = await run_db(db_service.get_assumption, int(assumption_id))
     if not assumption:
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=body["channel"]["id"],
             user=body["user"]["id"],
             text="Assumption not found.",
         )
         return
-    client.views_open(
+    await client.views_open(
         trigger_id=body["trigger_id"],
         view=silent_scoring_modal(assumption["title"], int(session_id), int(assumption_id)),
     )
 
 
 @app.view("submit_silent_score")
-def submit_silent_score(ack, body, view, client, logger):  # noqa: ANN001
-    ack()
+async def submit_silent_score(ack, body, view, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     try:
-        session_id_str, assumption_id_str = view["private_metadata"].split(":")
-        session_id = int(session_id_str)
-        assumption_id = int(assumption_id_str)
+        metadata = SILENT_SCORE_METADATA_PATTERN.fullmatch(view["private_metadata"])
+        if not metadata:
+            raise ValueError(f"Unexpected private_metadata {view['private_metadata']!r}")
+        session_id = int(metadata[1])
+        assumption_id = int(metadata[2])
         values = view["state"]["values"]
         impact = int(values["impact_block"]["impact_score"]["selected_option"]["value"])
         uncertainty = int(values["uncertainty_block"]["uncertainty_score"]["selected_option"]["value"])
@@ -4565,7 +4702,8 @@ def submit_silent_score(ack, body, view, client, logger):  # noqa: ANN001
         confidence = int(values["evidence_block"]["confidence_score"]["selected_option"]["value"])
         rationale = values.get("rationale_block", {}).get("rationale_text", {}).get("value")
 
-        db_service.record_decision_score(
+        await run_db(
+            db_service.record_decision_score,
             session_id=session_id,
             assumption_id=assumption_id,
             user_id=user_id,
@@ -4576,56 +4714,66 @@ def submit_silent_score(ack, body, view, client, logger):  # noqa: ANN001
             rationale=rationale,
         )
 
-        client.chat_postMessage(channel=user_id, text="✅ Your silent score has been saved.")
+        await client.chat_postMessage(channel=user_id, text="✅ Your silent score has been saved.")
     except (KeyError, ValueError) as exc:
         logger.error("Error parsing silent score submission for user %s: %s", user_id, exc, exc_info=True)
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=user_id,
             user=user_id,
             text="❌ There was an error processing your score. Please try again.",
         )
 
 
+_SCORE_SUMMARY_LINE = (
+    "• Assumption {0}: "
+    "Impact {1:.1f}, "
+    "Uncertainty {2:.1f}, "
+    "Feasibility {3:.1f}, "
+    "Evidence {4:.0f} "
+    "({5} scores) — {6}"
+)
+
+
 @app.action("end_decision_session")
-def end_session(ack, body, client):  # noqa: ANN001
-    ack()
+async def end_session(ack, body, client):  # noqa: ANN001
+    await ack()
     session_id = body["actions"][0]["value"]
-    results = decision_service.reveal_scores(int(session_id))
-
-    text = "*🏁 Silent Scoring Complete!*\n\n"
-    summary_lines = []
-    for assumption_id, scores in results.items():
-        disagreement = "⚠️ High disagreement" if scores["disagreement"] else "✅ Consensus"
-        summary_lines.append(
-            (
-                f"• Assumption {assumption_id}: "
-                f"Impact {scores['avg_impact']:.1f}, "
-                f"Uncertainty {scores['avg_uncertainty']:.1f}, "
-                f"Feasibility {scores['avg_feasibility']:.1f}, "
-                f"Evidence {scores['avg_confidence']:.0f} "
-                f"({scores['count']} scores) — {disagreement}"
+    results = await run_db(decision_service.reveal_scores, int(session_id))
+
+    summary = "\n".join(
+        [
+            _SCORE_SUMMARY_LINE.format(
+                assumption_id,
+                scores["avg_impact"],
+                scores["avg_uncertainty"],
+                scores["avg_feasibility"],
+                scores["avg_confidence"],
+                scores["count"],
+                "⚠️ High disagreement" if scores["disagreement"] else "✅ Consensus",
             )
-        )
-    text += "\n".join(summary_lines) if summary_lines else "No scores were submitted."
+            for assumption_id, scores in results.items()
+        ]
+    )
+    text = "*🏁 Silent Scoring Complete!*\n\n" + (summary or "No scores were submitted.")
 
-    client.chat_postMessage(channel=body["channel"]["id"], text=text)
+    await client.chat_postMessage(channel=body["channel"]["id"], text=text)
 
 
 # --- 6. METHODS AND CASE STUDIES ---
 @app.command("/evidently-vote")
-def handle_evidently_vote(ack, body, client, respond, logger):  # noqa: ANN001
-    ack()
+async def handle_evidently_vote(ack, body, client, respond, logger):  # noqa: ANN001
+    await ack()
     try:
         text = (body.get("text") or "").strip()
         if not text or not text.isdigit():
-            respond("Please provide an assumption ID. Example: `/evidently-vote 12`")
+            await respond("Please provide an assumption ID. Example: `/evidently-vote 12`")
             return
         assumption_id = int(text)
-        assumption = db_service.get_assumption(assumption_id)
+        assumption = await run_db(db_service.get_assumption, assumption_id)
         if not assumption:
-            respond(f"Assumption {assumption_id} not found.")
+            await respond(f"Assumption {assumption_id} not found.")
             return
-        client.views_open(
+        await client.views_open(
             trigger_id=body["trigger_id"],
             view=decision_vote_modal(
                 assumption_title=assumption.get("title", "Untitled"),
@@ -4635,32 +4783,36 @@ def handle_evidently_vote(ack, body, client, respond, logger):  # noqa: ANN001
         )
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to open decision vote modal", exc_info=True)
-        respond("Unable to start voting right now.")
+        await respond("Unable to start voting right now.")
 
 
 @app.view("submit_decision_vote")
-def submit_decision_vote(ack, body, view, client, logger):  # noqa: ANN001
-    ack()
+async def submit_decision_vote(ack, body, view, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     try:
-        assumption_id_str, channel_id = view["private_metadata"].split(":", 1)
-        assumption_id = int(assumption_id_str)
+        metadata = DECISION_VOTE_METADATA_PATTERN.fullmatch(view["private_metadata"])
+        if not metadata:
+            raise ValueError(f"Unexpected private_metadata {view['private_metadata']!r}")
+        assumption_id = int(metadata[1])
+        channel_id = metadata[2]
         values = view["state"]["values"]
         impact = int(values["impact_block"]["impact_score"]["selected_option"]["value"])
         uncertainty = int(values["uncertainty_block"]["uncertainty_score"]["selected_option"]["value"])
-        decision_service.record_vote(
+        await run_db(
+            decision_service.record_vote,
             assumption_id=assumption_id,
             user_id=user_id,
             impact_score=impact,
             uncertainty_score=uncertainty,
         )
-        summary = decision_service.reveal_results(assumption_id)
+        summary = await run_db(decision_service.reveal_results, assumption_id)
         if summary.get("avg_uncertainty", 0) >= UNCERTAINTY_HORIZON_NOW_THRESHOLD:
-            db_service.update_assumption_horizon(assumption_id, "now")
+            await run_db(db_service.update_assumption_horizon, assumption_id, "now")
         elif summary.get("avg_uncertainty", 0) <= UNCERTAINTY_HORIZON_LATER_THRESHOLD:
-            db_service.update_assumption_horizon(assumption_id, "later")
+            await run_db(db_service.update_assumption_horizon, assumption_id, "later")
         heatmap = decision_heatmap_label(summary["avg_impact"], summary["avg_uncertainty"])
-        client.chat_postMessage(
+        await client.chat_postMessage(
             channel=channel_id,
             text=(
                 f"🗳️ Decision Room update for Assumption {assumption_id}\n"
@@ -4672,76 +4824,88 @@ def submit_decision_vote(ack, body, view, client, logger):  # noqa: ANN001
         )
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to submit decision vote", exc_info=True)
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=user_id,
             user=user_id,
             text="❌ Unable to record your vote right now.",
         )
 
 
+methods_narrative_cache = TTLCache(maxsize=64, ttl=3600)
+
+
+async def _recommend_methods_cached(stage: str) -> str:
+    return await methods_narrative_cache.get_or_compute(
+        stage,
+        lambda: ai_service.recommend_methods(stage, ""),
+        # Don't pin the fallback message for an hour if Gemini was briefly unavailable.
+        should_cache=lambda narrative: narrative != RECOMMEND_METHODS_FALLBACK,
+    )
+
+
 @app.command("/evidently-methods")
-def handle_methods(ack, body, respond, logger):  # noqa: ANN001
-    ack()
+async def handle_methods(ack, body, respond, logger):  # noqa: ANN001
+    await ack()
     stage = (body.get("text") or "").strip().lower() or "define"
     try:
-        respond(text="Generating method recommendations...", response_type="ephemeral")
+        await respond(text="Generating method recommendations...", response_type="ephemeral")
 
-        def send_response() -> None:
-            narrative = ai_service.recommend_methods(stage, "")
+        async def send_response() -> None:
+            narrative = await _recommend_methods_cached(stage)
             blocks = method_cards(stage)
-            respond(text=narrative, blocks=blocks, response_type="ephemeral", replace_original=True)
+            await respond(text=narrative, blocks=blocks, response_type="ephemeral", replace_original=True)
 
         run_in_background(send_response)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to handle methods command", exc_info=True)
-        respond("Unable to share methods right now.")
+        await respond("Unable to share methods right now.")
 
 
 @app.action("view_case_study")
-def open_case_study(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def open_case_study(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     try:
         method = body["actions"][0]["value"]
         trigger_id = body.get("trigger_id")
-        client.views_open(trigger_id=trigger_id, view=case_study_modal(method))
+        await client.views_open(trigger_id=trigger_id, view=case_study_modal(method))
     except Exception as exc:  # noqa: BLE001
         logger.error("Error opening case study modal", exc_info=True)
 
 
 @app.action("assumption_overflow")
-def handle_assumption_overflow(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_assumption_overflow(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     try:
         action_value = body["actions"][0]["selected_option"]["value"]
-        assumption_id, action = action_value.split(":", 1)
+        assumption_id, _, action = action_value.partition(":")
         user_id = body["user"]["id"]
 
         if action in {"Now", "Next", "Later"}:
             horizon = action.lower()
-            db_service.update_assumption_lane(int(assumption_id), action)
-            db_service.update_assumption_horizon(int(assumption_id), horizon)
-            client.chat_postEphemeral(channel=user_id, user=user_id, text=f"Moved to {action}.")
+            await run_db(db_service.update_assumption_lane, int(assumption_id), action)
+            await run_db(db_service.update_assumption_horizon, int(assumption_id), horizon)
+            await client.chat_postEphemeral(channel=user_id, user=user_id, text=f"Moved to {action}.")
         elif action == "delete":
-            db_service.delete_assumption(int(assumption_id))
-            client.chat_postEphemeral(channel=user_id, user=user_id, text="Assumption deleted.")
-            publish_home_tab_async(client, user_id, "roadmap:roadmap")
+            await run_db(db_service.delete_assumption, int(assumption_id))
+            await client.chat_postEphemeral(channel=user_id, user=user_id, text="Assumption deleted.")
+            await publish_home_tab(client, user_id)
         elif action == "archive":
-            db_service.update_assumption_validation_status(int(assumption_id), "Rejected")
-            client.chat_postEphemeral(channel=user_id, user=user_id, text="Assumption archived.")
-            publish_home_tab_async(client, user_id, "roadmap:roadmap")
+            await run_db(db_service.update_assumption_validation_status, int(assumption_id), "Rejected")
+            await client.chat_postEphemeral(channel=user_id, user=user_id, text="Assumption archived.")
+            await publish_home_tab(client, user_id)
         elif action == "edit_text":
-            assumption = db_service.get_assumption(int(assumption_id))
+            assumption = await run_db(db_service.get_assumption, int(assumption_id))
             if not assumption:
-                client.chat_postEphemeral(channel=user_id, user=user_id, text="Assumption not found.")
+                await client.chat_postEphemeral(channel=user_id, user=user_id, text="Assumption not found.")
                 return
-            open_edit_assumption_text_modal(client, body["trigger_id"], assumption)
+            await open_edit_assumption_text_modal(client, body["trigger_id"], assumption)
         elif action == "move":
             options = [
                 {"text": {"type": "plain_text", "text": "Now"}, "value": "Now"},
                 {"text": {"type": "plain_text", "text": "Next"}, "value": "Next"},
                 {"text": {"type": "plain_text", "text": "Later"}, "value": "Later"},
             ]
-            client.views_open(
+            await client.views_open(
                 trigger_id=body["trigger_id"],
                 view={
                     "type": "modal",
@@ -4765,31 +4929,31 @@ def handle_assumption_overflow(ack, body, client, logger):  # noqa: ANN001
                 },
             )
         elif action == "exp":
-            assumption = db_service.get_assumption(int(assumption_id))
+            assumption = await run_db(db_service.get_assumption, int(assumption_id))
             if not assumption:
-                client.chat_postEphemeral(channel=user_id, user=user_id, text="Assumption not found.")
+                await client.chat_postEphemeral(channel=user_id, user=user_id, text="Assumption not found.")
                 return
             trigger_id = body.get("trigger_id")
-            response = client.views_open(
+            response = await client.views_open(
                 trigger_id=trigger_id,
                 view=experiment_modal(assumption["title"], "Generating suggestions..."),
             )
             view_id = response["view"]["id"]
 
-            def update_modal() -> None:
-                suggestions = ai_service.generate_experiment_suggestions(assumption["title"])
-                client.views_update(view_id=view_id, view=experiment_modal(assumption["title"], suggestions))
+            async def update_modal() -> None:
+                suggestions = await generate_experiment_suggestions_shared(assumption["title"])
+                await client.views_update(view_id=view_id, view=experiment_modal(assumption["title"], suggestions))
 
             run_in_background(update_modal)
         else:
-            client.chat_postEphemeral(channel=user_id, user=user_id, text="Action received.")
+            await client.chat_postEphemeral(channel=user_id, user=user_id, text="Action received.")
     except Exception as exc:  # noqa: BLE001
         logger.error("Overflow action failed", exc_info=True)
 
 
 @app.action("move_assumption")
-def handle_move_assumption(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_move_assumption(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     try:
         assumption_id = body["actions"][0]["value"]
         options = [
@@ -4797,7 +4961,7 @@ def handle_move_assumption(ack, body, client, logger):  # noqa: ANN001
             {"text": {"type": "plain_text", "text": "Next"}, "value": "Next"},
             {"text": {"type": "plain_text", "text": "Later"}, "value": "Later"},
         ]
-        client.views_open(
+        await client.views_open(
             trigger_id=body["trigger_id"],
             view={
                 "type": "modal",
@@ -4825,43 +4989,43 @@ def handle_move_assumption(ack, body, client, logger):  # noqa: ANN001
 
 
 @app.view("move_assumption_submit")
-def handle_move_assumption_submit(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_move_assumption_submit(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user"]["id"]
     assumption_id = body["view"].get("private_metadata")
     if not assumption_id:
-        client.chat_postEphemeral(channel=user_id, user=user_id, text="Assumption not found.")
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text="Assumption not found.")
         return
     try:
         lane = body["view"]["state"]["values"]["lane_block"]["lane"]["selected_option"]["value"]
-        db_service.update_assumption_lane(int(assumption_id), lane)
-        db_service.update_assumption_horizon(int(assumption_id), lane.lower())
-        client.chat_postEphemeral(channel=user_id, user=user_id, text=f"Moved to {lane}.")
-        publish_home_tab_async(client, user_id, "roadmap:roadmap")
+        await run_db(db_service.update_assumption_lane, int(assumption_id), lane)
+        await run_db(db_service.update_assumption_horizon, int(assumption_id), lane.lower())
+        await client.chat_postEphemeral(channel=user_id, user=user_id, text=f"Moved to {lane}.")
+        await publish_home_tab(client, user_id)
     except (KeyError, ValueError, SQLAlchemyError):
         logger.error("Failed to move assumption", exc_info=True)
 
 
 @app.action("design_assumption_experiment")
-def handle_design_assumption_experiment(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_design_assumption_experiment(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     try:
         assumption_id = body["actions"][0]["value"]
-        assumption = db_service.get_assumption(int(assumption_id))
+        assumption = await run_db(db_service.get_assumption, int(assumption_id))
         user_id = body["user"]["id"]
         if not assumption:
-            client.chat_postEphemeral(channel=user_id, user=user_id, text="Assumption not found.")
+            await client.chat_postEphemeral(channel=user_id, user=user_id, text="Assumption not found.")
             return
         trigger_id = body.get("trigger_id")
-        response = client.views_open(
+        response = await client.views_open(
             trigger_id=trigger_id,
             view=experiment_modal(assumption["title"], "Generating suggestions..."),
         )
         view_id = response["view"]["id"]
 
-        def update_modal() -> None:
-            suggestions = ai_service.generate_experiment_suggestions(assumption["title"])
-            client.views_update(view_id=view_id, view=experiment_modal(assumption["title"], suggestions))
+        async def update_modal() -> None:
+            suggestions = await generate_experiment_suggestions_shared(assumption["title"])
+            await client.views_update(view_id=view_id, view=experiment_modal(assumption["title"], suggestions))
 
         run_in_background(update_modal)
     except Exception as exc:  # noqa: BLE001
@@ -4869,66 +5033,77 @@ def handle_design_assumption_experiment(ack, body, client, logger):  # noqa: ANN
 
 
 # --- 7. GOOGLE WORKSPACE EXPORTS ---
-@app.command("/evidently-export-slides")
-def export_slides(ack, body, respond, logger):  # noqa: ANN001
-    ack()
+# FRAMEWORK_STAGES is static, so the stage sections of a drafted plan are built once.
+_PLAN_STAGE_SECTIONS = "\n\n".join(
+    f"## {stage.title()}\n{details['description']}\nMethods: {', '.join(details['methods'])}"
+    for stage, details in knowledge_base.FRAMEWORK_STAGES.items()
+)
+
+
+# Registered below only when Workspace credentials loaded, so these handlers need no None check.
+async def export_slides(ack, body, respond, logger):  # noqa: ANN001
+    # The ack reaches Slack straight away; the deck is delivered through respond (response_url).
+    await ack("⏳ Creating your slide deck...")
     user_id = body.get("user_id")
     try:
-        if not google_workspace_service:
-            respond("Google Workspace is not configured.")
-            return
-        project = db_service.get_active_project(user_id)
+        project = await run_db(db_service.get_active_project, user_id)
         if not project:
-            respond("Please complete onboarding to create a project first.")
+            await respond("Please complete onboarding to create a project first.")
             return
         slides = [
             f"Innovation score: {project.get('innovation_score', 0)}%",
             f"Active assumptions: {len(project.get('assumptions', []))}",
             "Roadmap overview: Now / Next / Later",
         ]
-        link = google_workspace_service.create_slide_deck("OCP Dashboard", slides)
+        link = await run_google_call(google_workspace_service.create_slide_deck, "OCP Dashboard", slides)
         if not link:
-            respond("I could not create a slide deck just now.")
+            await respond("I could not create a slide deck just now.")
             return
-        respond(f"I've created a slide deck for your stakeholder meeting: {link}")
+        await respond(f"I've created a slide deck for your stakeholder meeting: {link}")
     except Exception as exc:  # noqa: BLE001
         logger.error("Error exporting slides", exc_info=True)
-        respond("Slide export failed.")
+        await respond("Slide export failed.")
 
 
-@app.command("/evidently-draft-plan")
-def draft_plan(ack, body, respond, logger):  # noqa: ANN001
-    ack()
+async def draft_plan(ack, body, respond, logger):  # noqa: ANN001
+    await ack("⏳ Drafting your plan...")
     try:
-        if not google_workspace_service:
-            respond("Google Workspace is not configured.")
-            return
         context = body.get("text", "").strip()
-        plan_content = (
-            f"# Project Plan\nContext: {context or 'No extra context provided.'}\n\n"
-            + "\n\n".join(
-                [f"## {stage.title()}\n{desc}" for stage, desc in knowledge_base.FRAMEWORK_STAGES.items()]
-            )
-        )
-        link = google_workspace_service.create_doc("Project Plan", plan_content)
+        plan_content = f"# Project Plan\nContext: {context or 'No extra context provided.'}\n\n{_PLAN_STAGE_SECTIONS}"
+        link = await run_google_call(google_workspace_service.create_doc, "Project Plan", plan_content)
         if not link:
-            respond("I couldn't draft the plan right now.")
+            await respond("I couldn't draft the plan right now.")
             return
-        respond(f"I've drafted a Test & Learn plan based on our chat: {link}")
+        await respond(f"I've drafted a Test & Learn plan based on our chat: {link}")
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to draft plan", exc_info=True)
-        respond("Plan drafting failed.")
+        await respond("Plan drafting failed.")
+
+
+async def workspace_not_configured(ack, respond):  # noqa: ANN001
+    await ack()
+    await respond("Google Workspace is not configured.")
+
+
+if google_workspace_service is not None:
+    app.command("/evidently-export-slides")(export_slides)
+    app.command("/evidently-draft-plan")(draft_plan)
+else:
+    app.command("/evidently-export-slides")(workspace_not_configured)
+    app.command("/evidently-draft-plan")(workspace_not_configured)
 
 
 @app.command("/evidently-nudge")
-def handle_nudge_command(ack, body, client, logger):  # noqa: ANN001
-    ack()
+async def handle_nudge_command(ack, body, client, logger):  # noqa: ANN001
+    await ack()
     user_id = body["user_id"]
     channel_id = body["channel_id"]
     try:
-        project = db_service.get_project_by_channel(channel_id) or db_service.get_active_project(user_id)
+        project = await run_db(db_service.get_project_by_channel, channel_id) or await run_db(
+            db_service.get_active_project, user_id
+        )
         if not project:
-            client.chat_postEphemeral(
+            await client.chat_postEphemeral(
                 channel=channel_id,
                 user=user_id,
                 text="Please select a project first.",
@@ -4950,10 +5125,10 @@ def handle_nudge_command(ack, body, client, logger):  # noqa: ANN001
                 continue
         count = len(stale)
         text = f"Found {count} stale assumptions. View the board in the Home tab."
-        client.chat_postEphemeral(channel=channel_id, user=user_id, text=text)
+        await client.chat_postEphemeral(channel=channel_id, user=user_id, text=text)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to run nudge command", exc_info=True)
-        client.chat_postEphemeral(
+        await client.chat_postEphemeral(
             channel=channel_id,
             user=user_id,
             text="Unable to check stale assumptions right now.",
@@ -5009,27 +5184,27 @@ def daily_standup_job(client):  # noqa: ANN001
 
 
 @app.action("update_status_running")
-def handle_status_running(ack, body, client):  # noqa: ANN001
-    ack()
-    client.chat_postMessage(
+async def handle_status_running(ack, body, client):  # noqa: ANN001
+    await ack()
+    await client.chat_postMessage(
         channel=body["channel"]["id"],
         text=f"🧪 <@{body['user']['id']}> is running an experiment today.",
     )
 
 
 @app.action("update_status_analysis")
-def handle_status_analysis(ack, body, client):  # noqa: ANN001
-    ack()
-    client.chat_postMessage(
+async def handle_status_analysis(ack, body, client):  # noqa: ANN001
+    await ack()
+    await client.chat_postMessage(
         channel=body["channel"]["id"],
         text=f"📊 <@{body['user']['id']}> is analyzing data today.",
     )
 
 
 @app.action("update_status_blocked")
-def handle_status_blocked(ack, body, client):  # noqa: ANN001
-    ack()
-    client.chat_postMessage(
+async def handle_status_blocked(ack, body, client):  # noqa: ANN001
+    await ack()
+    await client.chat_postMessage(
         channel=body["channel"]["id"],
         text=f"🛑 <@{body['user']['id']}> is blocked and needs help.",
     )
@@ -5041,13 +5216,16 @@ def weekly_backup_job(client):  # noqa: ANN001
     output_path = backup_service.dump_database(Path("backups"))
     if not output_path:
         return
-    messenger_service.upload_file(
-        channel=Config.BACKUP_CHANNEL,
-        file=output_path,
-        filename=output_path.name,
-        title="Evidently Weekly Backup",
-        comment="Weekly database backup.",
-    )
+    try:
+        client.files_upload_v2(
+            channel=Config.BACKUP_CHANNEL,
+            file=output_path,
+            filename=output_path.name,
+            title="Evidently Weekly Backup",
+            initial_comment="Weekly database backup.",
+        )
+    except Exception:  # noqa: BLE001
+        logger.exception("Failed to upload weekly backup")
 
 
 if Config.STANDUP_ENABLED:
@@ -5058,7 +5236,7 @@ if Config.STANDUP_ENABLED:
         hour=Config.STANDUP_HOUR,
         minute=Config.STANDUP_MINUTE,
         day_of_week="mon-fri",
-        args=[app.client],
+        args=[scheduler_client],
     )
     standup_scheduler.start()
 
@@ -5070,12 +5248,12 @@ if Config.BACKUP_ENABLED:
         day_of_week="sun",
         hour=2,
         minute=0,
-        args=[app.client],
+        args=[scheduler_client],
     )
     backup_scheduler.start()
 
 daily_dashboard_scheduler = start_scheduler(
-    app.client,
+    scheduler_client,
     db_service,
     lambda user_id, project, all_projects: get_home_view(
         user_id,
@@ -3,8 +3,8 @@ import json
 from typing import Callable
 
 from aiohttp import web
-from slack_bolt import App
-from slack_bolt.request import BoltRequest
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.request.async_request import AsyncBoltRequest
 from slack_bolt.response import BoltResponse
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -53,7 +53,7 @@ def create_web_app(
     google_service: GoogleService,
     handle_asana_webhook: Callable[[web.Request], web.Response],
     logger,
-    slack_app: App,
+    slack_app: AsyncApp,
 ) -> web.Application:
     web_app = web.Application()
 
@@ -72,8 +72,8 @@ def create_web_app(
             except json.JSONDecodeError:
                 pass
 
-            bolt_req = BoltRequest(body=body, query=request.query_string, headers=dict(request.headers))
-            bolt_resp = await asyncio.to_thread(slack_app.dispatch, bolt_req)
+            bolt_req = AsyncBoltRequest(body=body, query=request.query_string, headers=dict(request.headers))
+            bolt_resp = await slack_app.async_dispatch(bolt_req)
             return _bolt_resp_to_aiohttp(bolt_resp)
 
         except Exception:
@@ -14,6 +14,7 @@ logger = logging.getLogger(__name__)
 
 _GEMINI_MODEL_NAME = "gemini-1.5-flash"
 _TEMPERATURE = 0.2
+RECOMMEND_METHODS_FALLBACK = "Unable to recommend methods right now."
 
 _PII_REGEX = re.compile(
     r"(\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)|(\+?\d[\d\s-]{7,}\d)"
@@ -615,7 +616,7 @@ Return a concise explanation of which methods fit, why, and cite the matching ca
             return response.text
         except Exception as exc:  # noqa: BLE001
             logger.error("Failed to recommend methods", exc_info=True)
-            return "Unable to recommend methods right now."
+            return RECOMMEND_METHODS_FALLBACK
 
     def scout_market(self, problem_statement: str, region: str = "Global") -> dict:
         """Generate a competitor scan and market risks for a problem statement.
@@ -2,6 +2,7 @@ import datetime as dt
 import logging
 import os
 import secrets
+import time
 from collections import defaultdict
 from typing import Any, Dict, Optional
 
@@ -16,6 +17,7 @@ from sqlalchemy import (
     String,
     Text,
     create_engine,
+    event,
     func,
     inspect,
     or_,
@@ -32,6 +34,13 @@ from config import Config
 from services.toolkit_service import ToolkitService
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./evidently.db")
+# Listener queries run through run_db on the loop's default executor (Config.WORKER_THREADS
+# threads) and scheduled jobs on APScheduler's threads, so more threads can want a connection
+# than the pool holds; extras wait for a checkout. The default cap (10 + 15) stays within small
+# hosted Postgres plans, since it applies per process; raise DB_POOL_MAX_OVERFLOW where allowed.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_POOL_MAX_OVERFLOW = int(os.getenv("DB_POOL_MAX_OVERFLOW", "15"))
+DB_POOL_RECYCLE_SECONDS = 1800
 
 ASSUMPTION_STATUS_ENUM = Enum(
     "Testing",
@@ -77,19 +86,40 @@ ASSUMPTION_TEST_PHASE_ENUM = Enum(
 def _build_engine() -> Engine:
     url = make_url(DATABASE_URL)
     connect_args = {}
+    pool_args = {}
 
     if url.drivername.startswith("postgresql") or url.drivername == "postgres":
         url = url.set(drivername="postgresql+psycopg2")
         if not url.query.get("sslmode"):
             connect_args["sslmode"] = "require"
+        # Recycle before managed Postgres idle timeouts drop connections.
+        pool_args = {
+            "pool_size": DB_POOL_SIZE,
+            "max_overflow": DB_POOL_MAX_OVERFLOW,
+            "pool_recycle": DB_POOL_RECYCLE_SECONDS,
+        }
 
-    return create_engine(url, connect_args=connect_args, pool_pre_ping=True)
+    return create_engine(url, connect_args=connect_args, pool_pre_ping=True, **pool_args)
 
 
 engine = _build_engine()
 SessionLocal = sessionmaker(bind=engine)
 Base = declarative_base()
 
+# Short-lived cache of serialised active projects per user. Handlers often look the
+# active project up several times per click; any ORM commit clears it, so reads that
+# follow a write in this process are always fresh.
+ACTIVE_PROJECT_CACHE_TTL_SECONDS = 5.0
+_active_project_cache: dict[str, tuple[float, Optional[Dict[str, Any]]]] = {}
+_cache_generation = 0
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _invalidate_read_caches(_session: Session) -> None:
+    global _cache_generation
+    _cache_generation += 1
+    _active_project_cache.clear()
+
 
 class Project(Base):
     __tablename__ = "projects"
@@ -740,29 +770,58 @@ class DbService:
             db.commit()
 
     def get_active_project(self, user_id: str) -> Optional[Dict[str, Any]]:
+        cached = _active_project_cache.get(user_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        generation = _cache_generation
         with SessionLocal() as db:
-            state = db.query(UserState).filter(UserState.user_id == user_id).first()
-            if state and state.current_project_id:
-                project_id = state.current_project_id
-            else:
-                membership = db.query(ProjectMember).filter(ProjectMember.user_id == user_id).first()
-                if not membership or not membership.project:
-                    return None
-                project_id = membership.project_id
-                self._set_active_project(db, user_id, project_id)
+            project = self._load_active_project(db, user_id)
+        self._cache_active_project(user_id, project, generation)
+        return project
+
+    def get_active_project_and_projects(
+        self, user_id: str
+    ) -> tuple[Optional[Dict[str, Any]], list[dict[str, Any]]]:
+        """Return the user's active project and project list using a single session."""
+        cached = _active_project_cache.get(user_id)
+        if cached and cached[0] > time.monotonic():
+            with SessionLocal() as db:
+                return cached[1], self._load_user_projects(db, user_id)
+        generation = _cache_generation
+        with SessionLocal() as db:
+            project = self._load_active_project(db, user_id)
+            projects = self._load_user_projects(db, user_id)
+        self._cache_active_project(user_id, project, generation)
+        return project, projects
 
-            project = (
-                db.query(Project)
-                .options(
-                    joinedload(Project.assumptions),
-                    joinedload(Project.experiments),
-                    joinedload(Project.members),
-                    joinedload(Project.canvas_items),
-                )
-                .filter(Project.id == project_id)
-                .first()
+    def _cache_active_project(self, user_id: str, project: Optional[Dict[str, Any]], generation: int) -> None:
+        # Skip storing if a commit landed while we were reading; the value may predate it.
+        if generation == _cache_generation:
+            _active_project_cache[user_id] = (time.monotonic() + ACTIVE_PROJECT_CACHE_TTL_SECONDS, project)
+
+    def _load_active_project(self, db: Session, user_id: str) -> Optional[Dict[str, Any]]:
+        state = db.query(UserState).filter(UserState.user_id == user_id).first()
+        if state and state.current_project_id:
+            project_id = state.current_project_id
+        else:
+            membership = db.query(ProjectMember).filter(ProjectMember.user_id == user_id).first()
+            if not membership or not membership.project:
+                return None
+            project_id = membership.project_id
+            self._set_active_project(db, user_id, project_id)
+
+        project = (
+            db.query(Project)
+            .options(
+                joinedload(Project.assumptions),
+                joinedload(Project.experiments),
+                joinedload(Project.members),
+                joinedload(Project.canvas_items),
             )
-            return self._serialize_project(project) if project else None
+            .filter(Project.id == project_id)
+            .first()
+        )
+        return self._serialize_project(project) if project else None
 
     def set_active_project(self, user_id: str, project_id: int) -> None:
         with SessionLocal() as db:
@@ -796,28 +855,31 @@ class DbService:
 
     def get_user_projects(self, user_id: str) -> list[dict[str, Any]]:
         with SessionLocal() as db:
-            memberships = (
-                db.query(ProjectMember)
-                .options(joinedload(ProjectMember.project))
-                .filter(ProjectMember.user_id == user_id)
-                .all()
+            return self._load_user_projects(db, user_id)
+
+    def _load_user_projects(self, db: Session, user_id: str) -> list[dict[str, Any]]:
+        memberships = (
+            db.query(ProjectMember)
+            .options(joinedload(ProjectMember.project))
+            .filter(ProjectMember.user_id == user_id)
+            .all()
+        )
+        projects = []
+        for membership in memberships:
+            project = membership.project
+            if not project or project.status != "active":
+                continue
+            projects.append(
+                {
+                    "mission": project.mission,
+                    "stage": project.stage,
+                    "name": project.name,
+                    "id": membership.project_id,
+                    "channel_id": project.channel_id,
+                    "role": membership.role,
+                }
             )
-            projects = []
-            for membership in memberships:
-                project = membership.project
-                if not project or project.status != "active":
-                    continue
-                projects.append(
-                    {
-                        "mission": project.mission,
-                        "stage": project.stage,
-                        "name": project.name,
-                        "id": membership.project_id,
-                        "channel_id": project.channel_id,
-                        "role": membership.role,
-                    }
-                )
-            return projects
+        return projects
 
     def remove_project_member(self, project_id: int, user_id: str) -> None:
         with SessionLocal() as db:
@@ -1220,6 +1282,26 @@ class DbService:
             assumption.last_tested_at = dt.datetime.utcnow()
             db.commit()
 
+    def update_assumption_validation_statuses(self, updates: Dict[int, str]) -> None:
+        """Apply many validation status changes with one UPDATE per distinct status."""
+        if not updates:
+            return
+        by_status: Dict[str, list[int]] = defaultdict(list)
+        for assumption_id, status in updates.items():
+            by_status[status].append(assumption_id)
+        now = dt.datetime.utcnow()
+        with SessionLocal() as db:
+            for status, assumption_ids in by_status.items():
+                db.query(Assumption).filter(Assumption.id.in_(assumption_ids)).update(
+                    {
+                        Assumption.validation_status: status,
+                        Assumption.status: status,
+                        Assumption.last_tested_at: now,
+                    },
+                    synchronize_session=False,
+                )
+            db.commit()
+
     def touch_assumption(self, assumption_id: int) -> None:
         with SessionLocal() as db:
             assumption = db.query(Assumption).filter(Assumption.id == assumption_id).first()
@@ -1477,12 +1559,19 @@ class DbService:
             score.rationale = rationale
             db.commit()
 
-    def get_session_scores(self, session_id: int) -> Dict[int, list[DecisionScore]]:
+    def get_session_scores(self, session_id: int) -> Dict[int, list[tuple]]:
+        """Return (impact, uncertainty, feasibility, confidence) tuples per assumption for a session."""
         with SessionLocal() as db:
-            scores = db.query(DecisionScore).filter(DecisionScore.session_id == session_id).all()
-            results: Dict[int, list[DecisionScore]] = defaultdict(list)
-            for score in scores:
-                results[score.assumption_id].append(score)
+            rows = db.query(
+                DecisionScore.assumption_id,
+                DecisionScore.impact,
+                DecisionScore.uncertainty,
+                DecisionScore.feasibility,
+                DecisionScore.confidence,
+            ).filter(DecisionScore.session_id == session_id)
+            results: Dict[int, list[tuple]] = defaultdict(list)
+            for assumption_id, *score in rows:
+                results[assumption_id].append(tuple(score))
             return dict(results)
 
     def record_decision_vote(
@@ -1,3 +1,4 @@
+import asyncio
 import statistics
 
 from slack_sdk.models.blocks import ActionsBlock, DividerBlock, HeaderBlock, SectionBlock
@@ -13,20 +14,21 @@ class DecisionRoomService:
     def __init__(self, db_service: DbService):
         self.db = db_service
 
-    def start_session(
+    async def start_session(
         self,
         channel_id: str,
         client=None,
         user_id: str | None = None,
     ) -> tuple[bool, str, int | None]:
+        # Runs inside an async listener, so the queries go to a worker thread.
         if user_id:
-            project = self.db.get_active_project(user_id)
+            project = await asyncio.to_thread(self.db.get_active_project, user_id)
         else:
-            project = self.db.get_project_by_channel(channel_id)
+            project = await asyncio.to_thread(self.db.get_project_by_channel, channel_id)
         if not project:
             return False, "You need to select a project in the Home Tab first.", None
 
-        session_id = self.db.create_decision_session(project["id"], channel_id)
+        session_id = await asyncio.to_thread(self.db.create_decision_session, project["id"], channel_id)
 
         assumptions = [
             assumption
@@ -80,7 +82,7 @@ class DecisionRoomService:
         )
 
         if client:
-            client.chat_postMessage(channel=channel_id, blocks=blocks, text="Decision Room Opened")
+            await client.chat_postMessage(channel=channel_id, blocks=blocks, text="Decision Room Opened")
         return True, "Session Started", session_id
 
     def record_vote(
@@ -137,10 +139,11 @@ class DecisionRoomService:
         results: dict[int, dict[str, float | int | bool]] = {}
 
         for assumption_id, score_list in scores.items():
-            impacts = [s.impact for s in score_list if s.impact is not None]
-            uncertainties = [s.uncertainty for s in score_list if s.uncertainty is not None]
-            feasibilities = [s.feasibility for s in score_list if s.feasibility is not None]
-            confidences = [s.confidence for s in score_list if s.confidence is not None]
+            impact_col, uncertainty_col, feasibility_col, confidence_col = zip(*score_list)
+            impacts = [value for value in impact_col if value is not None]
+            uncertainties = [value for value in uncertainty_col if value is not None]
+            feasibilities = [value for value in feasibility_col if value is not None]
+            confidences = [value for value in confidence_col if value is not None]
 
             impact_std = statistics.stdev(impacts) if len(impacts) > 1 else 0
             uncertainty_std = statistics.stdev(uncertainties) if len(uncertainties) > 1 else 0
@@ -1,6 +1,7 @@
 import logging
 import os
 import re
+from functools import lru_cache
 
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -9,6 +10,27 @@ from services.google_auth_service import get_google_credentials
 
 logger = logging.getLogger(__name__)
 
+_FOLDER_ID_PATTERN = re.compile(r"folders/([a-zA-Z0-9-_]+)")
+_FILE_ID_PATTERN = re.compile(r"/d/([a-zA-Z0-9-_]+)")
+_BARE_ID_PATTERN = re.compile(r"[a-zA-Z0-9-_]+")
+
+
+@lru_cache(maxsize=1024)
+def _parse_drive_url(url: str) -> tuple[str | None, str | None]:
+    folder_match = _FOLDER_ID_PATTERN.search(url)
+    if folder_match:
+        return folder_match.group(1), "drive_folder"
+
+    file_match = _FILE_ID_PATTERN.search(url)
+    if file_match:
+        return file_match.group(1), "drive_file"
+
+    cleaned = url.strip()
+    if _BARE_ID_PATTERN.fullmatch(cleaned):
+        return cleaned, "drive_file"
+
+    return None, None
+
 
 class DriveService:
     SCOPES = [
@@ -95,17 +117,4 @@ class DriveService:
     def extract_id_from_url(self, url: str) -> tuple[str | None, str | None]:
         if not url:
             return None, None
-
-        folder_match = re.search(r"folders/([a-zA-Z0-9-_]+)", url)
-        if folder_match:
-            return folder_match.group(1), "drive_folder"
-
-        file_match = re.search(r"/d/([a-zA-Z0-9-_]+)", url)
-        if file_match:
-            return file_match.group(1), "drive_file"
-
-        cleaned = url.strip()
-        if re.fullmatch(r"[a-zA-Z0-9-_]+", cleaned):
-            return cleaned, "drive_file"
-
-        return None, None
+        return _parse_drive_url(url)
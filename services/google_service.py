@@ -1,6 +1,7 @@
 import datetime as dt
 import logging
 import os
+import threading
 from typing import Any
 from urllib.parse import urlencode
 
@@ -20,6 +21,16 @@ class GoogleService:
         self.client_id = Config.GOOGLE_CLIENT_ID
         self.client_secret = Config.GOOGLE_CLIENT_SECRET
         self.redirect_uri = Config.GOOGLE_REDIRECT_URI
+        # requests.Session isn't thread-safe and these calls run on worker threads (the gapi
+        # executor and asyncio.to_thread), so each thread keeps its own session alive.
+        self._local = threading.local()
+
+    @property
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
 
     def get_auth_url(self, state: str) -> str:
         if not self.client_id or not self.redirect_uri:
@@ -45,7 +56,7 @@ class GoogleService:
             "redirect_uri": self.redirect_uri,
             "grant_type": "authorization_code",
         }
-        response = requests.post(self._TOKEN_URL, data=payload, timeout=20)
+        response = self._session.post(self._TOKEN_URL, data=payload, timeout=20)
         response.raise_for_status()
         return response.json()
 
@@ -59,7 +70,7 @@ class GoogleService:
             "redirect_uri": self.redirect_uri,
             "grant_type": "authorization_code",
         }
-        response = requests.post(self._TOKEN_URL, data=payload, timeout=20)
+        response = self._session.post(self._TOKEN_URL, data=payload, timeout=20)
         response.raise_for_status()
         return response.json()
 
@@ -72,7 +83,7 @@ class GoogleService:
             "refresh_token": refresh_token,
             "grant_type": "refresh_token",
         }
-        response = requests.post(self._TOKEN_URL, data=payload, timeout=20)
+        response = self._session.post(self._TOKEN_URL, data=payload, timeout=20)
         response.raise_for_status()
         return response.json()
 
@@ -106,12 +117,12 @@ class GoogleService:
     def _get_file_metadata(self, file_id: str, access_token: str) -> dict[str, Any]:
         url = f"{self._DRIVE_FILES_URL}/{file_id}"
         params = {"fields": "id,name,mimeType"}
-        response = requests.get(url, headers=self._auth_headers(access_token), params=params, timeout=20)
+        response = self._session.get(url, headers=self._auth_headers(access_token), params=params, timeout=20)
         response.raise_for_status()
         return response.json()
 
     def _download_content(self, url: str, access_token: str, params: dict[str, Any]) -> str:
-        response = requests.get(url, headers=self._auth_headers(access_token), params=params, timeout=20)
+        response = self._session.get(url, headers=self._auth_headers(access_token), params=params, timeout=20)
         response.raise_for_status()
         content_type = response.headers.get("Content-Type", "")
         if "application/pdf" in content_type:
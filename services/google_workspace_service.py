@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import base64
 import logging
+import threading
 import uuid
 from typing import Iterable, List
 
@@ -21,12 +22,40 @@ class GoogleWorkspaceService:
     SLIDES_SCOPE = "https://www.googleapis.com/auth/presentations"
     GMAIL_SCOPE = "https://www.googleapis.com/auth/gmail.send"
 
+    API_VERSIONS = {"docs": "v1", "sheets": "v4", "slides": "v1", "gmail": "v1"}
+
     def __init__(self):
         self.creds = self._get_credentials()
-        self.docs_service = build("docs", "v1", credentials=self.creds)
-        self.sheets_service = build("sheets", "v4", credentials=self.creds)
-        self.slides_service = build("slides", "v1", credentials=self.creds)
-        self.gmail_service = build("gmail", "v1", credentials=self.creds)
+        # httplib2 transports aren't thread-safe, so each Google executor thread gets its own
+        # service objects and keeps reusing their connections across calls.
+        self._local = threading.local()
+
+    def _service(self, api: str):
+        services = getattr(self._local, "services", None)
+        if services is None:
+            services = self._local.services = {}
+        service = services.get(api)
+        if service is None:
+            service = services[api] = build(
+                api, self.API_VERSIONS[api], credentials=self.creds, cache_discovery=False
+            )
+        return service
+
+    @property
+    def docs_service(self):
+        return self._service("docs")
+
+    @property
+    def sheets_service(self):
+        return self._service("sheets")
+
+    @property
+    def slides_service(self):
+        return self._service("slides")
+
+    @property
+    def gmail_service(self):
+        return self._service("gmail")
 
     @staticmethod
     def _get_credentials():
@@ -0,0 +1,31 @@
+import aiohttp
+import orjson
+
+_session: aiohttp.ClientSession | None = None
+
+
+def _orjson_dumps(obj: object) -> str:
+    return orjson.dumps(obj).decode("utf-8")
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Return the process-wide aiohttp session, creating it on first use.
+
+    Must be called from a running event loop. Sharing one session keeps
+    keep-alive connections to Slack open across requests instead of paying a
+    fresh TCP/TLS handshake per API call.
+    """
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=60)
+        # Slack API bodies (blocks, views) are sent via json=; orjson serialises them far faster.
+        _session = aiohttp.ClientSession(connector=connector, json_serialize=_orjson_dumps)
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session if it was ever opened."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -24,7 +24,14 @@ class IngestionError(Exception):
 class IngestionService:
     def __init__(self, db_service: DbService | None = None, drive_service: DriveService | None = None) -> None:
         self.db_service = db_service
-        self.drive_service = drive_service or DriveService()
+        self._drive_service = drive_service
+
+    @property
+    def drive_service(self) -> DriveService:
+        # Built on first Drive ingest so startup doesn't pay for Google client discovery.
+        if self._drive_service is None:
+            self._drive_service = DriveService()
+        return self._drive_service
 
     def extract_text(self, file_content: bytes, file_type: str) -> str | None:
         """Extract text from a supported file type.
@@ -1,3 +1,5 @@
+import threading
+
 import asana
 from googleapiclient.discovery import build
 
@@ -7,15 +9,28 @@ from services.google_auth_service import get_google_credentials
 
 class IntegrationService:
     def __init__(self) -> None:
-        self.drive_service = None
+        self._drive_creds = None
         if Config.GOOGLE_SERVICE_ACCOUNT_JSON:
-            creds = get_google_credentials(["https://www.googleapis.com/auth/drive"])
-            self.drive_service = build("drive", "v3", credentials=creds)
+            self._drive_creds = get_google_credentials(["https://www.googleapis.com/auth/drive"])
+        # Drive calls run on the shared Google executor and httplib2 isn't thread-safe,
+        # so each worker thread builds and reuses its own client.
+        self._local = threading.local()
 
         self.asana_client = None
         if Config.ASANA_TOKEN:
             self.asana_client = asana.Client.access_token(Config.ASANA_TOKEN)
 
+    @property
+    def drive_service(self):
+        if self._drive_creds is None:
+            return None
+        service = getattr(self._local, "drive_service", None)
+        if service is None:
+            service = self._local.drive_service = build(
+                "drive", "v3", credentials=self._drive_creds, cache_discovery=False
+            )
+        return service
+
     def _refresh_asana_token(self) -> bool:
         """Mock refresh logic for expired Asana tokens."""
         return True
@@ -39,7 +54,7 @@ class IntegrationService:
         Returns:
             A dictionary with folder id/link or an error message.
         """
-        if not self.drive_service:
+        if self._drive_creds is None:
             return {"error": "Google Drive is not configured."}
         metadata = {
             "name": folder_name,
@@ -63,8 +63,16 @@ class PlaybookService:
     Maps assumptions to methods and provides educational content.
     """
 
+    TIPS = (
+        "Fall in love with the problem, not the solution.",
+        "Evidence beats opinion. Data beats arguments.",
+        "Test your riskiest assumption first.",
+        "Fail fast, learn faster.",
+    )
+
     def __init__(self):
         self.methods = self._load_methods()
+        self._recommendations_by_category: dict[str, list[dict]] = {}
         self.ocp_questions = {
             "Opportunity": {
                 "Needs": "Who is the end user? What pain points does this solve?",
@@ -130,6 +138,7 @@ class PlaybookService:
                 "activities": ["Codify knowledge", "Integrate into BAU", "Expand to new markets"],
             },
         ]
+        self._phases_by_key = {phase["key"]: phase for phase in self.test_and_learn_phases}
 
     def _load_methods(self) -> dict:
         methods_path = Path(__file__).with_name("playbook_methods.json")
@@ -137,23 +146,22 @@ class PlaybookService:
             return json.load(handle)
 
     def get_recommendations(self, category: str):
-        return [
-            {**method_data, "id": method_id}
-            for method_id, method_data in self.methods.items()
-            if category in method_data["best_for"]
-        ]
+        """Methods suited to a category. Memoized; callers must not mutate the result."""
+        recommendations = self._recommendations_by_category.get(category)
+        if recommendations is None:
+            recommendations = [
+                {**method_data, "id": method_id}
+                for method_id, method_data in self.methods.items()
+                if category in method_data["best_for"]
+            ]
+            self._recommendations_by_category[category] = recommendations
+        return recommendations
 
     def get_method_details(self, method_id: str):
         return self.methods.get(method_id)
 
     def get_random_tip(self):
-        tips = [
-            "Fall in love with the problem, not the solution.",
-            "Evidence beats opinion. Data beats arguments.",
-            "Test your riskiest assumption first.",
-            "Fail fast, learn faster.",
-        ]
-        return random.choice(tips)
+        return random.choice(self.TIPS)
 
     def get_ocp_questions(self) -> dict[str, dict[str, str]]:
         return self.ocp_questions
@@ -169,7 +177,4 @@ class PlaybookService:
 
     def get_phase_details(self, phase_key: str) -> dict[str, object]:
         normalized_key = (phase_key or "").strip().lower()
-        for phase in self.test_and_learn_phases:
-            if phase["key"] == normalized_key:
-                return phase
-        return self.test_and_learn_phases[0]
+        return self._phases_by_key.get(normalized_key, self.test_and_learn_phases[0])
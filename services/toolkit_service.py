@@ -28,30 +28,32 @@ class ToolkitService:
         },
     }
 
+    QUESTION_BANKS = {
+        DEFAULT_METHOD_NAME: [
+            "Tell me about the last time you encountered [Problem]?",
+            "What was the hardest part about that experience?",
+            "How do you currently solve this problem?",
+            "What solutions have you tried that failed?",
+        ],
+        "Fake Door": [
+            "What would you expect to happen after clicking this button?",
+            "How much would you expect to pay for this service?",
+            "On a scale of 1-10, how disappointed would you be if this didn't exist?",
+        ],
+        "Concept Testing": [
+            "Who do you think this product is for?",
+            "What is the most unclear part of this concept?",
+            "Does this remind you of anything else you use?",
+        ],
+    }
+
     def get_stage_info(self, stage: str) -> dict:
         return self.STAGES.get(stage.upper(), self.STAGES["DEFINE"])
 
     def get_question_bank(self, method_name: str) -> list[str]:
         """Returns a list of interview questions based on the method."""
-        banks = {
-            self.DEFAULT_METHOD_NAME: [
-                "Tell me about the last time you encountered [Problem]?",
-                "What was the hardest part about that experience?",
-                "How do you currently solve this problem?",
-                "What solutions have you tried that failed?",
-            ],
-            "Fake Door": [
-                "What would you expect to happen after clicking this button?",
-                "How much would you expect to pay for this service?",
-                "On a scale of 1-10, how disappointed would you be if this didn't exist?",
-            ],
-            "Concept Testing": [
-                "Who do you think this product is for?",
-                "What is the most unclear part of this concept?",
-                "Does this remind you of anything else you use?",
-            ],
-        }
-        for key in banks:
-            if key.lower() in method_name.lower():
-                return banks[key]
-        return banks[self.DEFAULT_METHOD_NAME]
+        method_name = method_name.lower()
+        for key, questions in self.QUESTION_BANKS.items():
+            if key.lower() in method_name:
+                return questions
+        return self.QUESTION_BANKS[self.DEFAULT_METHOD_NAME]
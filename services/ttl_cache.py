@@ -0,0 +1,99 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+def content_key(*parts: object) -> str:
+    """Build a short, stable cache key from the repr of the given parts."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class InFlightCalls:
+    """Share one blocking worker-thread call between concurrent callers with the same key.
+
+    Nothing is kept once the call finishes, so the next request after that runs ``fn`` again.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+
+    async def call(
+        self,
+        key: Hashable,
+        fn: Callable[[], Any],
+        on_result: Callable[[Any], None] | None = None,
+    ) -> Any:
+        """Await the running call for ``key``, starting ``fn`` if there is none.
+
+        ``on_result`` runs once per underlying call, when it succeeds.
+        """
+        pending = self._in_flight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(asyncio.to_thread(fn))
+            self._in_flight[key] = pending
+
+            def finish(future: asyncio.Future) -> None:
+                self._in_flight.pop(key, None)
+                if on_result is not None and not future.cancelled() and future.exception() is None:
+                    on_result(future.result())
+
+            pending.add_done_callback(finish)
+        # Shield so one caller being cancelled doesn't cancel the call for the others.
+        return await asyncio.shield(pending)
+
+
+class TTLCache:
+    """In-process LRU cache with a per-entry TTL, for expensive AI calls and rendered views."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._calls = InFlightCalls()
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        fn: Callable[[], Any],
+        should_cache: Callable[[Any], bool] = lambda _value: True,
+    ) -> Any:
+        """Return the cached value for ``key`` or run the blocking ``fn`` in a worker thread.
+
+        Concurrent callers for the same key share one in-flight call. Results rejected by
+        ``should_cache`` (e.g. error payloads) are returned but not stored.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        def store(value: Any) -> None:
+            if should_cache(value):
+                self.set(key, value)
+
+        return await self._calls.call(key, fn, on_result=store)
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from services.db_service import DbService
+
+logger = logging.getLogger(__name__)
+
+
+class AssumptionStatusBuffer:
+    """Coalesce assumption validation status writes into short batched flushes.
+
+    Only use this where nothing reads the status back straight after the click;
+    writes land up to ``delay`` seconds later. A failed batch is re-queued and
+    retried with exponential backoff; after ``max_retries`` failures it is dropped
+    and ``on_give_up`` is told which users' changes were lost.
+    """
+
+    def __init__(
+        self,
+        db_service: DbService,
+        delay: float = 0.1,
+        retry_delay: float = 1.0,
+        max_retries: int = 5,
+        on_give_up: Callable[[dict[str, list[int]]], Awaitable[None]] | None = None,
+    ) -> None:
+        self.db_service = db_service
+        self.delay = delay
+        self.retry_delay = retry_delay
+        self.max_retries = max_retries
+        self.on_give_up = on_give_up
+        self._pending: dict[int, str] = {}
+        self._requested_by: dict[int, str] = {}
+        self._failures = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task] = set()
+        self._write_lock = asyncio.Lock()
+
+    def enqueue(self, assumption_id: int, status: str, user_id: str | None = None) -> None:
+        """Queue a status change; the last status queued for an assumption wins."""
+        self._pending[assumption_id] = status
+        if user_id:
+            self._requested_by[assumption_id] = user_id
+        else:
+            self._requested_by.pop(assumption_id, None)
+        if self._flush_handle is None:
+            self._schedule_flush(self.delay)
+
+    def _schedule_flush(self, delay: float) -> None:
+        self._flush_handle = asyncio.get_running_loop().call_later(delay, self._start_flush)
+
+    def _start_flush(self) -> None:
+        self._flush_handle = None
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self) -> bool:
+        """Write everything pending now; returns False if the batch failed and was re-queued or dropped."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        # One batch at a time, so an older batch can never land after a newer one.
+        async with self._write_lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return True
+            requested_by = {
+                assumption_id: self._requested_by.pop(assumption_id)
+                for assumption_id in pending
+                if assumption_id in self._requested_by
+            }
+            try:
+                await asyncio.to_thread(self.db_service.update_assumption_validation_statuses, pending)
+            except Exception:  # noqa: BLE001
+                self._failures += 1
+                logger.exception(
+                    "Failed to flush %d assumption status updates (attempt %d)", len(pending), self._failures
+                )
+                if self._failures > self.max_retries:
+                    self._failures = 0
+                    await self._give_up(pending, requested_by)
+                    return False
+                # Statuses queued while this batch was in flight are newer, so they win.
+                for assumption_id, status in pending.items():
+                    if assumption_id not in self._pending:
+                        self._pending[assumption_id] = status
+                        if assumption_id in requested_by:
+                            self._requested_by[assumption_id] = requested_by[assumption_id]
+                if self._flush_handle is None:
+                    self._schedule_flush(self.retry_delay * 2 ** (self._failures - 1))
+                return False
+            self._failures = 0
+            return True
+
+    async def _give_up(self, pending: dict[int, str], requested_by: dict[int, str]) -> None:
+        logger.error("Dropping assumption status updates after repeated failures: %s", pending)
+        failed_by_user: dict[str, list[int]] = {}
+        for assumption_id, user_id in requested_by.items():
+            failed_by_user.setdefault(user_id, []).append(assumption_id)
+        if failed_by_user and self.on_give_up is not None:
+            try:
+                await self.on_give_up(failed_by_user)
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to report dropped assumption status updates")
+
+    async def close(self) -> None:
+        """Make a final flush attempt on shutdown and stop any scheduled retry."""
+        await self.flush()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._pending:
+            logger.error("Shutting down with unsaved assumption status updates: %s", self._pending)
@@ -0,0 +1,38 @@
+import importlib
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+
+class TestDecisionService(unittest.TestCase):
+    def test_reveal_scores_aggregates_per_assumption(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "evidently_test.db"
+            os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+
+            from services import db_service
+            from services.decision_service import DecisionRoomService
+
+            importlib.reload(db_service)
+
+            service = db_service.DbService()
+            project = service.create_project(user_id="U1", name="Votes", description="Test", stage="Define")
+            session_id = service.create_decision_session(project.id, "C1")
+            service.record_decision_score(session_id, 1, "U1", impact=5, uncertainty=1, feasibility=3, confidence=4)
+            service.record_decision_score(session_id, 1, "U2", impact=1, uncertainty=1, feasibility=3, confidence=2)
+            service.record_decision_score(session_id, 2, "U1", impact=3, uncertainty=4, feasibility=2, confidence=3)
+
+            results = DecisionRoomService(service).reveal_scores(session_id)
+
+            self.assertEqual(results[1]["count"], 2)
+            self.assertEqual(results[1]["avg_impact"], 3)
+            self.assertEqual(results[1]["avg_confidence"], 3)
+            self.assertTrue(results[1]["disagreement"])
+            self.assertEqual(results[2]["count"], 1)
+            self.assertEqual(results[2]["avg_uncertainty"], 4)
+            self.assertFalse(results[2]["disagreement"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,16 @@
+import pytest
+
+from services.http_session import close_session, get_session
+
+
+@pytest.mark.asyncio
+async def test_get_session_reuses_open_session_until_closed():
+    session = get_session()
+    assert get_session() is session
+
+    await close_session()
+    assert session.closed
+
+    replacement = get_session()
+    assert replacement is not session
+    await close_session()
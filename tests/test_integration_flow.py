@@ -24,6 +24,10 @@ class TestIntegrationFlow(unittest.TestCase):
             self.assertGreaterEqual(len(project_data["assumptions"]), 1)
             self.assertGreaterEqual(len(project_data["experiments"]), 1)
 
+            combined_active, combined_projects = service.get_active_project_and_projects(user_id)
+            self.assertEqual(combined_active, project_data)
+            self.assertEqual(combined_projects, service.get_user_projects(user_id))
+
             assumption = service.create_assumption(
                 project_id=project.id,
                 data={"title": "We can recruit participants via local partners."},
@@ -45,6 +49,25 @@ class TestIntegrationFlow(unittest.TestCase):
             self.assertIsNotNone(updated_experiment)
             self.assertEqual(updated_experiment["status"], "Completed")
 
+    def test_active_project_cache_is_cleared_by_writes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "evidently_test.db"
+            os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+
+            from services import db_service
+
+            importlib.reload(db_service)
+
+            service = db_service.DbService()
+            user_id = "U456"
+            project = service.create_project(user_id=user_id, name="Cached", description="Test", stage="Define")
+            before = service.get_active_project(user_id)
+            self.assertIs(service.get_active_project(user_id), before)
+
+            service.create_assumption(project_id=project.id, data={"title": "Fresh assumption"})
+            after = service.get_active_project(user_id)
+            self.assertEqual(len(after["assumptions"]), len(before["assumptions"]) + 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+import pytest
+
+from services.ttl_cache import InFlightCalls, TTLCache, content_key
+
+
+def test_content_key_is_stable_and_distinguishes_inputs():
+    assert content_key("thread", None) == content_key("thread", None)
+    assert content_key("thread", None) != content_key("thread", [{"name": "a.pdf"}])
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_reuses_cached_value_and_skips_rejected():
+    cache = TTLCache(maxsize=2, ttl=60)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"summary": "ok"}
+
+    assert await cache.get_or_compute("k", compute) == {"summary": "ok"}
+    assert await cache.get_or_compute("k", compute) == {"summary": "ok"}
+    assert len(calls) == 1
+
+    error_calls = []
+
+    def failing():
+        error_calls.append(1)
+        return {"error": "offline"}
+
+    reject_errors = lambda result: not result.get("error")  # noqa: E731
+    await cache.get_or_compute("e", failing, should_cache=reject_errors)
+    await cache.get_or_compute("e", failing, should_cache=reject_errors)
+    assert len(error_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_collapses_concurrent_calls():
+    cache = TTLCache(maxsize=2, ttl=60)
+    calls = []
+
+    def slow_compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"summary": "ok"}
+
+    results = await asyncio.gather(*(cache.get_or_compute("k", slow_compute) for _ in range(3)))
+    assert results == [{"summary": "ok"}] * 3
+    assert len(calls) == 1
+    assert cache.get("k") == {"summary": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_in_flight_calls_share_running_call_but_not_finished_results():
+    calls = InFlightCalls()
+    runs = []
+
+    def slow_compute():
+        runs.append(1)
+        time.sleep(0.05)
+        return len(runs)
+
+    assert await asyncio.gather(*(calls.call("k", slow_compute) for _ in range(3))) == [1, 1, 1]
+    assert await calls.call("k", slow_compute) == 2
+    assert len(runs) == 2
+
+
+def test_set_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_pop_removes_entry_and_ignores_missing_keys():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.pop("a")
+    cache.pop("missing")
+    assert cache.get("a") is None
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from services.write_buffer import AssumptionStatusBuffer
+
+
+class RecordingDbService:
+    def __init__(self, failures=0):
+        self.batches = []
+        self.failures = failures
+
+    def update_assumption_validation_statuses(self, updates):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("database unavailable")
+        self.batches.append(dict(updates))
+
+
+@pytest.mark.asyncio
+async def test_enqueue_coalesces_writes_into_one_flush():
+    db = RecordingDbService()
+    buffer = AssumptionStatusBuffer(db, delay=0.01)
+
+    buffer.enqueue(1, "Validated")
+    buffer.enqueue(2, "Rejected")
+    buffer.enqueue(1, "Rejected")
+    await asyncio.sleep(0.05)
+
+    assert db.batches == [{1: "Rejected", 2: "Rejected"}]
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_pending_immediately_and_cancels_timer():
+    db = RecordingDbService()
+    buffer = AssumptionStatusBuffer(db, delay=10)
+
+    buffer.enqueue(3, "Validated")
+    await buffer.flush()
+    await buffer.flush()
+
+    assert db.batches == [{3: "Validated"}]
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_is_requeued_and_retried():
+    db = RecordingDbService(failures=1)
+    buffer = AssumptionStatusBuffer(db, delay=0.01, retry_delay=0.01)
+
+    buffer.enqueue(4, "Validated", "U1")
+    await asyncio.sleep(0.01)
+    buffer.enqueue(5, "Rejected", "U2")
+    await asyncio.sleep(0.1)
+
+    assert db.batches == [{4: "Validated", 5: "Rejected"}]
+
+
+@pytest.mark.asyncio
+async def test_newer_status_wins_over_requeued_batch():
+    db = RecordingDbService(failures=1)
+    buffer = AssumptionStatusBuffer(db, delay=10, retry_delay=10)
+
+    buffer.enqueue(6, "Validated")
+    assert await buffer.flush() is False
+    buffer.enqueue(6, "Rejected")
+    assert await buffer.flush() is True
+
+    assert db.batches == [{6: "Rejected"}]
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries_and_reports_users():
+    db = RecordingDbService(failures=10)
+    reported = []
+
+    async def on_give_up(failed_by_user):
+        reported.append(failed_by_user)
+
+    buffer = AssumptionStatusBuffer(db, delay=0.01, retry_delay=0.01, max_retries=1, on_give_up=on_give_up)
+    buffer.enqueue(7, "Validated", "U1")
+    buffer.enqueue(8, "Rejected", "U1")
+    await asyncio.sleep(0.1)
+
+    assert db.batches == []
+    assert reported == [{"U1": [7, 8]}]
+    assert await buffer.flush() is True